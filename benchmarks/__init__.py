@@ -0,0 +1 @@
+"""Benchmarks for the play-new-games pipeline."""
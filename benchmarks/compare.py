@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Compare two benchmark result files
+Flags stages whose throughput, p95 latency, or peak memory regressed beyond
+a threshold. Exits non-zero when any regression is found.
+"""
+import sys
+import json
+import argparse
+from typing import List, Dict, Any, Tuple
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """Load a result file written by run_benchmarks.py"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _ratio(base: float, head: float) -> float:
+    return (head - base) / base if base else 0.0
+
+
+def compare_results(
+    base: Dict[str, Any],
+    head: Dict[str, Any],
+    threshold: float,
+    memory_threshold: float
+) -> List[Dict[str, Any]]:
+    """
+    Join two result sets on (stage, size) and compute relative changes.
+
+    Positive `ops_change` is faster; positive `p95_change`/`mem_change` is worse.
+    """
+    base_index: Dict[Tuple[str, int], Dict[str, Any]] = {
+        (r['stage'], r['size']): r for r in base['results']
+    }
+
+    rows = []
+    for result in head['results']:
+        key = (result['stage'], result['size'])
+        previous = base_index.get(key)
+        if not previous:
+            continue
+
+        ops_change = _ratio(previous['ops_per_sec'] or 0, result['ops_per_sec'] or 0)
+        p95_change = _ratio(previous['p95_ms'], result['p95_ms'])
+        mem_change = _ratio(previous['peak_mem_bytes'], result['peak_mem_bytes'])
+
+        reasons = []
+        if ops_change < -threshold:
+            reasons.append('throughput')
+        if p95_change > threshold:
+            reasons.append('p95')
+        if mem_change > memory_threshold:
+            reasons.append('memory')
+
+        rows.append({
+            'stage': result['stage'],
+            'size': result['size'],
+            'ops_change': round(ops_change, 4),
+            'p95_change': round(p95_change, 4),
+            'mem_change': round(mem_change, 4),
+            'regressions': reasons,
+        })
+
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare two benchmark result files')
+    parser.add_argument('base', help='Baseline result JSON (e.g. benchmarks/results/<old>.json)')
+    parser.add_argument('head', help='Candidate result JSON (e.g. benchmarks/results/<new>.json)')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.10,
+        help='Allowed relative slowdown for ops/sec and p95 (default: 0.10 = 10%%)'
+    )
+    parser.add_argument(
+        '--memory-threshold',
+        type=float,
+        default=0.20,
+        help='Allowed relative growth of peak memory (default: 0.20 = 20%%)'
+    )
+    args = parser.parse_args()
+
+    base = load_results(args.base)
+    head = load_results(args.head)
+    rows = compare_results(base, head, args.threshold, args.memory_threshold)
+
+    print(f"{base.get('commit')} -> {head.get('commit')}")
+    print(f"{'stage':<18} {'size':>8} {'ops/s':>9} {'p95':>9} {'memory':>9}")
+    for row in rows:
+        flag = f"  ✗ {', '.join(row['regressions'])}" if row['regressions'] else ''
+        print(
+            f"{row['stage']:<18} {row['size']:>8} {row['ops_change']:>+9.1%} "
+            f"{row['p95_change']:>+9.1%} {row['mem_change']:>+9.1%}{flag}"
+        )
+
+    regressions = [r for r in rows if r['regressions']]
+    print(json.dumps({'compared': len(rows), 'regressions': len(regressions)}))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
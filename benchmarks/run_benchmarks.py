@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Pipeline benchmark suite
+Measures ops/sec, p50/p95 latency, and peak memory per stage on synthetic
+catalogs of increasing size, and stores the results as JSON.
+"""
+import io
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+import tempfile
+import subprocess
+import tracemalloc
+import contextlib
+from pathlib import Path
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Callable, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.synthetic import generate_raw_games
+from skills.ingest_play.normalize import (
+    normalize_game_data,
+    deduplicate_games,
+    filter_games_only
+)
+from skills.ranker.scorer import score_games, rank_games
+from skills.publish_html.handler import generate_html, iter_html, compute_report_stats
+from skills.publish_html.templates import load_templates
+from modules.code_changelog_tracker import CodeChangeLogger
+
+DEFAULT_SIZES = [1000, 10000]
+# Opt-in with --large: the score stage is O(n^2) (calculate_popularity scans
+# every install count per game), so 100k takes minutes per repeat
+LARGE_SIZES = [100000]
+DEFAULT_STAGES = ['normalize', 'dedup_filter', 'score', 'top_k', 'html', 'html_stream', 'html_batch', 'changelog_rebuild']
+
+# Top-K used by the top_k stage (the html stage renders every ranked game)
+TOP_K = 50
+
+# html_batch: one top-BATCH_TOP_K report per query/country, like a nightly run
+BATCH_QUERIES = ['new games', 'rpg', 'puzzle', 'strategy', 'casual', 'action']
+BATCH_COUNTRIES = ['KR', 'US', 'JP', 'DE']
+BATCH_TOP_K = 100
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def _normalize_all(raw: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [normalize_game_data(item) for item in raw]
+
+
+def _build_reviews_dir(root: Path, count: int) -> Path:
+    """Create `count` review docs with distinct timestamps"""
+    reviews_dir = root / 'reviews'
+    reviews_dir.mkdir()
+    start = datetime(2025, 1, 1)
+    for i in range(count):
+        stamp = (start + timedelta(seconds=i)).strftime("%Y%m%d_%H%M%S")
+        (reviews_dir / f"{stamp}.md").write_text(f"# Review {i}\n", encoding='utf-8')
+    return reviews_dir
+
+
+def prepare_stages(size: int, seed: int, workdir: Path) -> Dict[str, Tuple[Callable[[], Any], int]]:
+    """
+    Build the input for each stage once, so only the stage itself is timed.
+
+    Returns:
+        {stage_name: (callable, items_processed)}
+    """
+    raw = list(generate_raw_games(size, seed))
+    normalized = _normalize_all(raw)
+    unique = deduplicate_games(filter_games_only(normalized))
+    scored = score_games(unique)
+    ranked = rank_games(list(scored), len(scored))
+
+    # Review history grows much slower than the catalog
+    review_count = max(10, size // 100)
+    reviews_dir = _build_reviews_dir(workdir, review_count)
+    with contextlib.redirect_stdout(io.StringIO()):
+        changelog = CodeChangeLogger("Benchmark", reviews_dir=str(reviews_dir))
+
+    def html_stream():
+        with open(workdir / 'game_ranking.html', 'w', encoding='utf-8') as f:
+            for chunk in iter_html(ranked, 'benchmark', 'KR'):
+                f.write(chunk)
+
+    # Reports differ only in query/country; ops/sec of this stage is renders per second
+    batch_games = ranked[:BATCH_TOP_K]
+    batch_stats = compute_report_stats(batch_games)
+    batch = [(query, country) for query in BATCH_QUERIES for country in BATCH_COUNTRIES]
+    templates = load_templates()
+
+    def html_batch():
+        for query, country in batch:
+            with open(workdir / 'batch_report.html', 'w', encoding='utf-8') as f:
+                for chunk in iter_html(batch_games, query, country, batch_stats, templates=templates):
+                    f.write(chunk)
+
+    def changelog_rebuild():
+        with contextlib.redirect_stdout(io.StringIO()):
+            changelog.build(full=True)
+
+    return {
+        'normalize': (lambda: _normalize_all(raw), len(raw)),
+        'dedup_filter': (lambda: deduplicate_games(filter_games_only(normalized)), len(normalized)),
+        'score': (lambda: score_games(unique), len(unique)),
+        'top_k': (lambda: rank_games(scored, TOP_K), len(scored)),
+        'html': (lambda: generate_html(ranked, 'benchmark', 'KR'), len(ranked)),
+        'html_stream': (html_stream, len(ranked)),
+        'html_batch': (html_batch, len(batch)),
+        'changelog_rebuild': (changelog_rebuild, review_count),
+    }
+
+
+def measure(func: Callable[[], Any], items: int, repeat: int) -> Dict[str, Any]:
+    """Time `repeat` runs, then one traced run for peak memory"""
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    p50 = percentile(latencies, 50)
+    return {
+        'items': items,
+        'repeat': repeat,
+        'ops_per_sec': round(items / p50, 2) if p50 > 0 else None,
+        'p50_ms': round(p50 * 1000, 3),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 3),
+        'peak_mem_bytes': peak,
+    }
+
+
+def git_commit() -> str:
+    """Current commit hash (or 'unknown' outside a git checkout)"""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout.strip()
+    except Exception:
+        return 'unknown'
+
+
+def run_benchmarks(sizes: List[int], stages: List[str], repeat: int, seed: int) -> Dict[str, Any]:
+    """Run every selected stage at every size"""
+    results = []
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            prepared = prepare_stages(size, seed, Path(tmp))
+            for stage in stages:
+                func, items = prepared[stage]
+                stats = measure(func, items, repeat)
+                results.append({'stage': stage, 'size': size, **stats})
+                print(
+                    f"{stage:<18} n={size:<8} {stats['ops_per_sec'] or 0:>12,.0f} ops/s  "
+                    f"p50={stats['p50_ms']:>10.2f}ms  p95={stats['p95_ms']:>10.2f}ms  "
+                    f"peak={stats['peak_mem_bytes'] / 1024 / 1024:>8.1f}MB",
+                    file=sys.stderr
+                )
+
+    return {
+        'commit': git_commit(),
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': seed,
+        'results': results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pipeline stages on synthetic data')
+    parser.add_argument(
+        '--sizes',
+        type=lambda s: [int(x) for x in s.split(',')],
+        default=DEFAULT_SIZES,
+        help='Comma-separated catalog sizes (default: 1000,10000)'
+    )
+    parser.add_argument(
+        '--large',
+        action='store_true',
+        help='Also run 100000 (slow: the score stage is O(n^2))'
+    )
+    parser.add_argument(
+        '--stages',
+        type=lambda s: s.split(','),
+        default=DEFAULT_STAGES,
+        help=f"Comma-separated stages (default: {','.join(DEFAULT_STAGES)})"
+    )
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per stage (default: 5)')
+    parser.add_argument('--seed', type=int, default=42, help='Synthetic catalog seed (default: 42)')
+    parser.add_argument('--output', '-o', help='Result JSON path (default: benchmarks/results/<commit>.json)')
+    args = parser.parse_args()
+
+    unknown = [s for s in args.stages if s not in DEFAULT_STAGES]
+    if unknown:
+        parser.error(f"Unknown stages: {', '.join(unknown)}")
+
+    sizes = args.sizes + [size for size in LARGE_SIZES if size not in args.sizes] if args.large else args.sizes
+
+    # Per-item warnings (unparseable dates etc.) would dominate the timings
+    logging.disable(logging.WARNING)
+
+    report = run_benchmarks(sizes, args.stages, args.repeat, args.seed)
+
+    output_path = Path(args.output) if args.output else (
+        project_root / 'benchmarks' / 'results' / f"{report['commit']}.json"
+    )
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(json.dumps({'results_path': str(output_path), 'total_results': len(report['results'])}))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
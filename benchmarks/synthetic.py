@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Synthetic catalog generator
+Produces seeded, Play-like raw payloads (google-play-scraper `app()` shape)
+for benchmarking every pipeline stage at 10k-1M games.
+"""
+import sys
+import json
+import random
+import argparse
+from pathlib import Path
+from datetime import datetime, timedelta
+from typing import Iterator, Dict, Any, Iterable
+
+# Install buckets shown by the Play Store, weighted towards the long tail
+INSTALL_BUCKETS = [
+    ('1+', 2), ('5+', 3), ('10+', 6), ('50+', 8), ('100+', 12),
+    ('500+', 12), ('1,000+', 14), ('5,000+', 10), ('10,000+', 10),
+    ('50,000+', 7), ('100,000+', 6), ('500,000+', 4), ('1,000,000+', 3),
+    ('5,000,000+', 1.5), ('10,000,000+', 1), ('50,000,000+', 0.3),
+    ('100,000,000+', 0.2),
+]
+
+# Release date formats seen across store locales (last one is unparseable on purpose)
+DATE_FORMATS = [
+    ('%b %d, %Y', 55),      # Nov 07, 2025 (en)
+    ('%Y. %m. %d.', 25),    # 2025. 11. 07. (ko)
+    ('%d %b %Y', 10),       # 07 Nov 2025 (en-GB)
+    ('%Y-%m-%d', 5),        # 2025-11-07
+    ('%Y년 %m월 %d일', 1),   # 2025년 11월 07일
+]
+
+GAME_GENRES = [
+    ('Casual', 18), ('Puzzle', 16), ('Action', 12), ('Simulation', 9),
+    ('Arcade', 9), ('Role Playing', 8), ('Strategy', 7), ('Adventure', 6),
+    ('Sports', 3), ('Racing', 3), ('Board', 2), ('Card', 2), ('Casino', 1.5),
+    ('Word', 1.2), ('Trivia', 1), ('Music', 0.8), ('Educational', 0.5),
+]
+
+# Non-game categories that leak into "new games" searches
+APP_GENRES = [('Tools', 3), ('Entertainment', 3), ('Education', 2), ('Productivity', 1)]
+
+CONTENT_RATINGS = [('Everyone', 60), ('Everyone 10+', 12), ('Teen', 20), ('Mature 17+', 8)]
+
+WORDS = (
+    'dragon quest hero tower merge idle legend puzzle block city farm '
+    'racing drift blast pop cat dungeon knight zombie survival tycoon '
+    'island star galaxy kingdom match jewel word battle arena royale '
+    'sky ocean ninja pixel craft cafe hotel rush run jump'
+).split()
+
+DESCRIPTION_WORDS = WORDS + (
+    'play with friends online offline free update event reward daily '
+    'challenge collect upgrade build explore new levels mode season'
+).split()
+
+
+def _weighted(rng: random.Random, table):
+    """Pick a value from a [(value, weight), ...] table"""
+    values, weights = zip(*table)
+    return rng.choices(values, weights=weights, k=1)[0]
+
+
+def _description(rng: random.Random) -> str:
+    """Log-normal description length, capped at the Play limit of 4000 chars"""
+    target = min(4000, max(20, int(rng.lognormvariate(6.8, 0.8))))
+    words = []
+    length = 0
+    while length < target:
+        word = rng.choice(DESCRIPTION_WORDS)
+        words.append(word)
+        length += len(word) + 1
+    return ' '.join(words)[:target]
+
+
+def generate_raw_game(rng: random.Random, index: int, now: datetime) -> Dict[str, Any]:
+    """Generate a single raw Play-like payload"""
+    is_game = rng.random() < 0.92
+    genre = _weighted(rng, GAME_GENRES if is_game else APP_GENRES)
+    title_words = rng.sample(WORDS, rng.randint(1, 3))
+    title = ' '.join(w.capitalize() for w in title_words)
+    if rng.random() < 0.1:
+        title += ' Game'
+
+    # Release dates: most within the last few months, long tail back two years
+    days_ago = min(730, int(rng.expovariate(1 / 60)))
+    released_dt = now - timedelta(days=days_ago)
+    released = None
+    if rng.random() < 0.95:
+        released = released_dt.strftime(_weighted(rng, DATE_FORMATS))
+
+    installs = _weighted(rng, INSTALL_BUCKETS)
+    min_installs = int(installs.replace(',', '').replace('+', ''))
+
+    ratings = 0
+    if rng.random() < 0.85:
+        ratings = int(min_installs * rng.uniform(0.001, 0.05))
+    score = None
+    if ratings:
+        score = round(min(5.0, max(1.0, rng.gauss(4.1, 0.5))), 6)
+
+    developer_id = rng.randint(1, max(1, index // 4 + 1))
+    # ~3% re-use an earlier appId so dedup has work to do
+    app_index = rng.randint(0, index - 1) if index and rng.random() < 0.03 else index
+    app_id = f"com.synthetic.{WORDS[app_index % len(WORDS)]}{app_index}"
+
+    price = 0 if rng.random() < 0.93 else rng.choice([0.99, 1.99, 2.99, 4.99])
+
+    return {
+        'appId': app_id,
+        'title': title,
+        'description': _description(rng),
+        'summary': ' '.join(rng.sample(DESCRIPTION_WORDS, 8)),
+        'installs': installs,
+        'minInstalls': min_installs,
+        'realInstalls': min_installs + rng.randint(0, min_installs),
+        'score': score,
+        'ratings': ratings,
+        'reviews': ratings // 4,
+        'price': price,
+        'free': price == 0,
+        'currency': 'USD',
+        'developer': f"Studio {developer_id}",
+        'developerId': f"studio{developer_id}",
+        'genre': genre,
+        'genreId': 'GAME_' + genre.upper().replace(' ', '_') if is_game else genre.upper(),
+        'icon': f"https://play-lh.googleusercontent.com/synthetic/{app_id}/icon",
+        'screenshots': [
+            f"https://play-lh.googleusercontent.com/synthetic/{app_id}/shot{i}"
+            for i in range(rng.randint(2, 8))
+        ],
+        'contentRating': _weighted(rng, CONTENT_RATINGS),
+        'released': released,
+        'updated': int((released_dt + timedelta(days=rng.randint(0, days_ago))).timestamp()),
+        'url': f"https://play.google.com/store/apps/details?id={app_id}",
+    }
+
+
+def generate_raw_games(count: int, seed: int = 42, now: datetime = None) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily generate `count` raw payloads.
+
+    The same (count, seed, now) always yields the same catalog.
+    """
+    rng = random.Random(seed)
+    now = now or datetime(2025, 11, 7)
+    for index in range(count):
+        yield generate_raw_game(rng, index, now)
+
+
+def write_json(items: Iterable[Dict[str, Any]], output_path: Path) -> int:
+    """Write items as a JSON array without materializing the list"""
+    count = 0
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write('[')
+        for item in items:
+            if count:
+                f.write(',\n')
+            f.write(json.dumps(item, ensure_ascii=False))
+            count += 1
+        f.write(']\n')
+    return count
+
+
+def write_jsonl(items: Iterable[Dict[str, Any]], output_path: Path) -> int:
+    """Write items as JSON Lines"""
+    count = 0
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for item in items:
+            f.write(json.dumps(item, ensure_ascii=False))
+            f.write('\n')
+            count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic Play catalog')
+    parser.add_argument('--count', '-n', type=int, default=10000, help='Number of games (default: 10000)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    parser.add_argument('--output-dir', '-o', default='outputs/synthetic', help='Output directory')
+    parser.add_argument(
+        '--format',
+        choices=['json', 'jsonl', 'both'],
+        default='both',
+        help='Output format (default: both)'
+    )
+    args = parser.parse_args()
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    written = {}
+    if args.format in ('json', 'both'):
+        path = output_dir / f"raw_games_{args.count}.json"
+        write_json(generate_raw_games(args.count, args.seed), path)
+        written['json_path'] = str(path)
+    if args.format in ('jsonl', 'both'):
+        path = output_dir / f"raw_games_{args.count}.jsonl"
+        write_jsonl(generate_raw_games(args.count, args.seed), path)
+        written['jsonl_path'] = str(path)
+
+    print(json.dumps({**written, 'total_items': args.count, 'seed': args.seed}))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""Tests for benchmark result comparison."""
+import io
+import sys
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from contextlib import redirect_stdout
+from benchmarks.compare import compare_results, main
+
+
+def result(stage='score', size=1000, ops=1000.0, p95=10.0, mem=1000):
+    return {'stage': stage, 'size': size, 'ops_per_sec': ops, 'p95_ms': p95, 'peak_mem_bytes': mem}
+
+
+def results(*rows, commit='abc1234'):
+    return {'commit': commit, 'results': list(rows)}
+
+
+class TestCompareResults(unittest.TestCase):
+    """Test the regression thresholds."""
+    
+    def regressions(self, head, threshold=0.10, memory_threshold=0.20):
+        rows = compare_results(results(result()), results(head), threshold, memory_threshold)
+        self.assertEqual(len(rows), 1)
+        return rows[0]['regressions']
+    
+    def test_within_threshold(self):
+        """Changes up to the threshold are not regressions."""
+        self.assertEqual(self.regressions(result(ops=905.0, p95=10.9, mem=1190)), [])
+        self.assertEqual(self.regressions(result(ops=2000.0, p95=5.0, mem=500)), [])
+    
+    def test_beyond_threshold(self):
+        """Throughput, p95 and memory are flagged independently."""
+        self.assertEqual(self.regressions(result(ops=890.0)), ['throughput'])
+        self.assertEqual(self.regressions(result(p95=11.5)), ['p95'])
+        self.assertEqual(self.regressions(result(mem=1250)), ['memory'])
+        self.assertEqual(
+            self.regressions(result(ops=500.0, p95=20.0, mem=2000)), ['throughput', 'p95', 'memory']
+        )
+    
+    def test_custom_thresholds(self):
+        """The thresholds are parameters, and memory has its own."""
+        self.assertEqual(self.regressions(result(ops=890.0, mem=1250), threshold=0.2, memory_threshold=0.3), [])
+        self.assertEqual(self.regressions(result(mem=1150), memory_threshold=0.1), ['memory'])
+    
+    def test_rows_joined_on_stage_and_size(self):
+        """Only (stage, size) pairs present in both files are compared."""
+        base = results(result('score', 1000), result('html', 1000))
+        head = results(result('score', 1000, ops=500.0), result('score', 10000), result('html', 1000))
+        rows = compare_results(base, head, 0.10, 0.20)
+        self.assertEqual([(row['stage'], row['size']) for row in rows], [('score', 1000), ('html', 1000)])
+        self.assertEqual(rows[0]['ops_change'], -0.5)
+    
+    def test_missing_throughput(self):
+        """A zero or missing baseline does not divide by zero."""
+        rows = compare_results(results(result(ops=None, p95=0, mem=0)), results(result()), 0.10, 0.20)
+        self.assertEqual(rows[0]['regressions'], [])
+
+
+class TestMain(unittest.TestCase):
+    """Test the command-line exit code."""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def run_compare(self, head, *options):
+        base_path = Path(self.tmp.name) / 'base.json'
+        head_path = Path(self.tmp.name) / 'head.json'
+        base_path.write_text(json.dumps(results(result())), encoding='utf-8')
+        head_path.write_text(json.dumps(results(head, commit='def5678')), encoding='utf-8')
+        stdout = io.StringIO()
+        argv = ['compare.py', str(base_path), str(head_path), *options]
+        with mock.patch.object(sys, 'argv', argv), redirect_stdout(stdout):
+            exit_code = main()
+        return exit_code, stdout.getvalue().splitlines()
+    
+    def test_no_regression_exits_zero(self):
+        exit_code, lines = self.run_compare(result(ops=950.0))
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(lines[0], 'abc1234 -> def5678')
+        self.assertEqual(json.loads(lines[-1]), {'compared': 1, 'regressions': 0})
+    
+    def test_regression_exits_one(self):
+        exit_code, lines = self.run_compare(result(ops=800.0))
+        self.assertEqual(exit_code, 1)
+        self.assertIn('throughput', lines[2])
+        self.assertEqual(json.loads(lines[-1]), {'compared': 1, 'regressions': 1})
+    
+    def test_threshold_option(self):
+        self.assertEqual(self.run_compare(result(ops=800.0), '--threshold', '0.25')[0], 0)
+        self.assertEqual(self.run_compare(result(mem=1100), '--memory-threshold', '0.05')[0], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""Tests for the synthetic catalog generator."""
+import tempfile
+import unittest
+from pathlib import Path
+from datetime import datetime
+from benchmarks.synthetic import generate_raw_games, write_json, write_jsonl
+from skills.ingest_play.normalize import (
+    normalize_game_data,
+    deduplicate_games,
+    filter_games_only
+)
+
+COUNT = 500
+
+
+class TestDeterminism(unittest.TestCase):
+    """Test that the seed fully determines the catalog."""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def write(self, name, seed, writer=write_jsonl):
+        path = Path(self.tmp.name) / name
+        writer(generate_raw_games(COUNT, seed), path)
+        return path.read_bytes()
+    
+    def test_same_seed_byte_identical(self):
+        """The same seed writes byte-identical files."""
+        self.assertEqual(self.write('a.jsonl', 7), self.write('b.jsonl', 7))
+        self.assertEqual(self.write('a.json', 7, write_json), self.write('b.json', 7, write_json))
+    
+    def test_different_seed_differs(self):
+        """A different seed writes a different catalog."""
+        self.assertNotEqual(self.write('a.jsonl', 7), self.write('b.jsonl', 8))
+    
+    def test_prefix_stable(self):
+        """A smaller count is a prefix of a larger one with the same seed."""
+        self.assertEqual(list(generate_raw_games(50, 7)), list(generate_raw_games(COUNT, 7))[:50])
+
+
+class TestNormalization(unittest.TestCase):
+    """Test that synthetic payloads go through ingest_play normalization."""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.raw = list(generate_raw_games(COUNT, 42))
+        cls.normalized = [normalize_game_data(item) for item in cls.raw]
+    
+    def test_fields_normalized(self):
+        """Every record normalizes, with installs and rating in range."""
+        for raw, game in zip(self.raw, self.normalized):
+            self.assertEqual(game['package_name'], raw['appId'])
+            self.assertTrue(game['title'])
+            self.assertEqual(game['installs'], raw['minInstalls'])
+            if game['rating'] is not None:
+                self.assertTrue(1.0 <= game['rating'] <= 5.0, game['rating'])
+            if game['release_date'] is not None:
+                released = datetime.strptime(game['release_date'], '%Y-%m-%d')
+                self.assertLessEqual(released, datetime(2025, 11, 7))
+    
+    def test_release_dates_mostly_parsed(self):
+        """Missing and unparseable dates stay a small minority."""
+        parsed = sum(1 for game in self.normalized if game['release_date'])
+        self.assertGreater(parsed / COUNT, 0.85)
+        self.assertLess(parsed, COUNT)
+    
+    def test_filter_and_dedup_have_work(self):
+        """Some records are non-games and some appIds repeat, as documented."""
+        games = filter_games_only(self.normalized)
+        unique = deduplicate_games(games)
+        self.assertTrue(0.85 * COUNT < len(games) < COUNT)
+        self.assertTrue(0.9 * len(games) < len(unique) < len(games))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -32,10 +32,10 @@ def example_1_basic_logging():
     )
     
     # 저장
-    logger.save_and_build()
+    review_path = logger.save_and_build()
     
     print("✓ 변경 이력 저장 완료!")
-    print(f"  파일: reviews/{logger.timestamp}.md")
+    print(f"  파일: {review_path}")
 
 
 def example_2_pipeline_simulation():
@@ -74,10 +74,10 @@ def example_2_pipeline_simulation():
     )
     
     # 저장
-    logger.save_and_build()
+    review_path = logger.save_and_build()
     
     print("\n✓ 전체 파이프라인 로깅 완료!")
-    print(f"  파일: reviews/{logger.timestamp}.md")
+    print(f"  파일: {review_path}")
 
 
 def example_3_file_modification():
@@ -112,10 +112,10 @@ def calculate_diversity_score(games):
     )
     
     # 저장
-    logger.save_and_build()
+    review_path = logger.save_and_build()
     
     print("✓ 파일 수정 이력 저장 완료!")
-    print(f"  파일: reviews/{logger.timestamp}.md")
+    print(f"  파일: {review_path}")
 
 
 def example_4_bug_fix():
@@ -138,10 +138,10 @@ def example_4_bug_fix():
     )
     
     # 저장
-    logger.save_and_build()
+    review_path = logger.save_and_build()
     
     print("✓ 버그 수정 이력 저장 완료!")
-    print(f"  파일: reviews/{logger.timestamp}.md")
+    print(f"  파일: {review_path}")
 
 
 def example_5_multi_agent():
@@ -161,8 +161,8 @@ def example_5_multi_agent():
         content="87 games collected",
         reason="Data collection by ingest_play agent"
     )
-    logger1.save_and_build()
-    print(f"  → reviews/{logger1.timestamp}.md")
+    review_path = logger1.save_and_build()
+    print(f"  → {review_path}")
     
     # Agent 2: ranker
     print("[Agent 2: ranker] 실행...")
@@ -175,8 +175,8 @@ def example_5_multi_agent():
         content="Top 50 games selected",
         reason="Ranking by ranker agent"
     )
-    logger2.save_and_build()
-    print(f"  → reviews/{logger2.timestamp}.md")
+    review_path = logger2.save_and_build()
+    print(f"  → {review_path}")
     
     # Agent 3: publish_html
     print("[Agent 3: publish_html] 실행...")
@@ -189,8 +189,8 @@ def example_5_multi_agent():
         content="HTML report generated",
         reason="Report generation by publish_html agent"
     )
-    logger3.save_and_build()
-    print(f"  → reviews/{logger3.timestamp}.md")
+    review_path = logger3.save_and_build()
+    print(f"  → {review_path}")
     
     print("\n✓ 3개 에이전트의 변경사항이 각각 기록되었습니다!")
 
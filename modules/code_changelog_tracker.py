@@ -2,13 +2,826 @@
 """
 Code Changelog Tracker
 AI가 만든 모든 코드 변경사항을 reviews 폴더에 기록하고 HTML 뷰어로 확인
+
+    reviews/
+    ├── manifest.jsonl   # 리뷰 문서 목록 (append-only, 한 줄에 문서 하나)
+    ├── SUMMARY.md       # 문서 목록 (저장할 때마다 한 줄 추가)
+    ├── index.html       # manifest.jsonl을 읽는 정적 뷰어
+    ├── .blobs/          # 내용 주소 blob 저장소 (blob_store=True일 때)
+    └── <timestamp>.md   # 리뷰 문서
+
+문서를 저장하면 manifest.jsonl과 SUMMARY.md에 한 줄씩 추가할 뿐이므로
+이력이 길어져도 저장 비용이 늘지 않습니다. `build --full`은 reviews/를
+다시 스캔해 manifest를 재구성합니다.
+
+문서를 저장할 때 변경 단위로 전문 검색 색인(SQLite FTS5, `.search.db`)도
+갱신합니다. 파일 경로/변경 유형/이유/내용을 bm25 순위로 찾으며, CLI의
+`search`와 뷰어의 검색창(`serve`의 `/_search`)에서 씁니다.
+
+뷰어는 manifest를 페이지 단위 JSON(`manifest/index.json`, `page-<n>.json`)으로
+받아 보이는 행만 그리며(가상 스크롤, 날짜 그룹), 문서를 열면 앞뒤 문서를
+미리 받습니다. 저장할 때는 마지막 페이지만 다시 씁니다.
+
+보존 정책(`compact`, `retention_days`)은 최근 N일 문서만 개별 파일로 두고
+이전 문서는 월별 보관 묶음(`archives/<YYYY-MM>.json.gz`)으로 옮깁니다.
+manifest/SUMMARY에는 달마다 한 줄만 남고, 뷰어는 보관 묶음을 펼칠 때만
+받아오므로 이력이 길어져도 목록 크기가 일정합니다. 보관된 문서의 주소는
+`archives/<YYYY-MM>/<문서>.md`입니다.
+
+`log_from_git`은 git 범위/커밋의 변경을 `git diff`/`git show` 한 번으로
+읽어 생성/수정/삭제로 나눠 기록합니다.
+
+`serve`는 프로세스 내 멀티스레드 서버로 문서를 제공합니다: ETag/Last-Modified
+조건부 요청, gzip, 서버 측 Markdown 렌더링(`/_render/<문서>.md`)과 mtime으로
+무효화되는 LRU 캐시.
+
+여러 에이전트가 동시에 저장해도 안전합니다: 문서 이름은 O_EXCL로 선점해
+같은 초에 저장해도 겹치지 않고(`<timestamp>_2.md` ...), 문서/목록 파일은
+임시 파일에 쓴 뒤 rename하며, manifest/SUMMARY/index 갱신은 reviews/.lock
+파일 잠금 안에서 수행합니다.
 """
+import io
 import os
+import re
+import gzip
+import html
 import json
+import time
+import zlib
+import sqlite3
+import difflib
+import hashlib
+import threading
+import tempfile
 import subprocess
-from datetime import datetime
+import email.utils
+import urllib.parse
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# reviews/ 안에서 리뷰 문서가 아닌 Markdown 파일
+RESERVED_DOCS = ["README.md", "SUMMARY.md"]
+
+MANIFEST_NAME = "manifest.jsonl"
+
+SUMMARY_HEADER = "# Summary\n\n* [홈](README.md)\n\n"
+
+# 뷰어용 문서 목록 페이지 (reviews/manifest/index.json, page-<n>.json)
+MANIFEST_PAGES_DIR = "manifest"
+MANIFEST_PAGE_SIZE = 200
+
+# 월별 보관 묶음 디렉토리 (reviews/ 안)
+ARCHIVE_DIR_NAME = "archives"
+
+# 전문 검색 색인 (reviews/ 안, 정적 파일로는 제공하지 않음)
+SEARCH_DB_NAME = ".search.db"
+
+# 변경 유형 -> 문서에 쓰는 이름 (검색 색인에 함께 기록)
+CHANGE_LABELS = {
+    'creation': '파일 생성',
+    'modification': '파일 수정',
+    'deletion': '파일 삭제',
+    'bug_fix': '버그 수정',
+    'refactoring': '리팩토링',
+}
+
+
+class BlobStore:
+    """
+    내용 주소(content-addressed) blob 저장소: reviews/.blobs/<sha256 앞 2자리>/<sha256>.z
+    
+    파일 내용을 zlib으로 압축해 SHA-256 이름으로 한 번만 저장하므로, 같은
+    내용이 여러 문서(생성, 삭제, 반복 리팩토링)에 나와도 디스크에는 한 벌만
+    남습니다. 뷰어는 DecompressionStream('deflate')로 필요할 때 풉니다.
+    """
+    
+    def __init__(self, root: Path):
+        self.root = Path(root)
+    
+    def path(self, digest: str) -> Path:
+        return self.root / digest[:2] / f"{digest}.z"
+    
+    def put(self, content: str) -> str:
+        """내용을 저장하고 SHA-256 해시 반환 (이미 있으면 쓰지 않음)"""
+        data = content.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(zlib.compress(data, 9))
+            os.replace(tmp_path, path)
+        return digest
+    
+    def get(self, digest: str) -> str:
+        """해시로 내용 읽기"""
+        return zlib.decompress(self.path(digest).read_bytes()).decode('utf-8')
+
+
+# 검색어 토큰: FTS5 unicode61 토크나이저와 같은 기준 (한글 포함 문자/숫자)
+_QUERY_TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+def fts_query(text: str) -> str:
+    """
+    검색어 -> FTS5 MATCH 식: 모든 토큰을 포함(AND)하고 각 토큰은 접두어 일치
+    
+    연산자/따옴표는 토큰화로 제거되므로 어떤 입력도 문법 오류가 나지 않습니다.
+    """
+    return " ".join(f'"{token}"*' for token in _QUERY_TOKEN_RE.findall(text.lower()))
+
+
+class SearchIndex:
+    """
+    리뷰 전문 검색 색인 (SQLite FTS5)
+    
+    변경 하나가 한 행이며 파일 경로, 변경 유형, 이유, 내용을 색인합니다.
+    FTS 테이블은 contentless(content='')라 내용 원문은 저장하지 않고
+    (원문은 문서와 blob 저장소에 있음), entries 테이블에 행 번호 ->
+    (문서, 순번, 파일 경로, 변경 유형, 이유)만 둡니다. 검색 결과는 bm25
+    점수(파일 경로 > 이유 > 변경 유형 > 내용 가중치) 순입니다.
+    
+    contentless 테이블의 행은 원래 값 없이는 지울 수 없으므로, 문서를 다시
+    저장하면 entries 행만 지우고 FTS 행은 남깁니다(검색 시 entries와 조인해
+    걸러냄). 남은 행이 살아 있는 행보다 많아지면 needs_rebuild가 참이 되고
+    CodeChangeLogger가 문서에서 색인을 다시 만듭니다.
+    
+    FTS5가 없는 SQLite에서는 생성 시 sqlite3.OperationalError가 납니다.
+    """
+    
+    # bm25 열 가중치: file_path, change_type, reason, content
+    WEIGHTS = (10.0, 2.0, 5.0, 1.0)
+    
+    # 이보다 적게 남은 행은 다시 만들지 않음
+    MIN_STALE_ROWS = 1000
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        # 서버의 여러 스레드가 한 연결을 공유 (self._lock으로 직렬화)
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._conn:
+            columns = [row[1] for row in self._conn.execute("PRAGMA table_info(entries)")]
+            # 이전 형식(내용을 저장하던 FTS 테이블)은 지우고 새로 만듦
+            if columns and 'position' not in columns:
+                self._conn.execute("DROP TABLE IF EXISTS changes")
+                self._conn.execute("DROP TABLE IF EXISTS entries")
+                self._conn.execute("DROP TABLE IF EXISTS meta")
+            self._conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS changes USING fts5("
+                "file_path, change_type, reason, content, "
+                "content='', tokenize='unicode61')"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "id INTEGER PRIMARY KEY, review TEXT NOT NULL, position INTEGER NOT NULL, "
+                "file_path TEXT NOT NULL, change_type TEXT NOT NULL, reason TEXT NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS entries_review ON entries (review)")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+    
+    @property
+    def built(self) -> bool:
+        """문서 전체를 한 번 색인했는지 (새로 만들었거나 재구성이 중단되면 False)"""
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM meta WHERE key = 'built'").fetchone() is not None
+    
+    def mark_built(self):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('built', 1)")
+    
+    def replace_review(self, review: str, rows: Iterable[Tuple[str, str, str, str]]):
+        """문서 하나의 행 교체: rows = (file_path, change_type, reason, content)들 (한 행씩 소비)"""
+        with self._lock, self._conn:
+            stale = self._conn.execute("DELETE FROM entries WHERE review = ?", (review,)).rowcount
+            if stale:
+                self._conn.execute(
+                    "INSERT INTO meta (key, value) VALUES ('stale', ?) "
+                    "ON CONFLICT (key) DO UPDATE SET value = value + excluded.value",
+                    (stale,)
+                )
+            for position, (file_path, change_type, reason, content) in enumerate(rows, 1):
+                rowid = self._conn.execute(
+                    "INSERT INTO entries (review, position, file_path, change_type, reason) VALUES (?, ?, ?, ?, ?)",
+                    (review, position, file_path, change_type, reason)
+                ).lastrowid
+                self._conn.execute(
+                    "INSERT INTO changes (rowid, file_path, change_type, reason, content) VALUES (?, ?, ?, ?, ?)",
+                    (rowid, file_path, change_type, reason, content)
+                )
+    
+    def rename_review(self, review: str, new_review: str):
+        """문서 주소 변경 (보관 묶음으로 옮긴 문서)"""
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE entries SET review = ? WHERE review = ?", (new_review, review))
+    
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT INTO changes (changes) VALUES ('delete-all')")
+            self._conn.execute("DELETE FROM entries")
+            self._conn.execute("DELETE FROM meta")
+    
+    @property
+    def needs_rebuild(self) -> bool:
+        """다시 저장해 남은 FTS 행이 살아 있는 행보다 많은지"""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'stale'").fetchone()
+            stale = row[0] if row else 0
+            if stale < self.MIN_STALE_ROWS:
+                return False
+            return stale > self._conn.execute("SELECT count(*) FROM entries").fetchone()[0]
+    
+    def search(self, query: str, limit: int = 20, highlight: Tuple[str, str] = ("[", "]")) -> List[Dict[str, Any]]:
+        """
+        순위순 검색 결과
+        
+        Returns:
+            [{'review', 'position', 'file_path', 'change_type', 'reason', 'snippet', 'score'}, ...]
+            snippet은 이유 중 일치 부분을 highlight로 감싼 것 (내용은 저장하지 않으므로
+            이유에 일치하는 단어가 없으면 빈 문자열)
+        """
+        match = fts_query(query)
+        if not match:
+            return []
+        weights = ", ".join(str(weight) for weight in self.WEIGHTS)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT entries.review, entries.position, entries.file_path, entries.change_type, "
+                f"entries.reason, bm25(changes, {weights}) AS rank "
+                "FROM changes JOIN entries ON entries.id = changes.rowid "
+                "WHERE changes MATCH ? ORDER BY rank LIMIT ?",
+                (match, limit)
+            ).fetchall()
+        
+        tokens = _QUERY_TOKEN_RE.findall(query.lower())
+        pattern = re.compile(
+            r"\b(?:" + "|".join(re.escape(token) for token in tokens) + r")\w*", re.I
+        )
+        results = []
+        for review, position, file_path, change_type, reason, rank in rows:
+            marked = pattern.sub(lambda m: f"{highlight[0]}{m.group(0)}{highlight[1]}", reason)
+            results.append({
+                'review': review,
+                'position': position,
+                'file_path': file_path,
+                'change_type': change_type.split(" ", 1)[0],
+                'reason': reason,
+                'snippet': marked if marked != reason else "",
+                'score': round(-rank, 3),
+            })
+        return results
+    
+    def close(self):
+        self._conn.close()
+    
+    def __enter__(self) -> 'SearchIndex':
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def parse_review_changes(text: str, blobs: Optional[BlobStore] = None) -> List[Tuple[str, str, str, str]]:
+    """
+    저장된 리뷰 Markdown -> 검색 색인 행 (`build --full`로 색인을 재구성할 때)
+    
+    blob 링크는 blobs가 주어지고 파일이 있으면 내용으로 풉니다 (없거나 손상된
+    blob은 건너뜀).
+    """
+    rows = []
+    sections = re.split(r"^## \d+\. (.+)$", text, flags=re.M)
+    for file_path, body in zip(sections[1::2], sections[2::2]):
+        label = re.search(r"^\*\*변경 유형\*\*: (.+)$", body, re.M)
+        change_type = next(
+            (key for key, name in CHANGE_LABELS.items() if label and label.group(1).startswith(name)),
+            ""
+        )
+        reason = " ".join(re.findall(
+            r"^\*\*(?:이유|버그 설명|수정 내용|리팩토링 유형)\*\*: (.*)$", body, re.M
+        ))
+        content = re.findall(r"^```[^\n]*\n(.*?)^```$", body, re.M | re.S)
+        if blobs is not None:
+            for digest in re.findall(r"\(\.blobs/[0-9a-f]{2}/([0-9a-f]{64})\.z\)", body):
+                try:
+                    content.append(blobs.get(digest))
+                except (OSError, zlib.error, UnicodeDecodeError):
+                    continue
+        rows.append((
+            file_path.strip(),
+            f"{change_type} {CHANGE_LABELS.get(change_type, '')}".strip(),
+            reason,
+            "\n".join(content),
+        ))
+    return rows
+
+
+# log_from_git: 이름 변경은 삭제 + 생성으로, 외부 diff 도구/색상 없이
+GIT_DIFF_OPTIONS = ('--no-color', '--no-ext-diff', '--no-renames')
+
+_GIT_QUOTED_RE = re.compile(r'"((?:[^"\\]|\\.)*)"')
+
+
+def _git_path(header: str) -> str:
+    """`diff --git a/<경로> b/<경로>` -> 경로 (이름 변경이 없으므로 두 경로가 같음)"""
+    rest = header[len('diff --git '):].rstrip('\n')
+    if rest.startswith('"'):
+        # 특수 문자가 있는 경로는 C 문자열로 인용됨 (core.quotepath=false라 한글은 그대로)
+        quoted = _GIT_QUOTED_RE.match(rest).group(1)
+        path = quoted.encode('utf-8').decode('unicode_escape').encode('latin-1').decode('utf-8')
+        return path[2:]
+    return rest[2:2 + (len(rest) - 5) // 2]
+
+
+def iter_git_patch(lines: Iterable[str]) -> Iterator[Tuple[str, str, List[str]]]:
+    """
+    git 패치 출력 -> 파일별 (경로, 변경 유형, hunk 줄)
+    
+    줄 단위로 읽으므로 패치 전체를 메모리에 올리지 않습니다. 변경 유형은
+    creation/modification/deletion이며, 바이너리 파일의 hunk 줄은
+    `Binary files ... differ` 한 줄입니다.
+    """
+    path = None
+    change_type = 'modification'
+    hunks: List[str] = []
+    in_hunks = False
+    for line in lines:
+        line = line.rstrip('\n')
+        if line.startswith('diff --git '):
+            if path is not None:
+                yield path, change_type, hunks
+            path = _git_path(line)
+            change_type = 'modification'
+            hunks = []
+            in_hunks = False
+        elif path is None:
+            continue
+        elif in_hunks:
+            hunks.append(line)
+        elif line.startswith('@@'):
+            in_hunks = True
+            hunks.append(line)
+        elif line.startswith('new file mode'):
+            change_type = 'creation'
+        elif line.startswith('deleted file mode'):
+            change_type = 'deletion'
+        elif line.startswith('Binary files '):
+            hunks.append(line)
+    if path is not None:
+        yield path, change_type, hunks
+
+
+def _patch_content(hunks: List[str], prefix: str) -> str:
+    """새 파일(+)/삭제된 파일(-) 패치의 줄 -> 파일 내용"""
+    if hunks and hunks[0].startswith('Binary files '):
+        return "(바이너리 파일)"
+    content = "".join(line[1:] + "\n" for line in hunks if line.startswith(prefix))
+    if hunks and hunks[-1].startswith('\\'):  # \ No newline at end of file
+        content = content[:-1]
+    return content
+
+
+_INLINE_RE = re.compile(r"`([^`]+)`|\*\*(.+?)\*\*|\[([^\]]+)\]\(([^)\s]+)\)")
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*)$")
+_LIST_RE = re.compile(r"^\s*[*-]\s+(.*)$")
+
+
+def _render_inline(text: str) -> str:
+    """코드 스팬, 굵게, 링크 (나머지는 HTML 이스케이프)"""
+    parts = []
+    position = 0
+    for match in _INLINE_RE.finditer(text):
+        parts.append(html.escape(text[position:match.start()]))
+        code, bold, label, href = match.groups()
+        if code is not None:
+            parts.append(f"<code>{html.escape(code)}</code>")
+        elif bold is not None:
+            parts.append(f"<strong>{_render_inline(bold)}</strong>")
+        else:
+            if href.lower().startswith('javascript:'):
+                href = '#'
+            parts.append(f'<a href="{html.escape(href)}">{_render_inline(label)}</a>')
+        position = match.end()
+    parts.append(html.escape(text[position:]))
+    return "".join(parts)
+
+
+def render_markdown(text: str) -> str:
+    """
+    리뷰 문서용 Markdown -> HTML (서버 측 렌더링)
+    
+    이 로거가 만드는 문법만 지원합니다: 제목, 단락, 목록, 구분선, 펜스 코드
+    블록(```diff 등), 코드 스팬, 굵게, 링크.
+    """
+    out = []
+    paragraph: List[str] = []
+    in_list = False
+    fence = None
+    code: List[str] = []
+    
+    def flush():
+        nonlocal in_list
+        if paragraph:
+            out.append(f"<p>{_render_inline(chr(10).join(paragraph))}</p>")
+            paragraph.clear()
+        if in_list:
+            out.append("</ul>")
+            in_list = False
+    
+    for line in text.split("\n"):
+        if fence is not None:
+            if line.strip() == "```":
+                css = f' class="language-{html.escape(fence)}"' if fence else ""
+                out.append(f"<pre><code{css}>{html.escape(chr(10).join(code))}</code></pre>")
+                fence = None
+                code = []
+            else:
+                code.append(line)
+            continue
+        
+        stripped = line.strip()
+        if stripped.startswith("```"):
+            flush()
+            fence = stripped[3:].strip()
+            continue
+        if not stripped:
+            flush()
+            continue
+        if stripped == "---":
+            flush()
+            out.append("<hr>")
+            continue
+        
+        heading = _HEADING_RE.match(line)
+        if heading:
+            flush()
+            level = len(heading.group(1))
+            out.append(f"<h{level}>{_render_inline(heading.group(2))}</h{level}>")
+            continue
+        
+        item = _LIST_RE.match(line)
+        if item and not paragraph:
+            if not in_list:
+                out.append("<ul>")
+                in_list = True
+            out.append(f"<li>{_render_inline(item.group(1))}</li>")
+            continue
+        
+        paragraph.append(stripped)
+    
+    if fence is not None:  # 닫히지 않은 코드 블록
+        out.append(f"<pre><code>{html.escape(chr(10).join(code))}</code></pre>")
+    flush()
+    return "\n".join(out) + "\n"
+
+
+# gzip으로 보낼 Content-Type (blob(.z)은 이미 압축됨)
+_COMPRESSIBLE_TYPES = ('text/', 'application/json', 'application/javascript', 'application/x-ndjson')
+
+
+class DocsCache:
+    """
+    문서 응답 본문 LRU 캐시: (경로, 변형) -> 본문
+    
+    변형은 원본/렌더링된 HTML 각각의 gzip 여부입니다. 항목은 파일의
+    mtime과 크기가 바뀌면 무효가 되므로 새로 저장된 문서도 바로 반영됩니다.
+    """
+    
+    def __init__(self, max_entries: int = 512, max_file_bytes: int = 8 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_file_bytes = max_file_bytes
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[int, int, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(
+        self,
+        path: str,
+        stat: os.stat_result,
+        render: bool,
+        compress: bool,
+        member: Optional[str] = None
+    ) -> bytes:
+        """
+        응답 본문 (member: 보관 묶음 안의 문서, 없으면 KeyError)
+        """
+        variant = ('html' if render else 'raw') + (f':{member}' if member else '') + ('.gz' if compress else '')
+        key = (path, variant)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+        
+        if compress:
+            body = gzip.compress(self.get(path, stat, render, False, member), compresslevel=6, mtime=0)
+        elif member:
+            markdown = next(
+                (doc['markdown'] for doc in read_archive(Path(path))['docs'] if doc['file'] == member),
+                None
+            )
+            if markdown is None:
+                raise KeyError(member)
+            body = (render_markdown(markdown) if render else markdown).encode('utf-8')
+        else:
+            with open(path, 'rb') as f:
+                body = f.read()
+            if render:
+                body = render_markdown(body.decode('utf-8', errors='replace')).encode('utf-8')
+        
+        if stat.st_size <= self.max_file_bytes:
+            with self._lock:
+                self._entries[key] = (stat.st_mtime_ns, stat.st_size, body)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return body
+
+
+class DocsRequestHandler(SimpleHTTPRequestHandler):
+    """reviews/ 정적 파일 + /_render/<문서>.md (ETag, Last-Modified, gzip, LRU 캐시)"""
+    
+    cache: DocsCache = None
+    search_index: Optional[SearchIndex] = None
+    
+    extensions_map = {
+        **SimpleHTTPRequestHandler.extensions_map,
+        '.md': 'text/markdown',
+        '.jsonl': 'application/x-ndjson',
+        '.z': 'application/octet-stream',
+        '.gz': 'application/gzip',
+    }
+    
+    def do_GET(self):
+        self._respond(send_body=True)
+    
+    def do_HEAD(self):
+        self._respond(send_body=False)
+    
+    def _respond(self, send_body: bool):
+        url = urllib.parse.urlsplit(self.path)
+        url_path = url.path
+        if url_path == '/_search':
+            self._respond_search(url.query, send_body)
+            return
+        render = url_path.startswith('/_render/')
+        if render:
+            url_path = url_path[len('/_render'):]
+        
+        # 보관된 문서: /archives/<YYYY-MM>/<문서>.md -> archives/<YYYY-MM>.json.gz 안의 문서
+        member = None
+        parts = url_path.split('/')
+        if len(parts) == 4 and parts[1] == ARCHIVE_DIR_NAME and parts[3].endswith('.md'):
+            member = urllib.parse.unquote(parts[3])
+            url_path = f"/{ARCHIVE_DIR_NAME}/{parts[2]}.json.gz"
+        
+        fs_path = self.translate_path(url_path)
+        if os.path.isdir(fs_path):
+            fs_path = os.path.join(fs_path, 'index.html')
+        # 검색 색인(.search.db, -wal/-shm)은 제공하지 않음: 인코딩/정규화 뒤의 실제 경로로 확인
+        if os.path.basename(fs_path).startswith(SEARCH_DB_NAME):
+            self.send_error(404, "File not found")
+            return
+        try:
+            stat = os.stat(fs_path)
+        except OSError:
+            self.send_error(404, "File not found")
+            return
+        if not os.path.isfile(fs_path) or (render and not (member or fs_path.endswith('.md'))):
+            self.send_error(404, "File not found")
+            return
+        
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}{"-html" if render else ""}"'
+        if self._not_modified(etag, stat.st_mtime):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        
+        if render:
+            content_type = 'text/html'
+        else:
+            content_type = 'text/markdown' if member else self.guess_type(fs_path)
+        compress = (
+            content_type.startswith(_COMPRESSIBLE_TYPES)
+            and 'gzip' in self.headers.get('Accept-Encoding', '')
+        )
+        try:
+            body = self.cache.get(fs_path, stat, render, compress, member)
+        except KeyError:
+            self.send_error(404, "File not found")
+            return
+        
+        if content_type.startswith('text/') or content_type in _COMPRESSIBLE_TYPES:
+            content_type += '; charset=utf-8'
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", email.utils.formatdate(stat.st_mtime, usegmt=True))
+        self.send_header("Vary", "Accept-Encoding")
+        if url_path.startswith('/.blobs/'):
+            # 내용 주소 파일은 바뀌지 않음
+            self.send_header("Cache-Control", "public, max-age=31536000, immutable")
+        else:
+            self.send_header("Cache-Control", "no-cache")
+        if compress:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+    
+    def _respond_search(self, query_string: str, send_body: bool):
+        """/_search?q=<검색어>&limit=<개수> -> {'query', 'took_ms', 'results'}"""
+        if self.search_index is None:
+            self.send_error(404, "Search index not available")
+            return
+        params = urllib.parse.parse_qs(query_string)
+        query = params.get('q', [''])[0]
+        try:
+            limit = max(1, min(int(params.get('limit', ['20'])[0]), 200))
+        except ValueError:
+            limit = 20
+        
+        start = time.perf_counter()
+        # 제어 문자로 강조 범위를 표시하고 뷰어가 이스케이프 후 <mark>로 바꿈
+        results = self.search_index.search(query, limit, highlight=("\x02", "\x03"))
+        took_ms = round((time.perf_counter() - start) * 1000, 2)
+        body = json.dumps(
+            {'query': query, 'took_ms': took_ms, 'results': results}, ensure_ascii=False
+        ).encode('utf-8')
+        
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+    
+    def _not_modified(self, etag: str, mtime: float) -> bool:
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match:
+            return etag in [tag.strip() for tag in if_none_match.split(',')] or if_none_match.strip() == '*'
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return int(mtime) <= since
+        return False
+
+
+def make_docs_server(reviews_dir: Path, port: int = 4000, host: str = "") -> ThreadingHTTPServer:
+    """reviews/를 제공하는 멀티스레드 서버 (serve_forever()로 실행)"""
+    search_index = None
+    if (reviews_dir / SEARCH_DB_NAME).exists():
+        try:
+            search_index = SearchIndex(reviews_dir / SEARCH_DB_NAME)
+        except sqlite3.Error:
+            pass
+    handler = type(
+        'BoundDocsRequestHandler',
+        (DocsRequestHandler,),
+        {'cache': DocsCache(), 'search_index': search_index}
+    )
+    return ThreadingHTTPServer((host, port), partial(handler, directory=str(reviews_dir)))
+
+
+_STEM_RE = re.compile(r"^(\d{8}_\d{6})(?:_(\d+))?$")
+
+
+def display_name(stem: str) -> str:
+    """타임스탬프 파일명을 읽기 좋은 형식으로 (예: 2025-11-07 18:11:06, 같은 초의 두 번째 문서는 '(2)')"""
+    match = _STEM_RE.match(stem)
+    if not match:
+        return stem
+    try:
+        name = datetime.strptime(match.group(1), "%Y%m%d_%H%M%S").strftime("%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return stem
+    return f"{name} ({match.group(2)})" if match.group(2) else name
+
+
+# 큰 조각은 이 크기(문자 수)씩 나눠 써서 인코딩 버퍼도 커지지 않게 함
+WRITE_CHUNK_CHARS = 1 << 20
+
+
+def review_time(filename: str) -> Optional[datetime]:
+    """`<YYYYMMDD_HHMMSS>[_N].md` 문서의 저장 시각 (다른 이름이면 None)"""
+    match = _STEM_RE.match(Path(filename).stem)
+    if not match:
+        return None
+    return datetime.strptime(match.group(1), "%Y%m%d_%H%M%S")
+
+
+def read_archive(path: Path) -> Dict[str, Any]:
+    """
+    월별 보관 묶음 읽기
+    
+    Returns:
+        {'month': 'YYYY-MM', 'docs': [manifest 항목 + 'markdown', ...]} (파일명 순)
+    """
+    return json.loads(gzip.decompress(path.read_bytes()).decode('utf-8'))
+
+
+def archive_entry(bundle: Dict[str, Any]) -> Dict[str, Any]:
+    """보관 묶음의 manifest 항목 (문서 목록은 묶음 안에만 있음)"""
+    month = bundle['month']
+    return {
+        'file': f"{ARCHIVE_DIR_NAME}/{month}.json.gz",
+        'title': f"{month} 보관 ({len(bundle['docs'])}개)",
+        'archive': True,
+        'month': month,
+        'docs': len(bundle['docs']),
+        'changes': sum(doc.get('changes', 0) for doc in bundle['docs']),
+    }
+
+
+def sidebar_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """manifest 항목 중 사이드바에 필요한 필드"""
+    return {key: entry[key] for key in ('file', 'title', 'changes', 'archive', 'month', 'docs') if key in entry}
+
+
+def sidebar_group(entry: Dict[str, Any]) -> str:
+    """사이드바 날짜 그룹 (보관 묶음은 '보관', 타임스탬프가 없는 문서는 '기타')"""
+    if entry.get('archive'):
+        return "보관"
+    saved = review_time(entry['file'])
+    return saved.strftime("%Y-%m-%d") if saved else "기타"
+
+
+def atomic_write_bytes(path: Path, data: bytes):
+    """바이트 내용을 임시 파일에 쓴 뒤 rename"""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def atomic_write(path: Path, text: str):
+    """임시 파일에 쓴 뒤 rename (읽는 쪽은 이전 또는 새 내용 전체만 봄)"""
+    atomic_write_chunks(path, (text,))
+
+
+def atomic_write_chunks(path: Path, chunks: Iterable[str]):
+    """
+    조각을 차례로 임시 파일에 쓴 뒤 rename
+    
+    전체 내용을 메모리에 만들지 않으므로 메모리 사용량은 가장 큰 조각
+    하나로 제한됩니다. 중간에 실패하면 임시 파일을 지우고 기존 파일은 그대로 둡니다.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for chunk in chunks:
+                if len(chunk) <= WRITE_CHUNK_CHARS:
+                    f.write(chunk)
+                    continue
+                for start in range(0, len(chunk), WRITE_CHUNK_CHARS):
+                    f.write(chunk[start:start + WRITE_CHUNK_CHARS])
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+@contextmanager
+def file_lock(lock_path: Path) -> Iterator[None]:
+    """프로세스/스레드 간 배타 잠금 (POSIX: flock, Windows: msvcrt.locking)"""
+    with open(lock_path, 'a+b') as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue  # LK_LOCK은 약 10초 재시도 후 실패하므로 다시 대기
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
 
 
 class CodeChangeLogger:
@@ -19,7 +832,12 @@ class CodeChangeLogger:
         project_name: str,
         user_request: str = "",
         reviews_dir: str = "reviews",
-        port: int = 4000
+        port: int = 4000,
+        diff_mode: bool = False,
+        diff_context: int = 3,
+        blob_store: bool = False,
+        search_index: Optional[bool] = None,
+        retention_days: Optional[int] = None
     ):
         """
         Args:
@@ -27,11 +845,21 @@ class CodeChangeLogger:
             user_request: 사용자 요구사항
             reviews_dir: 문서 저장 디렉토리
             port: HTTP 서버 포트
+            diff_mode: 수정/버그 수정/리팩토링을 변경 전·후 전체 대신 unified diff로 저장
+            diff_context: diff 모드에서 변경 줄 앞뒤로 남길 줄 수
+            blob_store: 파일 내용을 reviews/.blobs에 한 번만 저장하고 문서에는 해시 링크만 기록
+            search_index: 저장할 때 전문 검색 색인(reviews/.search.db) 갱신. True면 없을 때
+                만들고, None(기본)이면 이미 있을 때만 갱신, False면 사용 안 함
+            retention_days: 지정하면 save_and_build 때마다 이보다 오래된 문서를 월별 보관 묶음으로 이동
         """
         self.project_name = project_name
         self.user_request = user_request
         self.reviews_dir = Path(reviews_dir)
         self.port = port
+        self.diff_mode = diff_mode
+        self.diff_context = diff_context
+        self.blobs = BlobStore(self.reviews_dir / ".blobs") if blob_store else None
+        self.retention_days = retention_days
         
         # 타임스탬프
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -39,11 +867,34 @@ class CodeChangeLogger:
         # 변경사항 목록
         self.changes: List[Dict[str, Any]] = []
         
+        # 이 로거가 선점한 문서 경로 (다시 저장하면 같은 문서를 갱신)
+        self.review_path: Optional[Path] = None
+        self._registered = False
+        
         # reviews 디렉토리 생성
         self.reviews_dir.mkdir(exist_ok=True)
         
         # README.md 초기화 (없으면)
         self._init_readme()
+        
+        # manifest 도입 이전의 문서가 있으면 한 번 재구성 (이후 저장은 추가만)
+        if not self.manifest_path.exists():
+            with self._lock():
+                if not self.manifest_path.exists():
+                    self.rebuild_manifest()
+        
+        # 검색 색인 (새로 만들었으면 기존 문서를 처음 한 번 색인)
+        self.search_index: Optional[SearchIndex] = None
+        search_path = self.reviews_dir / SEARCH_DB_NAME
+        if search_index or (search_index is None and search_path.exists()):
+            with self._lock():
+                try:
+                    self.search_index = SearchIndex(search_path)
+                except sqlite3.OperationalError as e:
+                    print(f"⚠️  검색 색인을 사용할 수 없습니다 (SQLite FTS5): {e}")
+                else:
+                    if not self.search_index.built:
+                        self.rebuild_search_index()
     
     def _init_readme(self):
         """README.md 초기화"""
@@ -73,7 +924,7 @@ Generated by Code Changelog Tracker
         self.changes.append({
             'type': 'creation',
             'file_path': file_path,
-            'content': content,
+            **self._body('content', content),
             'reason': reason
         })
     
@@ -88,8 +939,7 @@ Generated by Code Changelog Tracker
         self.changes.append({
             'type': 'modification',
             'file_path': file_path,
-            'old_content': old_content,
-            'new_content': new_content,
+            **self._content_change(file_path, old_content, new_content),
             'reason': reason
         })
     
@@ -103,7 +953,7 @@ Generated by Code Changelog Tracker
         self.changes.append({
             'type': 'deletion',
             'file_path': file_path,
-            'content': content,
+            **self._body('content', content),
             'reason': reason
         })
     
@@ -119,8 +969,7 @@ Generated by Code Changelog Tracker
         self.changes.append({
             'type': 'bug_fix',
             'file_path': file_path,
-            'old_content': old_content,
-            'new_content': new_content,
+            **self._content_change(file_path, old_content, new_content),
             'bug_desc': bug_desc,
             'fix_desc': fix_desc
         })
@@ -137,117 +986,194 @@ Generated by Code Changelog Tracker
         self.changes.append({
             'type': 'refactoring',
             'file_path': file_path,
-            'old_content': old_content,
-            'new_content': new_content,
+            **self._content_change(file_path, old_content, new_content),
             'refactor_type': refactor_type,
             'reason': reason
         })
     
-    def _generate_markdown(self) -> str:
-        """Markdown 문서 생성"""
-        lines = []
+    def log_from_git(
+        self,
+        rev_range: str = "HEAD",
+        reason: str = "",
+        repo_dir: str = ".",
+        paths: Optional[List[str]] = None
+    ) -> int:
+        """
+        git 저장소의 변경사항을 한 번에 기록
         
-        # 헤더
-        lines.append(f"# {self.project_name}")
-        lines.append("")
-        lines.append(f"**작성 시간**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append("")
+        범위(`A..B`, `A...B`)는 `git diff`, 커밋 하나는 `git show`(병합 커밋은
+        첫 번째 부모 기준)로 한 번만 실행하고 패치를 스트리밍으로 읽습니다.
+        생성/삭제는 패치의 추가/삭제 줄이 곧 파일 내용이고, 수정은 diff 모드와
+        같은 unified diff로 기록하므로 파일을 따로 읽지 않습니다.
         
-        if self.user_request:
-            lines.append(f"**요구사항**: {self.user_request}")
-            lines.append("")
+        Args:
+            rev_range: `main..feature` 같은 범위 또는 커밋 (`HEAD`, `abc123`)
+            reason: 변경 이유 (기본: `git <rev_range>`)
+            repo_dir: git 저장소 경로
+            paths: 기록할 경로 제한 (git pathspec)
+        
+        Returns:
+            기록한 변경 수
+        """
+        command = ['git', '-c', 'core.quotepath=false']
+        if '..' in rev_range:
+            command += ['diff', *GIT_DIFF_OPTIONS, f'-U{self.diff_context}', rev_range]
+        else:
+            command += ['show', '--format=', '--diff-merges=first-parent', *GIT_DIFF_OPTIONS,
+                        f'-U{self.diff_context}', rev_range]
+        command += ['--', *(paths or [])]
+        reason = reason or f"git {rev_range}"
+        
+        count = 0
+        # stderr는 임시 파일로: 패치를 다 읽기 전에 경고가 파이프를 채우면 git과 함께 멈춤
+        with tempfile.TemporaryFile() as errors, \
+                subprocess.Popen(command, cwd=repo_dir, stdout=subprocess.PIPE, stderr=errors) as process:
+            # 줄바꿈은 \n에서만 나눔 (파일 내용의 \r은 그대로)
+            patch = io.TextIOWrapper(process.stdout, encoding='utf-8', errors='replace', newline='\n')
+            for file_path, change_type, hunks in iter_git_patch(patch):
+                if change_type == 'creation':
+                    self.log_file_creation(file_path, _patch_content(hunks, '+'), reason)
+                elif change_type == 'deletion':
+                    self.log_file_deletion(file_path, _patch_content(hunks, '-'), reason)
+                else:
+                    body = hunks[1:] if hunks[:1] and hunks[0].startswith('@@') else hunks
+                    self.changes.append({
+                        'type': 'modification',
+                        'file_path': file_path,
+                        'diff': "\n".join([f"--- a/{file_path}", f"+++ b/{file_path}", *hunks]) if hunks else "",
+                        'added': sum(1 for line in body if line.startswith('+')),
+                        'removed': sum(1 for line in body if line.startswith('-')),
+                        'reason': reason
+                    })
+                count += 1
+            process.wait()
+            errors.seek(0)
+            stderr = errors.read().decode('utf-8', errors='replace')
+        
+        if process.returncode != 0:
+            raise RuntimeError(f"git 실행 실패 ({' '.join(command)}): {stderr.strip()}")
+        return count
+    
+    def _content_change(self, file_path: str, old_content: str, new_content: str) -> Dict[str, Any]:
+        """
+        변경 전/후 내용 필드
+        
+        diff 모드에서는 기록 시점에 unified diff를 계산해 hunk만 보관하므로
+        문서 크기와 메모리가 파일 크기가 아닌 변경 크기에 비례합니다.
+        """
+        if not self.diff_mode:
+            return {**self._body('old_content', old_content), **self._body('new_content', new_content)}
         
-        lines.append("---")
-        lines.append("")
+        diff_lines = list(difflib.unified_diff(
+            old_content.splitlines(),
+            new_content.splitlines(),
+            fromfile=f"a/{file_path}",
+            tofile=f"b/{file_path}",
+            n=self.diff_context,
+            lineterm=''
+        ))
+        hunks = diff_lines[2:]  # ---/+++ 헤더 제외
+        return {
+            'diff': "\n".join(diff_lines),
+            'added': sum(1 for line in hunks if line.startswith('+')),
+            'removed': sum(1 for line in hunks if line.startswith('-')),
+        }
+    
+    def _body(self, key: str, content: str) -> Dict[str, Any]:
+        """
+        파일 내용 필드: 그대로, 또는 blob 저장소 사용 시 해시 참조
+        ({key}_blob, {key}_lines, {key}_bytes)
+        """
+        if self.blobs is None:
+            return {key: content}
+        return {
+            f'{key}_blob': self.blobs.put(content),
+            f'{key}_lines': content.count("\n") + 1 if content else 0,
+            f'{key}_bytes': len(content.encode('utf-8')),
+        }
+    
+    @staticmethod
+    def _iter_body(change: Dict[str, Any], key: str) -> Iterator[str]:
+        """코드 블록 또는 blob 링크 (뷰어가 눌렀을 때 풀어서 표시)"""
+        digest = change.get(f'{key}_blob')
+        if digest is None:
+            yield "```\n"
+            yield change[key]  # 복사하지 않고 그대로 씀
+            yield "\n```\n"
+            return
+        size_kb = change[f'{key}_bytes'] / 1024
+        yield (
+            f"[📦 {digest[:12]} · {change[f'{key}_lines']:,}줄 · {size_kb:,.1f} KB]"
+            f"(.blobs/{digest[:2]}/{digest}.z)\n"
+        )
+    
+    @classmethod
+    def _iter_content(cls, change: Dict[str, Any]) -> Iterator[str]:
+        """변경 전/후 블록 또는 ```diff 블록"""
+        if 'diff' in change:
+            yield f"**변경 내용** (+{change['added']} / -{change['removed']}):\n```diff\n"
+            yield change['diff'] or "(변경 없음)"
+            yield "\n```\n\n"
+            return
+        yield "**변경 전**:\n"
+        yield from cls._iter_body(change, 'old_content')
+        yield "\n**변경 후**:\n"
+        yield from cls._iter_body(change, 'new_content')
+        yield "\n"
+    
+    def _iter_markdown(self) -> Iterator[str]:
+        """
+        Markdown 문서를 변경 하나씩 조각으로 생성
+        
+        파일 내용은 change에 있는 문자열을 그대로 내보내므로 문서 전체나
+        줄 목록을 메모리에 만들지 않습니다 (save_review가 바로 파일에 씀).
+        """
+        # 헤더
+        yield f"# {self.project_name}\n\n"
+        yield f"**작성 시간**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        if self.user_request:
+            yield f"**요구사항**: {self.user_request}\n\n"
+        yield "---\n\n"
         
         # 변경사항 목록
         for i, change in enumerate(self.changes, 1):
             change_type = change['type']
-            file_path = change['file_path']
-            
-            lines.append(f"## {i}. {file_path}")
-            lines.append("")
+            yield f"## {i}. {change['file_path']}\n\n"
             
             if change_type == 'creation':
-                lines.append("**변경 유형**: 파일 생성 ✨")
-                lines.append("")
-                lines.append(f"**이유**: {change['reason']}")
-                lines.append("")
-                lines.append("**내용**:")
-                lines.append("```")
-                lines.append(change['content'])
-                lines.append("```")
-                lines.append("")
+                yield f"**변경 유형**: 파일 생성 ✨\n\n**이유**: {change['reason']}\n\n**내용**:\n"
+                yield from self._iter_body(change, 'content')
+                yield "\n"
             
             elif change_type == 'modification':
-                lines.append("**변경 유형**: 파일 수정 ✏️")
-                lines.append("")
-                lines.append(f"**이유**: {change['reason']}")
-                lines.append("")
-                lines.append("**변경 전**:")
-                lines.append("```")
-                lines.append(change['old_content'])
-                lines.append("```")
-                lines.append("")
-                lines.append("**변경 후**:")
-                lines.append("```")
-                lines.append(change['new_content'])
-                lines.append("```")
-                lines.append("")
+                yield f"**변경 유형**: 파일 수정 ✏️\n\n**이유**: {change['reason']}\n\n"
+                yield from self._iter_content(change)
             
             elif change_type == 'deletion':
-                lines.append("**변경 유형**: 파일 삭제 🗑️")
-                lines.append("")
-                lines.append(f"**이유**: {change['reason']}")
-                lines.append("")
-                lines.append("**삭제된 내용**:")
-                lines.append("```")
-                lines.append(change['content'])
-                lines.append("```")
-                lines.append("")
+                yield f"**변경 유형**: 파일 삭제 🗑️\n\n**이유**: {change['reason']}\n\n**삭제된 내용**:\n"
+                yield from self._iter_body(change, 'content')
+                yield "\n"
             
             elif change_type == 'bug_fix':
-                lines.append("**변경 유형**: 버그 수정 🐛")
-                lines.append("")
-                lines.append(f"**버그 설명**: {change['bug_desc']}")
-                lines.append(f"**수정 내용**: {change['fix_desc']}")
-                lines.append("")
-                lines.append("**변경 전**:")
-                lines.append("```")
-                lines.append(change['old_content'])
-                lines.append("```")
-                lines.append("")
-                lines.append("**변경 후**:")
-                lines.append("```")
-                lines.append(change['new_content'])
-                lines.append("```")
-                lines.append("")
+                yield (
+                    f"**변경 유형**: 버그 수정 🐛\n\n"
+                    f"**버그 설명**: {change['bug_desc']}\n"
+                    f"**수정 내용**: {change['fix_desc']}\n\n"
+                )
+                yield from self._iter_content(change)
             
             elif change_type == 'refactoring':
-                lines.append("**변경 유형**: 리팩토링 ♻️")
-                lines.append("")
-                lines.append(f"**리팩토링 유형**: {change['refactor_type']}")
-                lines.append(f"**이유**: {change['reason']}")
-                lines.append("")
-                lines.append("**변경 전**:")
-                lines.append("```")
-                lines.append(change['old_content'])
-                lines.append("```")
-                lines.append("")
-                lines.append("**변경 후**:")
-                lines.append("```")
-                lines.append(change['new_content'])
-                lines.append("```")
-                lines.append("")
+                yield (
+                    f"**변경 유형**: 리팩토링 ♻️\n\n"
+                    f"**리팩토링 유형**: {change['refactor_type']}\n"
+                    f"**이유**: {change['reason']}\n\n"
+                )
+                yield from self._iter_content(change)
             
-            lines.append("---")
-            lines.append("")
+            yield "---\n\n"
         
         # 푸터
-        lines.append(f"**총 변경사항**: {len(self.changes)}개")
-        lines.append("")
-        
-        return "\n".join(lines)
+        yield f"**총 변경사항**: {len(self.changes)}개\n"
     
     def save_review(self) -> Path:
         """리뷰 문서 저장"""
@@ -255,78 +1181,384 @@ Generated by Code Changelog Tracker
             print("⚠️  기록된 변경사항이 없습니다.")
             return None
         
-        # Markdown 생성
-        markdown = self._generate_markdown()
+        # 파일 저장 (Markdown을 변경 하나씩 바로 씀)
+        if self.review_path is None:
+            self.review_path = self._claim_review_path()
+        file_path = self.review_path
+        atomic_write_chunks(file_path, self._iter_markdown())
         
-        # 파일 저장
-        file_path = self.reviews_dir / f"{self.timestamp}.md"
-        file_path.write_text(markdown, encoding='utf-8')
+        if self.search_index is not None:
+            self.search_index.replace_review(file_path.name, self._search_rows())
+            if self.search_index.needs_rebuild:
+                with self._lock():
+                    self.rebuild_search_index()
         
         print(f"✓ 변경 이력 저장: {file_path}")
         return file_path
     
-    def update_summary(self):
-        """SUMMARY.md 업데이트"""
+    def _search_rows(self) -> Iterator[Tuple[str, str, str, str]]:
+        """검색 색인 행: (file_path, change_type, reason, content), 변경 하나씩"""
+        for change in self.changes:
+            change_type = change['type']
+            reason = " ".join(
+                change[key] for key in ('reason', 'bug_desc', 'fix_desc', 'refactor_type') if change.get(key)
+            )
+            if 'diff' in change:
+                content = change['diff']
+            else:
+                content = "\n".join(
+                    self._body_text(change, key) for key in ('content', 'new_content', 'old_content')
+                    if key in change or f'{key}_blob' in change
+                )
+            yield change['file_path'], f"{change_type} {CHANGE_LABELS[change_type]}", reason, content
+    
+    def _body_text(self, change: Dict[str, Any], key: str) -> str:
+        """파일 내용 필드의 원문 (blob 참조는 저장소에서 읽음)"""
+        digest = change.get(f'{key}_blob')
+        return change[key] if digest is None else self.blobs.get(digest)
+    
+    def _claim_review_path(self) -> Path:
+        """
+        같은 초에 저장하는 다른 로거와 겹치지 않는 문서 경로 선점
+        
+        O_CREAT | O_EXCL로 빈 파일을 만들어 이름을 차지하므로 잠금이 필요 없습니다.
+        """
+        n = 1
+        while True:
+            name = f"{self.timestamp}.md" if n == 1 else f"{self.timestamp}_{n}.md"
+            path = self.reviews_dir / name
+            try:
+                fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                n += 1
+                continue
+            os.close(fd)
+            return path
+    
+    def _lock(self):
+        """manifest/SUMMARY/index 갱신 잠금"""
+        return file_lock(self.reviews_dir / ".lock")
+    
+    @property
+    def manifest_path(self) -> Path:
+        return self.reviews_dir / MANIFEST_NAME
+    
+    def _manifest_entry(self, file_path: Path) -> Dict[str, Any]:
+        """manifest.jsonl에 기록할 문서 정보"""
+        return {
+            'file': file_path.name,
+            'title': display_name(file_path.stem),
+            'project': self.project_name,
+            'request': self.user_request,
+            'changes': len(self.changes),
+            'files': [change['file_path'] for change in self.changes],
+        }
+    
+    def _append_manifest(self, entry: Dict[str, Any]):
+        """
+        manifest.jsonl에 한 줄 추가 (O_APPEND 한 번 쓰기)
+        
+        쓰기 중단으로 마지막 줄이 잘려 있으면 줄을 바꾼 뒤 씁니다 (잘린 줄에
+        이어 붙으면 새 기록까지 읽을 수 없게 됨).
+        """
+        line = json.dumps(entry, ensure_ascii=False, separators=(',', ':'))
+        torn = False
+        try:
+            with open(self.manifest_path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                torn = f.read(1) != b"\n"
+        except OSError:
+            pass  # 없거나 빈 파일
+        with open(self.manifest_path, 'a', encoding='utf-8') as f:
+            f.write(("\n" if torn else "") + line + "\n")
+    
+    @property
+    def manifest_pages_dir(self) -> Path:
+        return self.reviews_dir / MANIFEST_PAGES_DIR
+    
+    def write_manifest_pages(self, entries: Optional[List[Dict[str, Any]]] = None):
+        """
+        뷰어용 문서 목록 페이지 전체 재작성
+        
+        index.json은 {'total', 'page_size', 'groups'}이며 groups는 저장 순으로
+        연속된 같은 날짜 문서 수 [[날짜, 개수], ...]입니다. 뷰어는 이것만으로
+        전체 행(날짜 머리글 + 문서)을 배치하고 보이는 행의 페이지만 받습니다.
+        """
+        if entries is None:
+            entries = self.load_manifest()
+        pages_dir = self.manifest_pages_dir
+        pages_dir.mkdir(exist_ok=True)
+        
+        groups: List[List[Any]] = []
+        for entry in entries:
+            group = sidebar_group(entry)
+            if groups and groups[-1][0] == group:
+                groups[-1][1] += 1
+            else:
+                groups.append([group, 1])
+        
+        page_count = 0
+        for page_count, start in enumerate(range(0, len(entries), MANIFEST_PAGE_SIZE), 1):
+            page = [sidebar_entry(entry) for entry in entries[start:start + MANIFEST_PAGE_SIZE]]
+            atomic_write(pages_dir / f"page-{page_count - 1}.json", json.dumps(page, ensure_ascii=False))
+        for stale in pages_dir.glob("page-*.json"):
+            if int(stale.stem.split("-", 1)[1]) >= page_count:
+                stale.unlink()
+        
+        self._write_pages_index({'total': len(entries), 'page_size': MANIFEST_PAGE_SIZE, 'groups': groups})
+    
+    def _write_pages_index(self, index: Dict[str, Any]):
+        atomic_write(self.manifest_pages_dir / "index.json", json.dumps(index, ensure_ascii=False))
+    
+    def _append_manifest_page(self, entry: Dict[str, Any]):
+        """
+        새로 등록된 문서를 마지막 페이지에 추가 (마지막 페이지와 index.json만 다시 씀)
+        
+        다시 저장한 문서가 이미 마지막 문서면 그 자리에서 갱신하고, 다른 자리에
+        있으면(이후 다른 문서가 저장됨) 목록 순서가 바뀌므로 전체를 다시 씁니다.
+        """
+        index_path = self.manifest_pages_dir / "index.json"
+        if not index_path.exists() or (self._registered and not self._is_last_page_entry(entry)):
+            self.write_manifest_pages()
+            return
+        
+        index = json.loads(index_path.read_text(encoding='utf-8'))
+        total, page_size = index['total'], index['page_size']
+        page_no = (total - 1) // page_size if total else 0
+        page_path = self.manifest_pages_dir / f"page-{page_no}.json"
+        page = json.loads(page_path.read_text(encoding='utf-8')) if total else []
+        
+        if self._registered:
+            page[-1] = sidebar_entry(entry)
+        else:
+            if len(page) == page_size:
+                page_no += 1
+                page_path = self.manifest_pages_dir / f"page-{page_no}.json"
+                page = []
+            page.append(sidebar_entry(entry))
+            index['total'] = total + 1
+            group = sidebar_group(entry)
+            if index['groups'] and index['groups'][-1][0] == group:
+                index['groups'][-1][1] += 1
+            else:
+                index['groups'].append([group, 1])
+        
+        atomic_write(page_path, json.dumps(page, ensure_ascii=False))
+        self._write_pages_index(index)
+    
+    def _is_last_page_entry(self, entry: Dict[str, Any]) -> bool:
+        """entry가 목록의 마지막 문서인지"""
+        try:
+            index = json.loads((self.manifest_pages_dir / "index.json").read_text(encoding='utf-8'))
+            page_no = (index['total'] - 1) // index['page_size']
+            page = json.loads((self.manifest_pages_dir / f"page-{page_no}.json").read_text(encoding='utf-8'))
+        except (OSError, ValueError, ZeroDivisionError):
+            return False
+        return bool(page) and page[-1]['file'] == entry['file']
+    
+    def load_manifest(self) -> List[Dict[str, Any]]:
+        """manifest.jsonl의 문서 목록 (파일명당 마지막 기록, 저장 순서)"""
+        entries = {}
+        if self.manifest_path.exists():
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                        entries.pop(entry['file'], None)
+                    except (json.JSONDecodeError, KeyError, TypeError):
+                        continue  # 쓰기 중단으로 잘린 줄
+                    entries[entry['file']] = entry
+        return list(entries.values())
+    
+    def register_review(self, file_path: Path):
+        """
+        저장된 문서를 목록에 등록: manifest.jsonl과 SUMMARY.md에 한 줄씩 추가하고
+        뷰어용 목록의 마지막 페이지를 갱신.
+        
+        기존 문서를 다시 읽지 않으므로 이력 크기와 무관하게 O(1)입니다.
+        같은 문서를 다시 등록하면 manifest에는 새 기록이 추가되고(마지막
+        기록이 유효) SUMMARY.md는 그대로 둡니다.
+        """
         summary_path = self.reviews_dir / "SUMMARY.md"
+        with self._lock():
+            if not self.manifest_path.exists():
+                self.rebuild_manifest()
+                self.update_summary()
+            else:
+                first = not self._registered
+                entry = self._manifest_entry(file_path)
+                self._append_manifest(entry)
+                self._append_manifest_page(entry)
+                if not summary_path.exists():
+                    self.update_summary()
+                elif first:
+                    with open(summary_path, 'a', encoding='utf-8') as f:
+                        f.write(f"* [{display_name(file_path.stem)}]({file_path.name})\n")
+            self._registered = True
+            self.update_index_html()
+    
+    def rebuild_manifest(self) -> int:
+        """
+        reviews/*.md를 스캔해 manifest.jsonl 재구성 (`build --full`)
         
-        # 모든 MD 파일 찾기 (README, SUMMARY 제외)
+        Returns:
+            등록된 문서 수
+        """
         md_files = sorted(
-            [f for f in self.reviews_dir.glob("*.md") 
-             if f.name not in ["README.md", "SUMMARY.md"]],
-            reverse=True  # 최신순
+            f for f in self.reviews_dir.glob("*.md") if f.name not in RESERVED_DOCS
         )
         
-        lines = [
-            "# Summary",
-            "",
-            "* [홈](README.md)",
-            ""
+        lines = []
+        for md_file in md_files:
+            text = md_file.read_text(encoding='utf-8')
+            project = text.split("\n", 1)[0].lstrip("# ").strip()
+            request = re.search(r"^\*\*요구사항\*\*: (.*)$", text, re.M)
+            total = re.search(r"^\*\*총 변경사항\*\*: (\d+)개", text, re.M)
+            lines.append(json.dumps({
+                'file': md_file.name,
+                'title': display_name(md_file.stem),
+                'project': project,
+                'request': request.group(1) if request else "",
+                'changes': int(total.group(1)) if total else 0,
+                'files': re.findall(r"^## \d+\. (.+)$", text, re.M),
+            }, ensure_ascii=False, separators=(',', ':')))
+        
+        # 보관 묶음은 문서보다 오래되었으므로 앞에 (월 순)
+        archives = [
+            json.dumps(archive_entry(bundle), ensure_ascii=False, separators=(',', ':'))
+            for bundle in self.iter_archives()
         ]
+        lines = archives + lines
         
-        for md_file in md_files:
-            # 타임스탬프를 읽기 좋은 형식으로
-            timestamp = md_file.stem
-            try:
-                dt = datetime.strptime(timestamp, "%Y%m%d_%H%M%S")
-                display_name = dt.strftime("%Y-%m-%d %H:%M:%S")
-            except:
-                display_name = timestamp
-            
-            lines.append(f"* [{display_name}]({md_file.name})")
+        atomic_write(self.manifest_path, "".join(line + "\n" for line in lines))
+        self.write_manifest_pages()
+        print(f"✓ manifest 재구성: {len(lines)}개 문서")
+        return len(lines)
+    
+    def rebuild_search_index(self) -> int:
+        """
+        reviews/*.md를 파싱해 검색 색인 재구성 (`build --full`)
         
-        summary_path.write_text("\n".join(lines), encoding='utf-8')
-        print(f"✓ SUMMARY.md 업데이트: {len(md_files)}개 문서")
+        Returns:
+            색인된 변경 수
+        """
+        if self.search_index is None:
+            return 0
+        blobs = self.blobs or BlobStore(self.reviews_dir / ".blobs")
+        self.search_index.clear()
+        total = 0
+        for md_file in sorted(self.reviews_dir.glob("*.md")):
+            if md_file.name in RESERVED_DOCS:
+                continue
+            rows = parse_review_changes(md_file.read_text(encoding='utf-8'), blobs)
+            self.search_index.replace_review(md_file.name, rows)
+            total += len(rows)
+        for bundle in self.iter_archives():
+            for doc in bundle['docs']:
+                rows = parse_review_changes(doc['markdown'], blobs)
+                self.search_index.replace_review(f"{ARCHIVE_DIR_NAME}/{bundle['month']}/{doc['file']}", rows)
+                total += len(rows)
+        self.search_index.mark_built()
+        print(f"✓ 검색 색인 재구성: {total}개 변경")
+        return total
     
-    def update_index_html(self):
-        """index.html 업데이트"""
-        index_path = self.reviews_dir / "index.html"
+    @property
+    def archive_dir(self) -> Path:
+        return self.reviews_dir / ARCHIVE_DIR_NAME
+    
+    def iter_archives(self) -> Iterator[Dict[str, Any]]:
+        """월별 보관 묶음 (월 순)"""
+        if self.archive_dir.is_dir():
+            for path in sorted(self.archive_dir.glob("*.json.gz")):
+                yield read_archive(path)
+    
+    def compact(self, keep_days: int = 30, now: Optional[datetime] = None) -> List[Path]:
+        """
+        보존 정책 적용: keep_days일보다 오래된 문서를 월별 보관 묶음으로 이동
         
-        # 모든 MD 파일 찾기 (README, SUMMARY 제외)
-        md_files = sorted(
-            [f for f in self.reviews_dir.glob("*.md") 
-             if f.name not in ["README.md", "SUMMARY.md"]],
-            reverse=True  # 최신순
-        )
+        묶음(`archives/<YYYY-MM>.json.gz`)은 manifest 항목과 Markdown을 담은
+        gzip JSON이며, 같은 달 묶음이 있으면 합칩니다. 묶음을 먼저 쓰고
+        manifest를 다시 쓴 뒤 원본 문서를 지우므로 중간에 멈춰도 문서를
+        잃지 않습니다. 검색 색인의 문서 주소는 `archives/<YYYY-MM>/<문서>.md`로 바뀝니다.
         
-        # 파일 목록 생성
-        file_list_items = []
-        for i, md_file in enumerate(md_files):
-            timestamp = md_file.stem
-            try:
-                dt = datetime.strptime(timestamp, "%Y%m%d_%H%M%S")
-                display_name = dt.strftime("%Y-%m-%d %H:%M:%S")
-            except:
-                display_name = timestamp
+        Returns:
+            쓴 보관 묶음 경로
+        """
+        cutoff = (now or datetime.now()) - timedelta(days=keep_days)
+        with self._lock():
+            entries = self.load_manifest()
+            by_month: Dict[str, List[Dict[str, Any]]] = {}
+            for entry in entries:
+                saved = None if entry.get('archive') else review_time(entry['file'])
+                if saved is not None and saved < cutoff and (self.reviews_dir / entry['file']).exists():
+                    by_month.setdefault(saved.strftime("%Y-%m"), []).append(entry)
+            if not by_month:
+                return []
             
-            active_class = " class='active'" if i == 0 else ""
-            file_list_items.append(
-                f"        <li{active_class}><a href='#{md_file.name}'>{display_name}</a></li>"
-            )
+            self.archive_dir.mkdir(exist_ok=True)
+            written = []
+            archived = {}
+            for month, month_entries in sorted(by_month.items()):
+                path = self.archive_dir / f"{month}.json.gz"
+                bundle = read_archive(path) if path.exists() else {'month': month, 'docs': []}
+                docs = {doc['file']: doc for doc in bundle['docs']}
+                for entry in month_entries:
+                    markdown = (self.reviews_dir / entry['file']).read_text(encoding='utf-8')
+                    docs[entry['file']] = {**entry, 'markdown': markdown}
+                    archived[entry['file']] = month
+                bundle['docs'] = [docs[name] for name in sorted(docs)]
+                data = json.dumps(bundle, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+                atomic_write_bytes(path, gzip.compress(data, compresslevel=9, mtime=0))
+                written.append(path)
+            
+            # manifest: 보관 묶음(월 순) + 남은 문서 (저장 순)
+            bundles = {entry['month']: entry for entry in entries if entry.get('archive')}
+            bundles.update({bundle['month']: archive_entry(bundle) for bundle in map(read_archive, written)})
+            kept = [entry for entry in entries if not entry.get('archive') and entry['file'] not in archived]
+            lines = [
+                json.dumps(entry, ensure_ascii=False, separators=(',', ':'))
+                for entry in [bundles[month] for month in sorted(bundles)] + kept
+            ]
+            atomic_write(self.manifest_path, "".join(line + "\n" for line in lines))
+            self.write_manifest_pages()
+            
+            for name, month in archived.items():
+                if self.search_index is not None:
+                    self.search_index.rename_review(name, f"{ARCHIVE_DIR_NAME}/{month}/{name}")
+                (self.reviews_dir / name).unlink()
+            
+            self.update_summary()
+            self.update_index_html()
         
-        file_list_html = "\n".join(file_list_items)
+        print(f"✓ 보관: {len(archived)}개 문서 -> {len(written)}개 월별 묶음")
+        return written
+    
+    def search(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """전문 검색 (순위순, SearchIndex.search 참고)"""
+        if self.search_index is None:
+            return []
+        return self.search_index.search(query, limit)
+    
+    def update_summary(self):
+        """SUMMARY.md 전체 재작성 (manifest 기준, 저장 순서)"""
+        summary_path = self.reviews_dir / "SUMMARY.md"
+        entries = self.load_manifest()
         
-        # 기본 파일 (최신 파일)
-        default_file = md_files[0].name if md_files else "README.md"
+        lines = [f"* [{entry['title']}]({entry['file']})\n" for entry in entries]
+        atomic_write(summary_path, SUMMARY_HEADER + "".join(lines))
+        print(f"✓ SUMMARY.md 업데이트: {len(entries)}개 문서")
+    
+    def update_index_html(self):
+        """
+        index.html 업데이트
+        
+        문서 목록은 뷰어가 manifest/ 페이지에서 읽으므로 index.html은 정적이며,
+        내용이 바뀔 때만 다시 씁니다.
+        """
+        index_path = self.reviews_dir / "index.html"
         
         # HTML 템플릿
         html_content = f"""<!DOCTYPE html>
@@ -335,7 +1567,6 @@ Generated by Code Changelog Tracker
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{self.project_name} - 코드 변경 이력</title>
-    <script src="https://cdn.jsdelivr.net/npm/marked/marked.min.js"></script>
     <style>
         * {{
             margin: 0;
@@ -355,7 +1586,9 @@ Generated by Code Changelog Tracker
             width: 280px;
             background: #161b22;
             border-right: 1px solid #30363d;
-            overflow-y: auto;
+            display: flex;
+            flex-direction: column;
+            overflow: hidden;
             padding: 20px;
         }}
         
@@ -390,11 +1623,78 @@ Generated by Code Changelog Tracker
             color: #58a6ff;
         }}
         
-        .sidebar li.active a {{
+        .sidebar li.active a,
+        .file-list .row.active a {{
             background: #1f6feb;
             color: #fff;
         }}
         
+        /* 가상 스크롤: 보이는 행만 절대 위치로 그림 (행 높이 = ROW_HEIGHT) */
+        .file-list {{
+            flex: 1;
+            overflow-y: auto;
+            position: relative;
+        }}
+        
+        .file-list .row {{
+            position: absolute;
+            left: 0;
+            right: 0;
+            height: 36px;
+        }}
+        
+        .file-list .row a {{
+            white-space: nowrap;
+            overflow: hidden;
+            text-overflow: ellipsis;
+        }}
+        
+        .file-list .row.group {{
+            color: #58a6ff;
+            font-size: 12px;
+            font-weight: 600;
+            padding: 14px 12px 0;
+        }}
+        
+        #search-results {{
+            flex: 1;
+            overflow-y: auto;
+        }}
+        
+        .search {{
+            width: 100%;
+            margin-bottom: 12px;
+            padding: 8px 10px;
+            background: #0d1117;
+            color: #c9d1d9;
+            border: 1px solid #30363d;
+            border-radius: 6px;
+            font-size: 14px;
+        }}
+        
+        .search-meta {{
+            color: #8b949e;
+            font-size: 12px;
+            padding: 0 12px 6px;
+        }}
+        
+        .search-path {{
+            display: block;
+            color: #c9d1d9;
+        }}
+        
+        .search-snippet {{
+            display: block;
+            font-size: 12px;
+            white-space: pre-wrap;
+            word-break: break-all;
+        }}
+        
+        .sidebar mark {{
+            background: #bb800926;
+            color: #e3b341;
+        }}
+        
         .content {{
             flex: 1;
             overflow-y: auto;
@@ -482,9 +1782,9 @@ Generated by Code Changelog Tracker
 <body>
     <div class="sidebar">
         <h2>📋 변경 이력</h2>
-        <ul id="file-list">
-{file_list_html}
-        </ul>
+        <input id="search" class="search" type="search" placeholder="파일 · 이유 · 내용 검색" autocomplete="off">
+        <ul id="search-results" hidden></ul>
+        <div id="file-list" class="file-list"><div id="file-list-spacer"></div></div>
     </div>
     
     <div class="content">
@@ -495,70 +1795,380 @@ Generated by Code Changelog Tracker
     
     <script>
         const contentDiv = document.getElementById('markdown-content');
-        const fileList = document.getElementById('file-list');
+        const listView = document.getElementById('file-list');
+        const spacer = document.getElementById('file-list-spacer');
+        
+        // blob 링크(.blobs/<해시>.z): 누르면 받아서 zlib 해제 후 코드 블록으로 표시
+        async function inflate(url, format = 'deflate') {{
+            const response = await fetch(url);
+            if (!response.ok) throw new Error(response.statusText);
+            const stream = response.body.pipeThrough(new DecompressionStream(format));
+            return await new Response(stream).text();
+        }}
+        
+        // 월별 보관 묶음 ({ARCHIVE_DIR_NAME}/<YYYY-MM>.json.gz): 펼치거나 그 달 문서를 열 때만 받음
+        const archives = new Map();
+        function loadArchive(month) {{
+            if (!archives.has(month)) {{
+                const bundle = inflate(`{ARCHIVE_DIR_NAME}/${{month}}.json.gz`, 'gzip').then(JSON.parse);
+                bundle.catch(() => archives.delete(month));
+                archives.set(month, bundle);
+            }}
+            return archives.get(month);
+        }}
+        
+        function resolveBlobs(root) {{
+            root.querySelectorAll('a[href^=".blobs/"]').forEach((link) => {{
+                link.addEventListener('click', async (e) => {{
+                    e.preventDefault();
+                    if (link.dataset.loaded) return;
+                    link.dataset.loaded = '1';
+                    const pre = document.createElement('pre');
+                    const code = document.createElement('code');
+                    code.textContent = '불러오는 중...';
+                    pre.appendChild(code);
+                    link.parentElement.after(pre);
+                    try {{
+                        code.textContent = await inflate(link.getAttribute('href'));
+                    }} catch (error) {{
+                        code.textContent = '❌ blob을 불러올 수 없습니다.';
+                    }}
+                }});
+            }});
+        }}
+        
+        function loadScript(src) {{
+            return new Promise((resolve, reject) => {{
+                const script = document.createElement('script');
+                script.src = src;
+                script.onload = resolve;
+                script.onerror = reject;
+                document.head.appendChild(script);
+            }});
+        }}
+        
+        // `serve` 서버는 렌더링된 HTML을 제공 (캐시됨). 정적 호스팅(GitHub Pages 등)에서는
+        // 원본 Markdown을 받아 marked로 렌더링
+        async function renderMarkdown(filename) {{
+            const rendered = await fetch('_render/' + filename);
+            if (rendered.ok) return await rendered.text();
+            let markdown;
+            const archived = filename.match(/^{ARCHIVE_DIR_NAME}\\/([^/]+)\\/(.+)$/);
+            if (archived) {{
+                const bundle = await loadArchive(archived[1]);
+                const doc = bundle.docs.find((doc) => doc.file === archived[2]);
+                if (!doc) throw new Error('not found');
+                markdown = doc.markdown;
+            }} else {{
+                const response = await fetch(filename);
+                if (!response.ok) throw new Error(response.statusText);
+                markdown = await response.text();
+            }}
+            if (!window.marked) await loadScript('https://cdn.jsdelivr.net/npm/marked/marked.min.js');
+            return marked.parse(markdown);
+        }}
+        
+        // 렌더링된 문서 (최근 사용 순, 이웃 문서 미리 받기에도 사용)
+        const MAX_CACHED_DOCS = 20;
+        const docCache = new Map();
+        function fetchDoc(filename) {{
+            let doc = docCache.get(filename);
+            if (doc) {{
+                docCache.delete(filename);
+            }} else {{
+                doc = renderMarkdown(filename);
+                doc.catch(() => docCache.delete(filename));
+            }}
+            docCache.set(filename, doc);
+            while (docCache.size > MAX_CACHED_DOCS) docCache.delete(docCache.keys().next().value);
+            return doc;
+        }}
+        
+        // 문서 목록: {MANIFEST_PAGES_DIR}/index.json ({{total, page_size, groups}}) + 페이지 파일
+        // ({MANIFEST_PAGES_DIR}/page-<n>.json, 저장 순). 보이는 행의 페이지만 받고, 보이는 행만 그림.
+        const ROW_HEIGHT = 36;
+        const OVERSCAN = 10;
+        let manifest = {{total: 0, page_size: 1, groups: []}};
+        let rows = new Int32Array(0);   // 최신순 행: 0 이상은 문서 번호, 음수는 -(그룹 번호 + 1)
+        const pages = new Map();        // 페이지 번호 -> Promise<문서 목록>
+        const loadedPages = new Map();  // 페이지 번호 -> 문서 목록
+        const fileIndex = new Map();    // 파일 -> 문서 번호 (받은 페이지만)
+        let activeFile = null;
+        
+        function buildRows() {{
+            const groups = manifest.groups;
+            rows = new Int32Array(manifest.total + groups.length);
+            let row = 0;
+            let index = manifest.total;
+            for (let g = groups.length - 1; g >= 0; g--) {{
+                rows[row++] = -(g + 1);
+                for (let i = 0; i < groups[g][1]; i++) rows[row++] = --index;
+            }}
+            spacer.style.height = rows.length * ROW_HEIGHT + 'px';
+        }}
+        
+        function loadPage(page) {{
+            if (!pages.has(page)) {{
+                const request = fetch(`{MANIFEST_PAGES_DIR}/page-${{page}}.json`, {{cache: 'no-cache'}}).then((response) => {{
+                    if (!response.ok) throw new Error(response.statusText);
+                    return response.json();
+                }}).then((entries) => {{
+                    loadedPages.set(page, entries);
+                    entries.forEach((entry, i) => fileIndex.set(entry.file, page * manifest.page_size + i));
+                    return entries;
+                }});
+                request.catch(() => pages.delete(page));
+                pages.set(page, request);
+            }}
+            return pages.get(page);
+        }}
+        
+        function entryAt(index) {{
+            const page = Math.floor(index / manifest.page_size);
+            const entries = loadedPages.get(page);
+            return entries ? entries[index - page * manifest.page_size] : undefined;
+        }}
+        
+        function renderRows() {{
+            const top = listView.scrollTop;
+            const first = Math.max(0, Math.floor(top / ROW_HEIGHT) - OVERSCAN);
+            const last = Math.min(rows.length, Math.ceil((top + listView.clientHeight) / ROW_HEIGHT) + OVERSCAN);
+            const fragment = document.createDocumentFragment();
+            const missing = new Set();
+            for (let row = first; row < last; row++) {{
+                const div = document.createElement('div');
+                div.className = 'row';
+                div.style.top = row * ROW_HEIGHT + 'px';
+                const value = rows[row];
+                if (value < 0) {{
+                    div.classList.add('group');
+                    div.textContent = manifest.groups[-value - 1][0];
+                }} else {{
+                    const entry = entryAt(value);
+                    const link = document.createElement('a');
+                    if (entry) {{
+                        link.href = '#' + entry.file;
+                        link.textContent = entry.archive ? '🗄️ ' + entry.title : entry.title;
+                        if (entry.archive) link.dataset.month = entry.month;
+                        if (entry.file === activeFile) div.classList.add('active');
+                    }} else {{
+                        link.textContent = '…';
+                        missing.add(Math.floor(value / manifest.page_size));
+                    }}
+                    div.appendChild(link);
+                }}
+                fragment.appendChild(div);
+            }}
+            listView.replaceChildren(spacer, fragment);
+            for (const page of missing) loadPage(page).then(scheduleRender, () => {{}});
+        }}
+        
+        let renderPending = false;
+        function scheduleRender() {{
+            if (renderPending) return;
+            renderPending = true;
+            requestAnimationFrame(() => {{
+                renderPending = false;
+                renderRows();
+            }});
+        }}
+        listView.addEventListener('scroll', scheduleRender);
+        window.addEventListener('resize', scheduleRender);
+        
+        async function loadManifest() {{
+            const response = await fetch('{MANIFEST_PAGES_DIR}/index.json', {{cache: 'no-cache'}});
+            if (!response.ok) throw new Error(response.statusText);
+            manifest = await response.json();
+            buildRows();
+            // 최신 문서가 있는 마지막 페이지만 먼저 받음
+            if (manifest.total) await loadPage(Math.floor((manifest.total - 1) / manifest.page_size));
+        }}
+        
+        // 목록에서 앞뒤 문서를 미리 받아 두어 이동할 때 바로 표시
+        function prefetchNeighbours(filename) {{
+            const index = fileIndex.get(filename);
+            if (index === undefined) return;
+            for (const neighbour of [index - 1, index + 1]) {{
+                const entry = neighbour >= 0 && neighbour < manifest.total ? entryAt(neighbour) : undefined;
+                if (entry && !entry.archive) fetchDoc(entry.file).catch(() => {{}});
+            }}
+        }}
         
         // Markdown 파일 로드 및 렌더링
         async function loadMarkdown(filename) {{
             try {{
-                const response = await fetch(filename);
-                const markdown = await response.text();
-                contentDiv.innerHTML = marked.parse(markdown);
-                
+                contentDiv.innerHTML = await fetchDoc(filename);
+                resolveBlobs(contentDiv);
+        
                 // 활성 링크 업데이트
-                fileList.querySelectorAll('li').forEach(li => li.classList.remove('active'));
-                const activeLink = fileList.querySelector(`a[href="#${{filename}}"]`);
+                activeFile = filename;
+                renderRows();
+                searchResults.querySelectorAll('li.active').forEach(li => li.classList.remove('active'));
+                const activeLink = searchResults.querySelector(`a[href="#${{CSS.escape(filename)}}"]`);
                 if (activeLink) {{
                     activeLink.parentElement.classList.add('active');
                 }}
-                
+        
                 // URL 업데이트
                 window.location.hash = filename;
+                prefetchNeighbours(filename);
             }} catch (error) {{
                 contentDiv.innerHTML = '<div class="loading">❌ 파일을 불러올 수 없습니다.</div>';
             }}
         }}
         
-        // 링크 클릭 이벤트
-        fileList.addEventListener('click', (e) => {{
-            if (e.target.tagName === 'A') {{
-                e.preventDefault();
-                const filename = e.target.getAttribute('href').substring(1);
-                loadMarkdown(filename);
+        // 전문 검색 (`serve` 서버의 /_search, 순위순)과 보관 묶음 문서 목록은 같은 패널에 표시
+        const searchInput = document.getElementById('search');
+        const searchResults = document.getElementById('search-results');
+        
+        function escapeHtml(text) {{
+            const div = document.createElement('div');
+            div.textContent = text;
+            return div.innerHTML;
+        }}
+        
+        // 서버가 \\x02 ... \\x03 으로 표시한 일치 부분
+        function highlight(text) {{
+            return escapeHtml(text).replace(/\\u0002/g, '<mark>').replace(/\\u0003/g, '</mark>');
+        }}
+        
+        function showPanel(html) {{
+            searchResults.innerHTML = html;
+            searchResults.hidden = false;
+            listView.hidden = true;
+        }}
+        
+        function showList() {{
+            searchResults.hidden = true;
+            listView.hidden = false;
+            renderRows();
+        }}
+        
+        async function showArchive(month) {{
+            const bundle = await loadArchive(month);
+            let html = `<li class="search-meta"><a href="#" data-back="1">← 목록</a> ${{escapeHtml(month)}} 보관 · ${{bundle.docs.length}}개</li>`;
+            for (const doc of bundle.docs.slice().reverse()) {{
+                html += `<li><a href="#{ARCHIVE_DIR_NAME}/${{escapeHtml(month)}}/${{escapeHtml(doc.file)}}">${{escapeHtml(doc.title)}}</a></li>`;
+            }}
+            showPanel(html);
+        }}
+        
+        let searchSeq = 0;
+        async function runSearch(query) {{
+            const seq = ++searchSeq;
+            if (query.trim() === '') {{
+                showList();
+                return;
+            }}
+        
+            let html;
+            try {{
+                const response = await fetch('_search?limit=50&q=' + encodeURIComponent(query));
+                if (!response.ok) throw new Error(response.statusText);
+                const data = await response.json();
+                html = `<li class="search-meta">${{data.results.length}}건 · ${{data.took_ms}}ms</li>`;
+                for (const result of data.results) {{
+                    html += `<li><a href="#${{escapeHtml(result.review)}}">`
+                        + `<span class="search-path">${{escapeHtml(result.file_path)}}</span>`
+                        + `<span class="search-snippet">${{highlight(result.snippet || result.reason)}}</span>`
+                        + `</a></li>`;
+                }}
+            }} catch (error) {{
+                html = '<li class="search-meta">검색은 serve 서버에서만 지원됩니다.</li>';
             }}
+            if (seq === searchSeq) showPanel(html);
+        }}
+        
+        let searchTimer = null;
+        searchInput.addEventListener('input', () => {{
+            clearTimeout(searchTimer);
+            searchTimer = setTimeout(() => runSearch(searchInput.value), 120);
         }});
         
-        // 초기 로드 (URL 해시 또는 기본 파일)
-        const initialFile = window.location.hash.substring(1) || '{default_file}';
-        loadMarkdown(initialFile);
+        // 링크 클릭 이벤트 (문서 목록, 검색 결과/보관 묶음)
+        for (const list of [listView, searchResults]) {{
+            list.addEventListener('click', (e) => {{
+                const link = e.target.closest('a');
+                if (!link || !link.getAttribute('href')) return;
+                e.preventDefault();
+                if (link.dataset.back) {{
+                    searchInput.value = '';
+                    showList();
+                }} else if (link.dataset.month) {{
+                    showArchive(link.dataset.month).catch(() => {{}});
+                }} else {{
+                    loadMarkdown(link.getAttribute('href').substring(1));
+                }}
+            }});
+        }}
+        
+        // 초기 로드 (URL 해시 또는 최신 파일)
+        loadManifest().catch(() => buildRows()).then(() => {{
+            renderRows();
+            const newest = manifest.total ? entryAt(manifest.total - 1) : undefined;
+            const initialFile = window.location.hash.substring(1) || (newest && !newest.archive ? newest.file : 'README.md');
+            loadMarkdown(initialFile);
+        }});
     </script>
 </body>
 </html>
 """
         
-        index_path.write_text(html_content, encoding='utf-8')
-        print(f"✓ index.html 업데이트: {len(md_files)}개 문서")
+        if not index_path.exists() or index_path.read_text(encoding='utf-8') != html_content:
+            atomic_write(index_path, html_content)
+            print("✓ index.html 업데이트")
     
     def save_and_build(self) -> Path:
-        """저장 + SUMMARY 업데이트 + index.html 업데이트"""
+        """저장 + manifest/SUMMARY 등록 + index.html 업데이트"""
         file_path = self.save_review()
         if file_path:
+            self.register_review(file_path)
+            if self.retention_days is not None:
+                self.compact(self.retention_days)
+        return file_path
+    
+    def build(self, full: bool = False):
+        """
+        SUMMARY.md와 index.html을 manifest 기준으로 다시 생성
+        
+        Args:
+            full: reviews/*.md를 스캔해 manifest와 검색 색인부터 재구성
+        """
+        with self._lock():
+            if full or not self.manifest_path.exists():
+                self.rebuild_manifest()
+            if full:
+                self.rebuild_search_index()
+            else:
+                self.write_manifest_pages()
             self.update_summary()
             self.update_index_html()
-        return file_path
     
     def serve_docs(self):
-        """문서 서버 실행"""
+        """문서 서버 실행 (멀티스레드, 조건부 요청/gzip/서버 측 렌더링)"""
+        server = make_docs_server(self.reviews_dir, self.port)
         print(f"\n🌐 문서 서버 실행 중...")
         print(f"   URL: http://localhost:{self.port}")
         print(f"   종료: Ctrl+C\n")
         
         try:
-            subprocess.run(
-                ["python3", "-m", "http.server", str(self.port)],
-                cwd=self.reviews_dir
-            )
+            server.serve_forever()
         except KeyboardInterrupt:
             print("\n✓ 서버 종료")
+        finally:
+            server.server_close()
+    
+    def close(self):
+        """검색 색인 연결 닫기"""
+        if self.search_index is not None:
+            self.search_index.close()
+            self.search_index = None
+    
+    def __enter__(self) -> 'CodeChangeLogger':
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
 
 
 def main():
@@ -569,21 +2179,59 @@ def main():
         print("사용법:")
         print("  python code_changelog_tracker.py init     # 초기화")
         print("  python code_changelog_tracker.py build    # SUMMARY + index.html 업데이트")
+        print("  python code_changelog_tracker.py build --full  # reviews/ 스캔으로 manifest/검색 색인 재구성")
+        print("  python code_changelog_tracker.py git <범위|커밋> [이유]  # git 변경사항 기록")
+        print("  python code_changelog_tracker.py compact [--keep-days N]  # N일(기본 30)보다 오래된 문서를 월별 보관")
+        print("  python code_changelog_tracker.py search <검색어> [--limit N]  # 전문 검색")
         print("  python code_changelog_tracker.py serve    # 문서 서버 실행")
         return
     
     command = sys.argv[1]
     
-    logger = CodeChangeLogger("Project")
+    # 검색은 색인이 없으면 문서에서 만든 뒤 검색
+    logger = CodeChangeLogger("Project", search_index=True if command == "search" else None)
     
     if command == "init":
         print("✓ reviews 디렉토리 초기화 완료")
     
     elif command == "build":
-        logger.update_summary()
-        logger.update_index_html()
+        logger.build(full="--full" in sys.argv[2:])
         print("✓ 빌드 완료")
     
+    elif command == "git":
+        rev_range = sys.argv[2] if len(sys.argv) > 2 else "HEAD"
+        reason = " ".join(sys.argv[3:])
+        logger.user_request = f"git {rev_range}"
+        count = logger.log_from_git(rev_range, reason)
+        logger.save_and_build()
+        print(f"✓ {count}개 변경 기록")
+    
+    elif command == "compact":
+        args = sys.argv[2:]
+        keep_days = int(args[args.index("--keep-days") + 1]) if "--keep-days" in args else 30
+        logger.compact(keep_days)
+    
+    elif command == "search":
+        args = sys.argv[2:]
+        limit = 20
+        if "--limit" in args:
+            i = args.index("--limit")
+            limit = int(args[i + 1])
+            del args[i:i + 2]
+        query = " ".join(args)
+        
+        start = time.perf_counter()
+        results = logger.search(query, limit)
+        took_ms = (time.perf_counter() - start) * 1000
+        for result in results:
+            label = CHANGE_LABELS.get(result['change_type'], result['change_type'])
+            print(f"{result['score']:7.2f}  {result['review']} #{result['position']}  {result['file_path']}  ({label})")
+            if result['reason']:
+                print(f"         이유: {result['reason']}")
+            if result['snippet']:
+                print(f"         {' '.join(result['snippet'].split())}")
+        print(f"✓ {len(results)}건 ({took_ms:.1f}ms)")
+    
     elif command == "serve":
         port = int(sys.argv[2]) if len(sys.argv) > 2 else 4000
         logger.port = port
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Pipeline Metrics
+Per-stage timing and resource metrics for run_pipeline.py, written as JSON
+and (optionally) in Prometheus textfile format.
+"""
+import os
+import sys
+import json
+import time
+from pathlib import Path
+from datetime import datetime
+from contextlib import contextmanager
+from typing import Dict, Any, List, Optional, Iterator
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def _usage(in_process: bool) -> Dict[str, float]:
+    """
+    CPU seconds and peak RSS (bytes) of the processes a stage runs in:
+    this process for in-process skills, reaped child processes otherwise.
+    """
+    if resource is None:
+        return {'cpu_seconds': time.process_time() if in_process else 0.0, 'max_rss_bytes': 0}
+
+    usage = resource.getrusage(resource.RUSAGE_SELF if in_process else resource.RUSAGE_CHILDREN)
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+    scale = 1 if sys.platform == 'darwin' else 1024
+    return {
+        'cpu_seconds': usage.ru_utime + usage.ru_stime,
+        'max_rss_bytes': usage.ru_maxrss * scale,
+    }
+
+
+def file_size(path: Optional[str]) -> int:
+    """Size of an output file in bytes (0 if missing)"""
+    try:
+        return os.path.getsize(path) if path else 0
+    except OSError:
+        return 0
+
+
+class PipelineMetrics:
+    """Collects structured metrics for each pipeline stage"""
+
+    def __init__(self, run_id: str, labels: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            run_id: Pipeline run ID
+            labels: Extra run-level labels (query, country, ...)
+        """
+        self.run_id = run_id
+        self.labels = labels or {}
+        self.started_at = datetime.now()
+        self.stages: List[Dict[str, Any]] = []
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str, in_process: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Measure one stage. The yielded dict can be filled by the caller with
+        items_in / items_out / http_requests / bytes_written.
+
+        Args:
+            name: Stage name
+            in_process: The stage runs in this process rather than in a child
+
+        CPU time and peak RSS come from RUSAGE_CHILDREN for subprocess stages
+        and from RUSAGE_SELF for in-process stages. Peak RSS is the high-water
+        mark so far (the OS does not expose it per child or per stage).
+        """
+        record = {
+            'stage': name,
+            'status': 'running',
+            'items_in': 0,
+            'items_out': 0,
+            'http_requests': 0,
+            'bytes_written': 0,
+        }
+        before = _usage(in_process)
+        start_wall = time.perf_counter()
+        try:
+            yield record
+            if record['status'] == 'running':
+                record['status'] = 'ok'
+        except BaseException:
+            record['status'] = 'error'
+            raise
+        finally:
+            after = _usage(in_process)
+            record['wall_ms'] = round((time.perf_counter() - start_wall) * 1000, 3)
+            record['cpu_ms'] = round((after['cpu_seconds'] - before['cpu_seconds']) * 1000, 3)
+            record['peak_rss_bytes'] = after['max_rss_bytes']
+            self.stages.append(record)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable metrics document"""
+        return {
+            'run_id': self.run_id,
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'total_wall_ms': round((time.perf_counter() - self._start) * 1000, 3),
+            'labels': self.labels,
+            'stages': self.stages,
+        }
+
+    def save(self, output_dir: Path, prometheus: bool = False) -> Path:
+        """
+        Write metrics.json (and metrics.prom) into the run directory.
+
+        Returns:
+            Path to metrics.json
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        document = self.to_dict()
+
+        metrics_path = output_dir / 'metrics.json'
+        with open(metrics_path, 'w', encoding='utf-8') as f:
+            json.dump(document, f, ensure_ascii=False, indent=2)
+
+        if prometheus:
+            write_prometheus_textfile(document, output_dir / 'metrics.prom')
+
+        return metrics_path
+
+
+# (metric name, stage record key, scale, help text)
+PROMETHEUS_METRICS = [
+    ('pipeline_stage_wall_seconds', 'wall_ms', 0.001, 'Wall-clock time of the stage'),
+    ('pipeline_stage_cpu_seconds', 'cpu_ms', 0.001, 'CPU time (user+system) of the stage'),
+    ('pipeline_stage_peak_rss_bytes', 'peak_rss_bytes', 1, 'Peak resident set size'),
+    ('pipeline_stage_items_in', 'items_in', 1, 'Items consumed by the stage'),
+    ('pipeline_stage_items_out', 'items_out', 1, 'Items produced by the stage'),
+    ('pipeline_stage_http_requests', 'http_requests', 1, 'HTTP requests issued by the stage'),
+    ('pipeline_stage_bytes_written', 'bytes_written', 1, 'Bytes written to output files'),
+]
+
+
+def _escape_label(value: Any) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def write_prometheus_textfile(document: Dict[str, Any], output_path: Path) -> Path:
+    """Write metrics in the node_exporter textfile collector format"""
+    base_labels = {'run_id': document['run_id'], **document.get('labels', {})}
+
+    lines = []
+    for name, key, scale, help_text in PROMETHEUS_METRICS:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} gauge")
+        for record in document['stages']:
+            labels = {**base_labels, 'stage': record['stage']}
+            label_str = ','.join(f'{k}="{_escape_label(v)}"' for k, v in labels.items())
+            lines.append(f"{name}{{{label_str}}} {record.get(key, 0) * scale:g}")
+
+    lines.append("# HELP pipeline_run_wall_seconds Wall-clock time of the whole run")
+    lines.append("# TYPE pipeline_run_wall_seconds gauge")
+    label_str = ','.join(f'{k}="{_escape_label(v)}"' for k, v in base_labels.items())
+    lines.append(f"pipeline_run_wall_seconds{{{label_str}}} {document['total_wall_ms'] / 1000:g}")
+
+    # Write-then-rename so the textfile collector never reads a partial file
+    tmp_path = output_path.with_suffix('.prom.tmp')
+    tmp_path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+    os.replace(tmp_path, output_path)
+    return output_path
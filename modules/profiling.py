@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Skill Profiling
+Opt-in cProfile / tracemalloc wrapper shared by every skill entry point.
+
+    PROFILE=cpu|mem|all    enable profiling (unset/0 = disabled)
+    PROFILE_DIR=<path>     where to dump results (default: outputs/<date>/<RUN_ID>/profile)
+    PROFILE_TOP=<n>        number of hotspots in the summary (default: 25)
+"""
+import os
+import io
+import pstats
+import logging
+import cProfile
+import tracemalloc
+from pathlib import Path
+from datetime import datetime
+from typing import Callable, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILE_MODES = ('cpu', 'mem', 'all')
+
+
+def profile_mode_from_env() -> Optional[str]:
+    """Read PROFILE; '1'/'true' mean cpu. Returns None when disabled."""
+    value = os.getenv('PROFILE', '').strip().lower()
+    if value in ('', '0', 'false', 'off', 'no'):
+        return None
+    if value in ('1', 'true', 'on', 'yes'):
+        return 'cpu'
+    if value not in PROFILE_MODES:
+        logger.warning(f"Unknown PROFILE value '{value}', using 'cpu'")
+        return 'cpu'
+    return value
+
+
+def default_profile_dir() -> Path:
+    """outputs/<date>/<RUN_ID>/profile, or PROFILE_DIR when set"""
+    if os.getenv('PROFILE_DIR'):
+        return Path(os.environ['PROFILE_DIR'])
+    run_id = os.getenv('RUN_ID', datetime.now().strftime('%H%M%S'))
+    return Path('outputs') / datetime.now().strftime('%Y%m%d') / run_id / 'profile'
+
+
+def _write_cpu_report(profiler: cProfile.Profile, stage: str, output_dir: Path, top_n: int):
+    prof_path = output_dir / f"{stage}.prof"
+    profiler.dump_stats(str(prof_path))
+
+    buffer = io.StringIO()
+    stats = pstats.Stats(profiler, stream=buffer)
+    stats.strip_dirs().sort_stats('cumulative').print_stats(top_n)
+    buffer.write("\n")
+    stats.sort_stats('tottime').print_stats(top_n)
+    (output_dir / f"{stage}.hotspots.txt").write_text(buffer.getvalue(), encoding='utf-8')
+    logger.info(f"CPU profile: {prof_path}")
+
+
+def _write_memory_report(snapshot: tracemalloc.Snapshot, peak: int, stage: str, output_dir: Path, top_n: int):
+    lines = [f"Peak traced memory: {peak / 1024 / 1024:.2f} MB", "", f"Top {top_n} allocation sites:"]
+    for stat in snapshot.statistics('lineno')[:top_n]:
+        lines.append(f"  {stat}")
+    report_path = output_dir / f"{stage}.memory.txt"
+    report_path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+    logger.info(f"Memory profile: {report_path} (peak {peak / 1024 / 1024:.2f} MB)")
+
+
+def run_profiled(
+    stage: str,
+    func: Callable[[], Any],
+    mode: Optional[str] = None,
+    output_dir: Optional[Path] = None
+) -> Any:
+    """
+    Run `func`, profiling it when PROFILE (or `mode`) is set.
+
+    When profiling is disabled this is a plain call. Profiles are written
+    even if `func` raises or calls sys.exit().
+
+    Args:
+        stage: Name used for output files (e.g. 'ranker')
+        func: Zero-argument entry point (usually a skill's main)
+        mode: 'cpu', 'mem' or 'all'; defaults to the PROFILE env var
+        output_dir: Destination directory; defaults to default_profile_dir()
+    """
+    mode = mode or profile_mode_from_env()
+    if not mode:
+        return func()
+
+    output_dir = output_dir or default_profile_dir()
+    output_dir.mkdir(parents=True, exist_ok=True)
+    top_n = int(os.getenv('PROFILE_TOP', '25'))
+
+    profiler = cProfile.Profile() if mode in ('cpu', 'all') else None
+    trace_memory = mode in ('mem', 'all') and not tracemalloc.is_tracing()
+
+    if trace_memory:
+        tracemalloc.start()
+    if profiler:
+        profiler.enable()
+    try:
+        return func()
+    finally:
+        if profiler:
+            profiler.disable()
+            _write_cpu_report(profiler, stage, output_dir, top_n)
+        if trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            _write_memory_report(snapshot, peak, stage, output_dir, top_n)
@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+Run Dashboard
+Browsable index of every pipeline run, kept up to date incrementally.
+
+    outputs/dashboard/
+    ├── runs.jsonl    # append-only manifest (one JSON record per run)
+    ├── runs.js       # same records as `DASHBOARD_RUNS.push(...)` lines
+    └── index.html    # static page that loads runs.js
+
+Registering a run appends one line to each file, so the cost does not grow
+with the number of runs and no other run's ranked_games.json is re-read.
+`rebuild` rescans the outputs tree once (e.g. for runs made before the
+dashboard existed).
+
+Usage:
+    python modules/run_dashboard.py rebuild [outputs_dir]
+    python modules/run_dashboard.py list [outputs_dir]
+"""
+import os
+import sys
+import json
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+# Games shown per run in the dashboard
+TOP_GAMES = 5
+
+JS_HEADER = 'window.DASHBOARD_RUNS = window.DASHBOARD_RUNS || [];\n'
+
+INDEX_HTML = '''<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>실행 대시보드</title>
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            background: #f5f6fa;
+            color: #333;
+            margin: 0;
+            padding: 20px;
+        }
+
+        h1 {
+            color: #667eea;
+        }
+
+        .toolbar {
+            display: flex;
+            gap: 12px;
+            align-items: center;
+            margin-bottom: 16px;
+        }
+
+        .toolbar input {
+            flex: 1;
+            max-width: 400px;
+            padding: 8px 12px;
+            border: 1px solid #ddd;
+            border-radius: 8px;
+        }
+
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            background: white;
+            border-radius: 12px;
+            overflow: hidden;
+        }
+
+        th, td {
+            padding: 10px 12px;
+            border-bottom: 1px solid #eee;
+            text-align: left;
+            vertical-align: top;
+        }
+
+        th {
+            background: #667eea;
+            color: white;
+        }
+
+        .top-games {
+            margin: 0;
+            padding-left: 18px;
+        }
+
+        .score {
+            color: #667eea;
+            font-weight: bold;
+        }
+
+        #more {
+            margin: 16px auto;
+            display: block;
+            padding: 8px 20px;
+            border: none;
+            border-radius: 8px;
+            background: #667eea;
+            color: white;
+            cursor: pointer;
+        }
+    </style>
+</head>
+<body>
+    <h1>📊 실행 대시보드</h1>
+    <div class="toolbar">
+        <input id="filter" type="search" placeholder="쿼리 / 국가 / 게임 검색">
+        <span id="count"></span>
+    </div>
+    <table>
+        <thead>
+            <tr>
+                <th>날짜</th>
+                <th>Run ID</th>
+                <th>쿼리</th>
+                <th>국가</th>
+                <th>게임 수</th>
+                <th>평균 점수</th>
+                <th>상위 게임</th>
+                <th>리포트</th>
+            </tr>
+        </thead>
+        <tbody id="runs"></tbody>
+    </table>
+    <button id="more">더 보기</button>
+    <script src="runs.js"></script>
+    <script>
+        (function () {
+            const BATCH = 200;
+            const escapeHtml = (value) => String(value ?? '').replace(/[&<>"']/g, (c) => (
+                {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[c]
+            ));
+
+            // A re-registered run replaces its earlier record; newest first
+            const byKey = new Map();
+            for (const run of window.DASHBOARD_RUNS || []) byKey.set(run.date + '/' + run.run_id, run);
+            const runs = Array.from(byKey.values()).sort((a, b) => (
+                (b.started_at || '').localeCompare(a.started_at || '')
+            ));
+
+            const tbody = document.getElementById('runs');
+            const more = document.getElementById('more');
+            const count = document.getElementById('count');
+            const filter = document.getElementById('filter');
+            let matches = runs;
+            let shown = 0;
+
+            function renderRow(run) {
+                const games = (run.top_games || []).map((game) => (
+                    `<li><span class="score">${game.score.toFixed(3)}</span> ${escapeHtml(game.title)}</li>`
+                )).join('');
+                const report = run.report ? `<a href="${escapeHtml(run.report)}">열기</a>` : '-';
+                return `<tr>
+                    <td>${escapeHtml(run.date)}</td>
+                    <td>${escapeHtml(run.run_id)}</td>
+                    <td>${escapeHtml(run.query)}</td>
+                    <td>${escapeHtml(run.country)}</td>
+                    <td>${run.total_games}</td>
+                    <td>${run.avg_score.toFixed(3)}</td>
+                    <td><ol class="top-games">${games}</ol></td>
+                    <td>${report}</td>
+                </tr>`;
+            }
+
+            function showMore() {
+                const next = matches.slice(shown, shown + BATCH);
+                tbody.insertAdjacentHTML('beforeend', next.map(renderRow).join(''));
+                shown += next.length;
+                more.style.display = shown < matches.length ? 'block' : 'none';
+                count.textContent = `${matches.length}개 실행`;
+            }
+
+            filter.addEventListener('input', () => {
+                const needle = filter.value.trim().toLowerCase();
+                matches = needle ? runs.filter((run) => [
+                    run.query, run.country, run.run_id, ...(run.top_games || []).map((game) => game.title)
+                ].join(' ').toLowerCase().includes(needle)) : runs;
+                tbody.innerHTML = '';
+                shown = 0;
+                showMore();
+            });
+            more.addEventListener('click', showMore);
+            showMore();
+        })();
+    </script>
+</body>
+</html>
+'''
+
+
+def build_run_record(
+    run_dir: Path,
+    games: List[Dict[str, Any]],
+    query: str,
+    country: str,
+    started_at: Optional[datetime] = None,
+    report_path: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Summarize one run for the dashboard.
+
+    Args:
+        run_dir: outputs/<date>/<run_id>
+        games: Ranked games of the run (already in memory in the runner)
+        query: Search query
+        country: Country code
+        started_at: Run start time (default: now)
+        report_path: HTML report of the run, if generated
+    """
+    started_at = started_at or datetime.now()
+    total = len(games)
+    record = {
+        'date': run_dir.parent.name,
+        'run_id': run_dir.name,
+        'query': query,
+        'country': country,
+        'started_at': started_at.isoformat(timespec='seconds'),
+        'total_games': total,
+        'avg_score': round(sum(g.get('final_score', 0) for g in games) / total, 4) if total else 0.0,
+        'top_games': [
+            {
+                'title': game.get('title', 'Unknown'),
+                'genre': game.get('genre', 'Unknown'),
+                'score': round(game.get('final_score', 0), 4),
+            }
+            for game in games[:TOP_GAMES]
+        ],
+        'report': None,
+    }
+    if report_path:
+        # Link relative to outputs/dashboard/
+        record['report'] = Path(os.path.relpath(
+            os.path.abspath(report_path), os.path.abspath(run_dir.parent.parent / 'dashboard')
+        )).as_posix()
+    return record
+
+
+def _line_break(path: Path) -> str:
+    """'\\n' if the file ends in a torn line (interrupted write), so the next record starts on its own line"""
+    try:
+        with open(path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return '' if f.read(1) == b'\n' else '\n'
+    except OSError:
+        return ''  # missing or empty
+
+
+def _script_line(line: str) -> str:
+    """runs.js line for one manifest line ('</' escaped so a title can't close the <script> element)"""
+    escaped = line.replace('</', '<\\/')
+    return f"DASHBOARD_RUNS.push({escaped});\n"
+
+
+class RunDashboard:
+    """Append-only manifest of pipeline runs plus its static HTML index"""
+
+    def __init__(self, outputs_dir: Path = Path('outputs')):
+        self.outputs_dir = Path(outputs_dir)
+        self.dashboard_dir = self.outputs_dir / 'dashboard'
+        self.manifest_path = self.dashboard_dir / 'runs.jsonl'
+        self.script_path = self.dashboard_dir / 'runs.js'
+        self.index_path = self.dashboard_dir / 'index.html'
+
+    def _ensure_files(self):
+        self.dashboard_dir.mkdir(parents=True, exist_ok=True)
+        if not self.script_path.exists():
+            self.script_path.write_text(JS_HEADER, encoding='utf-8')
+        # index.html is static; rewrite only when the template changed
+        if not self.index_path.exists() or self.index_path.read_text(encoding='utf-8') != INDEX_HTML:
+            self.index_path.write_text(INDEX_HTML, encoding='utf-8')
+
+    def add_run(self, record: Dict[str, Any]) -> Path:
+        """
+        Register a run: append it to runs.jsonl and runs.js.
+
+        Re-registering the same date/run_id appends a newer record, which
+        wins when the manifest is read.
+
+        Returns:
+            Path to index.html
+        """
+        self._ensure_files()
+        line = json.dumps(record, ensure_ascii=False, separators=(',', ':'))
+        # Single write per file with O_APPEND, so concurrent runs don't interleave lines
+        with open(self.manifest_path, 'a', encoding='utf-8') as f:
+            f.write(_line_break(self.manifest_path) + line + '\n')
+        if _line_break(self.script_path):
+            # A torn push() line is a syntax error for the whole script: rewrite it from the manifest
+            self._rewrite_script()
+        else:
+            with open(self.script_path, 'a', encoding='utf-8') as f:
+                f.write(_script_line(line))
+        return self.index_path
+
+    def _rewrite_script(self):
+        """runs.js from every readable runs.jsonl line (only after an interrupted write)"""
+        lines = [JS_HEADER]
+        with open(self.manifest_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(record, dict) and 'date' in record and 'run_id' in record:
+                    lines.append(_script_line(line))
+        tmp_path = self.script_path.with_suffix('.js.tmp')
+        tmp_path.write_text(''.join(lines), encoding='utf-8')
+        os.replace(tmp_path, self.script_path)
+
+    def load_manifest(self) -> List[Dict[str, Any]]:
+        """Registered runs (latest record per date/run_id), newest first"""
+        runs = {}
+        if self.manifest_path.exists():
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                        runs[(record['date'], record['run_id'])] = record
+                    except (json.JSONDecodeError, KeyError, TypeError):
+                        continue  # torn line from an interrupted write
+        return sorted(runs.values(), key=lambda r: r.get('started_at', ''), reverse=True)
+
+    def rebuild(self) -> int:
+        """
+        Recreate the manifest by scanning outputs/<date>/<run_id>/ once.
+
+        Query and country come from each run's metrics.json labels.
+
+        Returns:
+            Number of runs registered
+        """
+        self.dashboard_dir.mkdir(parents=True, exist_ok=True)
+        for path in (self.manifest_path, self.script_path):
+            if path.exists():
+                path.unlink()
+
+        count = 0
+        for ranked_path in sorted(self.outputs_dir.glob('*/*/artifacts/ranked_games.json')):
+            run_dir = ranked_path.parent.parent
+            try:
+                with open(ranked_path, 'r', encoding='utf-8') as f:
+                    games = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                continue
+
+            labels, started_at = {}, None
+            metrics_path = run_dir / 'metrics.json'
+            if metrics_path.exists():
+                with open(metrics_path, 'r', encoding='utf-8') as f:
+                    metrics = json.load(f)
+                labels = metrics.get('labels', {})
+                started_at = datetime.fromisoformat(metrics['started_at'])
+            if started_at is None:
+                started_at = datetime.fromtimestamp(ranked_path.stat().st_mtime)
+
+            report_path = run_dir / 'reports' / 'game_ranking.html'
+            if not report_path.exists():
+                report_path = run_dir / 'reports' / 'page-1.html'
+            record = build_run_record(
+                run_dir, games,
+                labels.get('query', ''), labels.get('country', ''),
+                started_at,
+                str(report_path) if report_path.exists() else None
+            )
+            self.add_run(record)
+            count += 1
+
+        self._ensure_files()
+        return count
+
+
+def main():
+    """CLI entry point"""
+    if len(sys.argv) < 2 or sys.argv[1] not in ('rebuild', 'list'):
+        print("Usage: python modules/run_dashboard.py [rebuild|list] [outputs_dir]")
+        return 1
+
+    outputs_dir = Path(sys.argv[2]) if len(sys.argv) > 2 else Path('outputs')
+    dashboard = RunDashboard(outputs_dir)
+
+    if sys.argv[1] == 'rebuild':
+        count = dashboard.rebuild()
+        print(f"Registered {count} runs: {dashboard.index_path}")
+    else:
+        for run in dashboard.load_manifest():
+            top = run['top_games'][0]['title'] if run['top_games'] else '-'
+            print(f"{run['date']}/{run['run_id']}  {run['query']} ({run['country']})  "
+                  f"{run['total_games']} games  top: {top}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Skill Result Protocol
+Skills hand their JSON result to the pipeline runner through a dedicated
+file instead of stdout, so logs can stream freely.
+
+    SKILL_RESULT_PATH=<path>   set by the runner; the skill writes its result there
+
+Without SKILL_RESULT_PATH (a skill run by hand) the result is printed to
+stdout as a single JSON line, as before.
+"""
+import os
+import json
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+RESULT_PATH_ENV = 'SKILL_RESULT_PATH'
+
+
+class SkillResultError(RuntimeError):
+    """A skill exited successfully without writing its result file"""
+
+
+def emit_result(result: Dict[str, Any]) -> None:
+    """Publish a skill's result to the runner (or stdout when run standalone)"""
+    result_path = os.getenv(RESULT_PATH_ENV)
+    if not result_path:
+        print(json.dumps(result))
+        return
+
+    # Write-then-rename so the runner never sees a half-written result
+    tmp_path = f"{result_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False)
+    os.replace(tmp_path, result_path)
+
+
+def read_result(result_path: Path) -> Optional[Dict[str, Any]]:
+    """Read a result written by emit_result (None if missing or invalid)"""
+    try:
+        with open(result_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
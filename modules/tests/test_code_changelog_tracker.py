@@ -0,0 +1,725 @@
+"""Tests for the code changelog tracker."""
+import os
+import gzip
+import zlib
+import hashlib
+import json
+import shutil
+import tempfile
+import subprocess
+import unittest
+import threading
+import multiprocessing
+import urllib.error
+import urllib.request
+from pathlib import Path
+from unittest import mock
+from datetime import datetime
+from modules.code_changelog_tracker import (
+    CodeChangeLogger,
+    atomic_write_chunks,
+    display_name,
+    fts_query,
+    make_docs_server,
+    SearchIndex,
+    read_archive,
+    render_markdown
+)
+
+WRITERS = 50
+
+
+def _write_review(reviews_dir, agent, barrier):
+    """One agent: log a change and save in the same second as every other agent"""
+    logger = CodeChangeLogger("Agents", reviews_dir=reviews_dir)
+    logger.timestamp = '20250101_120000'
+    logger.log_file_creation(f"agent_{agent}.py", f"print({agent})", f"agent {agent}")
+    barrier.wait()
+    logger.save_and_build()
+
+
+class TestConcurrentWriters(unittest.TestCase):
+    """Test concurrent saves from many agents."""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.reviews_dir = Path(self.tmp.name) / 'reviews'
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_no_entries_lost(self):
+        """50 writers saving in the same second each keep their own review."""
+        CodeChangeLogger("Agents", reviews_dir=str(self.reviews_dir))
+        ctx = multiprocessing.get_context()
+        barrier = ctx.Barrier(WRITERS)
+        workers = [
+            ctx.Process(target=_write_review, args=(str(self.reviews_dir), agent, barrier))
+            for agent in range(WRITERS)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(60)
+        self.assertEqual([worker.exitcode for worker in workers], [0] * WRITERS)
+        
+        docs = sorted(self.reviews_dir.glob('20250101_120000*.md'))
+        self.assertEqual(len(docs), WRITERS)
+        agents = set()
+        for doc in docs:
+            text = doc.read_text(encoding='utf-8')
+            self.assertIn('**총 변경사항**: 1개', text)
+            agents.add(text.split('## 1. ', 1)[1].split('\n', 1)[0])
+        self.assertEqual(len(agents), WRITERS)
+        
+        with open(self.reviews_dir / 'manifest.jsonl', encoding='utf-8') as f:
+            entries = [json.loads(line) for line in f]
+        self.assertEqual(sorted(entry['file'] for entry in entries), [doc.name for doc in docs])
+        
+        summary = (self.reviews_dir / 'SUMMARY.md').read_text(encoding='utf-8')
+        self.assertEqual(summary.count('](20250101_120000'), WRITERS)
+        self.assertEqual(list(self.reviews_dir.glob('*.tmp')), [])
+    
+    def test_resave_updates_same_review(self):
+        """Saving again from the same logger rewrites its own review."""
+        logger = CodeChangeLogger("Agents", reviews_dir=str(self.reviews_dir))
+        logger.log_file_creation("a.py", "1", "first")
+        first = logger.save_and_build()
+        logger.log_file_creation("b.py", "2", "second")
+        
+        self.assertEqual(logger.save_and_build(), first)
+        self.assertEqual(logger.load_manifest()[-1]['changes'], 2)
+        summary = (self.reviews_dir / 'SUMMARY.md').read_text(encoding='utf-8')
+        self.assertEqual(summary.count(first.name), 1)
+
+
+class TestDocsServer(unittest.TestCase):
+    """Test the threaded docs server."""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.reviews_dir = Path(self.tmp.name) / 'reviews'
+        logger = CodeChangeLogger("Docs", reviews_dir=str(self.reviews_dir), search_index=True)
+        logger.log_file_creation("a.py", "x = '<b>'", "first")
+        self.doc = logger.save_and_build()
+        
+        self.server = make_docs_server(self.reviews_dir, 0, '127.0.0.1')
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+    
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+    
+    def fetch(self, path, **headers):
+        request = urllib.request.Request(self.base + path, headers=headers)
+        try:
+            with urllib.request.urlopen(request) as response:
+                return response.status, response.headers, response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.headers, b''
+    
+    def test_conditional_get(self):
+        """A matching ETag or Last-Modified gets 304 without a body."""
+        status, headers, body = self.fetch('/' + self.doc.name)
+        self.assertEqual(status, 200)
+        self.assertEqual(body, self.doc.read_bytes())
+        self.assertEqual(headers['Cache-Control'], 'no-cache')
+        
+        status, _, body = self.fetch('/' + self.doc.name, **{'If-None-Match': headers['ETag']})
+        self.assertEqual((status, body), (304, b''))
+        status, _, _ = self.fetch('/' + self.doc.name, **{'If-Modified-Since': headers['Last-Modified']})
+        self.assertEqual(status, 304)
+    
+    def test_gzip(self):
+        """Text responses are gzipped when the client accepts it."""
+        status, headers, body = self.fetch('/index.html', **{'Accept-Encoding': 'gzip, br'})
+        self.assertEqual(status, 200)
+        self.assertEqual(headers['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(body), (self.reviews_dir / 'index.html').read_bytes())
+    
+    def test_rendered_markdown_follows_file(self):
+        """`/_render/` serves HTML and picks up a rewritten document."""
+        status, headers, body = self.fetch('/_render/' + self.doc.name)
+        self.assertEqual(status, 200)
+        self.assertTrue(headers['Content-Type'].startswith('text/html'))
+        self.assertIn('<h1>Docs</h1>', body.decode('utf-8'))
+        self.assertIn('x = &#x27;&lt;b&gt;&#x27;', body.decode('utf-8'))
+        
+        self.doc.write_text('# Changed\n', encoding='utf-8')
+        stat = self.doc.stat()
+        os.utime(self.doc, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        status, new_headers, body = self.fetch('/_render/' + self.doc.name)
+        self.assertEqual(body, b'<h1>Changed</h1>\n')
+        self.assertNotEqual(new_headers['ETag'], headers['ETag'])
+    
+    def test_search_endpoint(self):
+        """`/_search` returns ranked JSON results with marked snippets."""
+        status, _, body = self.fetch('/_search?q=fir')
+        self.assertEqual(status, 200)
+        results = json.loads(body)['results']
+        self.assertEqual([result['review'] for result in results], [self.doc.name])
+        self.assertEqual(results[0]['snippet'], '\x02first\x03')
+        self.assertEqual(self.fetch('/.search.db')[0], 404)
+    
+    def test_missing_and_traversal(self):
+        """Unknown files and paths outside reviews/ are 404."""
+        self.assertEqual(self.fetch('/nope.md')[0], 404)
+        self.assertEqual(self.fetch('/_render/index.html')[0], 404)
+        self.assertEqual(self.fetch('/../' + Path(self.tmp.name).name)[0], 404)
+        self.assertTrue((Path(self.reviews_dir) / '.search.db').exists())
+        for path in ('/%2esearch.db', '/./.search.db', '/manifest/../.search.db', '/.search.db-wal'):
+            self.assertEqual(self.fetch(path)[0], 404, path)
+
+
+class TestSearch(unittest.TestCase):
+    """Test full-text search over reviews."""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.reviews_dir = str(Path(self.tmp.name) / 'reviews')
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_ranking_and_resave(self):
+        """Path matches outrank content matches; saving again replaces the review's rows."""
+        logger = CodeChangeLogger("Search", reviews_dir=self.reviews_dir, search_index=True)
+        logger.log_file_creation("src/utils.py", "import auth", "helpers")
+        logger.log_bug_fix("src/auth.py", "a = 1", "a = 2", "토큰 만료 오류", "만료 시간 수정")
+        logger.save_and_build()
+        
+        results = logger.search('auth')
+        self.assertEqual([result['file_path'] for result in results], ['src/auth.py', 'src/utils.py'])
+        self.assertEqual(results[0]['change_type'], 'bug_fix')
+        self.assertEqual(logger.search('만료 토큰')[0]['position'], 2)
+        self.assertEqual(logger.search('버그')[0]['file_path'], 'src/auth.py')
+        
+        logger.log_file_deletion("old.py", "legacy", "cleanup")
+        logger.save_and_build()
+        self.assertEqual(len(logger.search('src')), 2)
+        self.assertEqual(logger.search('legacy')[0]['position'], 3)
+    
+    def test_rebuild_from_documents(self):
+        """`build --full` reindexes saved reviews, including blob-stored content."""
+        logger = CodeChangeLogger("Search", reviews_dir=self.reviews_dir, blob_store=True, search_index=True)
+        logger.log_file_creation("a.py", "def payment_gateway(): pass", "결제")
+        logger.save_and_build()
+        os.remove(Path(self.reviews_dir) / '.search.db')
+        
+        fresh = CodeChangeLogger("Search", reviews_dir=self.reviews_dir, search_index=True)
+        self.assertEqual(fresh.search('payment')[0]['file_path'], 'a.py')
+        fresh.build(full=True)
+        self.assertEqual(len(fresh.search('결제')), 1)
+    
+    def test_query_syntax(self):
+        """Operators and quotes in user input never reach FTS5 as syntax."""
+        self.assertEqual(fts_query('auth.py "OR" -x'), '"auth"* "py"* "or"* "x"*')
+        self.assertEqual(fts_query('*()'), '')
+        logger = CodeChangeLogger("Search", reviews_dir=self.reviews_dir, search_index=True)
+        self.assertEqual(logger.search('"; DROP'), [])
+    
+    def test_contentless_and_opt_in(self):
+        """Only the index is stored, not change bodies; loggers open the index only when asked or present."""
+        with CodeChangeLogger("Search", reviews_dir=self.reviews_dir) as logger:
+            self.assertIsNone(logger.search_index)
+        self.assertFalse((Path(self.reviews_dir) / '.search.db').exists())
+        
+        body = "zebra_" * 2000
+        with CodeChangeLogger("Search", reviews_dir=self.reviews_dir, search_index=True) as logger:
+            logger.log_file_creation("a.py", body, "striped")
+            logger.save_and_build()
+            self.assertEqual(logger.search('zebra')[0]['file_path'], 'a.py')
+        self.assertIsNone(logger.search_index)
+        with open(Path(self.reviews_dir) / '.search.db', 'rb') as f:
+            self.assertNotIn(b"zebra_zebra_", f.read())
+        
+        with CodeChangeLogger("Search", reviews_dir=self.reviews_dir) as logger:
+            self.assertEqual(logger.search('striped')[0]['snippet'], '[striped]')
+    
+    def test_stale_rows_rebuilt(self):
+        """Re-saving leaves stale index rows that trigger a rebuild once they outnumber live rows."""
+        logger = CodeChangeLogger("Search", reviews_dir=self.reviews_dir, search_index=True)
+        with mock.patch.object(SearchIndex, 'MIN_STALE_ROWS', 2), \
+                mock.patch.object(logger, 'rebuild_search_index', wraps=logger.rebuild_search_index) as rebuild:
+            for i in range(4):
+                logger.log_file_creation(f"f{i}.py", "pass", f"step{i}")
+                logger.save_review()
+            self.assertEqual(rebuild.call_count, 1)
+        self.assertFalse(logger.search_index.needs_rebuild)
+        self.assertEqual([result['position'] for result in logger.search('step')], [1, 2, 3, 4])
+        logger.close()
+
+
+class TestRetention(unittest.TestCase):
+    """Test compaction of old reviews into monthly archives."""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.reviews_dir = Path(self.tmp.name) / 'reviews'
+        for timestamp in ('20250105_100000', '20250120_100000', '20250203_100000', '20250310_100000'):
+            self.save(timestamp)
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def save(self, timestamp):
+        logger = CodeChangeLogger("Keep", reviews_dir=str(self.reviews_dir), search_index=True)
+        logger.timestamp = timestamp
+        logger.log_file_creation(f"f_{timestamp}.py", f"marker_{timestamp}", "saved")
+        logger.save_and_build()
+        return logger
+    
+    def test_compact_rolls_up_old_months(self):
+        """Old reviews move into one bundle per month; the index lists one line per month."""
+        logger = CodeChangeLogger("Keep", reviews_dir=str(self.reviews_dir))
+        written = logger.compact(keep_days=30, now=datetime(2025, 3, 20))
+        
+        self.assertEqual([path.name for path in written], ['2025-01.json.gz', '2025-02.json.gz'])
+        self.assertEqual(sorted(path.name for path in self.reviews_dir.glob('2025*.md')), ['20250310_100000.md'])
+        january = read_archive(self.reviews_dir / 'archives' / '2025-01.json.gz')
+        self.assertEqual([doc['file'] for doc in january['docs']], ['20250105_100000.md', '20250120_100000.md'])
+        self.assertIn('marker_20250105_100000', january['docs'][0]['markdown'])
+        
+        entries = logger.load_manifest()
+        self.assertEqual(
+            [entry['file'] for entry in entries],
+            ['archives/2025-01.json.gz', 'archives/2025-02.json.gz', '20250310_100000.md']
+        )
+        self.assertEqual(entries[0]['docs'], 2)
+        summary = (self.reviews_dir / 'SUMMARY.md').read_text(encoding='utf-8')
+        self.assertIn('* [2025-01 보관 (2개)](archives/2025-01.json.gz)', summary)
+        self.assertEqual(
+            logger.search('marker_20250120_100000')[0]['review'], 'archives/2025-01/20250120_100000.md'
+        )
+        
+        # A later January review merges into the existing bundle; rebuilds keep the archives
+        self.save('20250125_100000')
+        logger.compact(keep_days=30, now=datetime(2025, 3, 20))
+        logger.build(full=True)
+        self.assertEqual(logger.load_manifest()[0]['docs'], 3)
+        self.assertEqual(len(logger.search('marker')), 5)
+    
+    def test_archived_doc_served(self):
+        """The docs server renders a review from inside its monthly bundle."""
+        CodeChangeLogger("Keep", reviews_dir=str(self.reviews_dir)).compact(30, now=datetime(2025, 3, 20))
+        server = make_docs_server(self.reviews_dir, 0, '127.0.0.1')
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            with urllib.request.urlopen(base + '/_render/archives/2025-02/20250203_100000.md') as response:
+                self.assertIn('marker_20250203_100000', response.read().decode('utf-8'))
+            with self.assertRaises(urllib.error.HTTPError):
+                urllib.request.urlopen(base + '/_render/archives/2025-02/20250105_100000.md')
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class TestManifestPages(unittest.TestCase):
+    """Test the paged sidebar list under reviews/manifest/."""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.reviews_dir = Path(self.tmp.name) / 'reviews'
+        self.pages_dir = self.reviews_dir / 'manifest'
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def save(self, timestamp, logger=None):
+        logger = logger or CodeChangeLogger("Pages", reviews_dir=str(self.reviews_dir))
+        logger.timestamp = timestamp
+        logger.log_file_creation(f"f_{timestamp}.py", "pass", "saved")
+        logger.save_and_build()
+        return logger
+    
+    def read_pages(self):
+        index = json.loads((self.pages_dir / 'index.json').read_text(encoding='utf-8'))
+        pages = [
+            json.loads(path.read_text(encoding='utf-8'))
+            for path in sorted(self.pages_dir.glob('page-*.json'), key=lambda path: int(path.stem[5:]))
+        ]
+        return index, pages
+    
+    def test_incremental_pages_match_full_rewrite(self):
+        """Appending page by page gives the same files as rewriting every page."""
+        with mock.patch('modules.code_changelog_tracker.MANIFEST_PAGE_SIZE', 2):
+            for timestamp in ('20250101_090000', '20250101_100000', '20250102_090000',
+                              '20250102_100000', '20250103_090000'):
+                logger = self.save(timestamp)
+            index, pages = self.read_pages()
+            logger.write_manifest_pages()
+        
+        self.assertEqual(index['total'], 5)
+        self.assertEqual(index['groups'], [['2025-01-01', 2], ['2025-01-02', 2], ['2025-01-03', 1]])
+        self.assertEqual([len(page) for page in pages], [2, 2, 1])
+        self.assertEqual(pages[2][0]['file'], '20250103_090000.md')
+        self.assertEqual((index, pages), self.read_pages())
+    
+    def test_resave_moves_doc_to_end(self):
+        """Saving an earlier review again moves it to the newest position."""
+        first = self.save('20250101_090000')
+        self.save('20250101_100000')
+        self.save('20250101_090000', logger=first)
+        
+        index, pages = self.read_pages()
+        self.assertEqual(index['total'], 2)
+        self.assertEqual([entry['file'] for entry in pages[0]], ['20250101_100000.md', '20250101_090000.md'])
+    
+    def test_compacted_months_grouped(self):
+        """Archive bundles come first under one group; stale pages are removed."""
+        for timestamp in ('20250105_100000', '20250203_100000', '20250310_100000'):
+            logger = self.save(timestamp)
+        (self.pages_dir / 'page-7.json').write_text('[]', encoding='utf-8')
+        logger.compact(keep_days=30, now=datetime(2025, 3, 20))
+        
+        index, pages = self.read_pages()
+        self.assertEqual(index['groups'], [['보관', 2], ['2025-03-10', 1]])
+        self.assertEqual(len(pages), 1)
+        self.assertEqual(pages[0][0]['month'], '2025-01')
+        self.assertTrue(pages[0][0]['archive'])
+
+
+class TestDiffMode(unittest.TestCase):
+    """Test unified-diff storage of modifications (diff_mode=True)."""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.reviews_dir = str(Path(self.tmp.name) / 'reviews')
+        self.old = "\n".join(f"line {i}" for i in range(2000))
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_hunk_only_with_context(self):
+        """Only the changed hunk and `diff_context` lines around it are kept."""
+        new = self.old.replace("line 1000\n", "line 1000 changed\n")
+        for context in (3, 1):
+            logger = CodeChangeLogger("Diff", reviews_dir=self.reviews_dir, diff_mode=True, diff_context=context)
+            logger.log_file_modification("big.py", self.old, new, "one line")
+            change = logger.changes[0]
+            
+            self.assertNotIn('old_content', change)
+            self.assertNotIn('new_content', change)
+            lines = change['diff'].splitlines()
+            self.assertEqual(lines[:2], ['--- a/big.py', '+++ b/big.py'])
+            self.assertEqual(lines[2], f"@@ -{1001 - context},{2 * context + 1} +{1001 - context},{2 * context + 1} @@")
+            self.assertEqual(len(lines), 3 + 2 * context + 2)
+            self.assertEqual(lines[3], f" line {1000 - context}")
+            
+            text = logger.save_review().read_text(encoding='utf-8')
+            self.assertIn("+line 1000 changed", text)
+            self.assertNotIn("line 1500", text)
+            self.assertLess(len(text), 2000)
+    
+    def test_identical_content(self):
+        """An unchanged file records an empty diff shown as `(변경 없음)`."""
+        logger = CodeChangeLogger("Diff", reviews_dir=self.reviews_dir, diff_mode=True)
+        logger.log_file_modification("same.py", self.old, self.old, "no-op")
+        change = logger.changes[0]
+        
+        self.assertEqual((change['diff'], change['added'], change['removed']), ("", 0, 0))
+        text = logger.save_review().read_text(encoding='utf-8')
+        self.assertIn("(+0 / -0)", text)
+        self.assertIn("```diff\n(변경 없음)", text)
+    
+    def test_line_counts(self):
+        """Added/removed counts cover every hunk and ignore the ---/+++ headers."""
+        old = "a\nb\nc\nd\n" + self.old + "\n--x\n++y"
+        new = "a\nB\nB2\nB3\nd\n" + self.old.replace("line 1999", "") + "\n--x\n++y"
+        logger = CodeChangeLogger("Diff", reviews_dir=self.reviews_dir, diff_mode=True)
+        logger.log_bug_fix("f.py", old, new, "bug", "fix")
+        change = logger.changes[0]
+        
+        self.assertEqual((change['added'], change['removed']), (4, 3))
+        self.assertEqual(change['diff'].count("@@ -"), 2)
+        self.assertIn("(+4 / -3)", logger.save_review().read_text(encoding='utf-8'))
+
+
+class TestBlobStore(unittest.TestCase):
+    """Test the content-addressed blob store (blob_store=True)."""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.reviews_dir = Path(self.tmp.name) / 'reviews'
+        self.payload = "def handler():\n    return '결제'\n" * 200
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def save(self, timestamp, content):
+        logger = CodeChangeLogger("Blobs", reviews_dir=str(self.reviews_dir), blob_store=True)
+        logger.timestamp = timestamp
+        logger.log_file_creation("handler.py", content, "added")
+        return logger, logger.save_and_build()
+    
+    def test_identical_payloads_stored_once(self):
+        """The same content in two reviews is one zlib blob keyed by its SHA-256."""
+        logger, _ = self.save('20250101_100000', self.payload)
+        self.save('20250101_110000', self.payload)
+        
+        blobs = list((self.reviews_dir / '.blobs').rglob('*.z'))
+        self.assertEqual(len(blobs), 1)
+        digest = hashlib.sha256(self.payload.encode('utf-8')).hexdigest()
+        self.assertEqual(blobs[0], self.reviews_dir / '.blobs' / digest[:2] / f'{digest}.z')
+        self.assertEqual(zlib.decompress(blobs[0].read_bytes()).decode('utf-8'), self.payload)
+        self.assertLess(blobs[0].stat().st_size, len(self.payload.encode('utf-8')) // 10)
+        self.assertEqual(list((self.reviews_dir / '.blobs').rglob('*.tmp')), [])
+        
+        store = logger.blobs
+        self.assertEqual(store.put(self.payload), digest)
+        self.assertEqual(store.get(digest), self.payload)
+        self.assertEqual(store.get(store.put("")), "")
+    
+    def test_review_links_blob(self):
+        """The review holds a link with the short hash, line count and size instead of the content."""
+        logger, path = self.save('20250101_100000', self.payload)
+        digest = logger.changes[0]['content_blob']
+        size_kb = len(self.payload.encode('utf-8')) / 1024
+        
+        text = path.read_text(encoding='utf-8')
+        self.assertIn(f"[📦 {digest[:12]} · 401줄 · {size_kb:,.1f} KB](.blobs/{digest[:2]}/{digest}.z)\n", text)
+        self.assertNotIn("return '결제'", text)
+    
+    def test_missing_and_corrupt_blobs(self):
+        """`build --full` and the docs server keep working when blobs are gone or damaged."""
+        _, missing_doc = self.save('20250101_100000', self.payload)
+        logger, corrupt_doc = self.save('20250101_110000', "other = 1\n")
+        blob_paths = {path.read_bytes(): path for path in (self.reviews_dir / '.blobs').rglob('*.z')}
+        for data, path in blob_paths.items():
+            if zlib.decompress(data) == self.payload.encode('utf-8'):
+                path.unlink()
+            else:
+                path.write_bytes(b'not zlib')
+        
+        searcher = CodeChangeLogger("Blobs", reviews_dir=str(self.reviews_dir), search_index=True)
+        searcher.build(full=True)
+        self.assertEqual(len(searcher.search('handler')), 2)
+        searcher.close()
+        
+        server = make_docs_server(self.reviews_dir, 0, '127.0.0.1')
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            for doc in (missing_doc, corrupt_doc):
+                with urllib.request.urlopen(f"{base}/_render/{doc.name}") as response:
+                    self.assertIn('.blobs/', response.read().decode('utf-8'))
+            digest = hashlib.sha256(self.payload.encode('utf-8')).hexdigest()
+            with self.assertRaises(urllib.error.HTTPError) as error:
+                urllib.request.urlopen(f"{base}/.blobs/{digest[:2]}/{digest}.z")
+            self.assertEqual(error.exception.code, 404)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class TestManifest(unittest.TestCase):
+    """Test the append-only manifest.jsonl."""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.reviews_dir = Path(self.tmp.name) / 'reviews'
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def save(self, timestamp, request=""):
+        logger = CodeChangeLogger("Manifest", user_request=request, reviews_dir=str(self.reviews_dir))
+        logger.timestamp = timestamp
+        logger.log_file_creation(f"f_{timestamp}.py", "pass", "saved")
+        logger.log_file_deletion("old.py", "pass", "gone")
+        logger.save_and_build()
+        return logger
+    
+    def manifest_lines(self):
+        return (self.reviews_dir / 'manifest.jsonl').read_text(encoding='utf-8').splitlines()
+    
+    def test_one_line_per_save_in_order(self):
+        """Each saved review appends one line; rebuilding from the .md files gives the same entries."""
+        timestamps = ['20250101_100000', '20250101_090000', '20250102_080000']
+        for i, timestamp in enumerate(timestamps):
+            logger = self.save(timestamp, request=f"요청 {i}" if i else "")
+        
+        lines = self.manifest_lines()
+        self.assertEqual([json.loads(line)['file'] for line in lines], [f"{t}.md" for t in timestamps])
+        entry = json.loads(lines[1])
+        self.assertEqual(entry, {
+            'file': '20250101_090000.md',
+            'title': '2025-01-01 09:00:00',
+            'project': 'Manifest',
+            'request': '요청 1',
+            'changes': 2,
+            'files': ['f_20250101_090000.py', 'old.py'],
+        })
+        
+        incremental = sorted(logger.load_manifest(), key=lambda entry: entry['file'])
+        self.assertEqual(logger.rebuild_manifest(), 3)
+        self.assertEqual(logger.load_manifest(), incremental)
+    
+    def test_truncated_last_line(self):
+        """An interrupted append is skipped, and the next review is still registered."""
+        self.save('20250101_100000')
+        with open(self.reviews_dir / 'manifest.jsonl', 'a', encoding='utf-8') as f:
+            f.write('{"file":"20250101_1100')
+        logger = CodeChangeLogger("Manifest", reviews_dir=str(self.reviews_dir))
+        self.assertEqual([entry['file'] for entry in logger.load_manifest()], ['20250101_100000.md'])
+        
+        self.save('20250101_120000')
+        self.assertEqual(
+            [entry['file'] for entry in logger.load_manifest()], ['20250101_100000.md', '20250101_120000.md']
+        )
+        self.assertEqual(len(self.manifest_lines()), 3)
+
+
+class TestRenderMarkdown(unittest.TestCase):
+    """Test render_markdown function."""
+    
+    def test_review_syntax(self):
+        """Headings, lists, fences and links; raw HTML and javascript: links are neutralized."""
+        html = render_markdown(
+            "## T\n- [a](x.md)\n- [b](javascript:void)\n\n```diff\n-<i>\n```\n<script>"
+        )
+        self.assertEqual(html, (
+            '<h2>T</h2>\n<ul>\n<li><a href="x.md">a</a></li>\n<li><a href="#">b</a></li>\n</ul>\n'
+            '<pre><code class="language-diff">-&lt;i&gt;</code></pre>\n<p>&lt;script&gt;</p>\n'
+        ))
+
+
+@unittest.skipUnless(shutil.which('git'), 'git not installed')
+class TestLogFromGit(unittest.TestCase):
+    """Test log_from_git method."""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.repo = Path(self.tmp.name) / 'repo'
+        self.repo.mkdir()
+        self.git('init', '-q')
+        (self.repo / 'keep.py').write_text('a = 1\nb = 2\n', encoding='utf-8')
+        (self.repo / 'old file.py').write_text('gone\n', encoding='utf-8')
+        self.commit('first')
+        
+        (self.repo / 'keep.py').write_text('a = 1\nb = 3\n', encoding='utf-8')
+        (self.repo / 'old file.py').unlink()
+        (self.repo / '새 파일.py').write_text('print("hi")', encoding='utf-8')
+        self.commit('second')
+        
+        self.logger = CodeChangeLogger(
+            "Git", reviews_dir=str(Path(self.tmp.name) / 'reviews'), search_index=False
+        )
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def git(self, *args):
+        subprocess.run(
+            ['git', '-c', 'user.name=t', '-c', 'user.email=t@t', *args],
+            cwd=self.repo, check=True, capture_output=True
+        )
+    
+    def commit(self, message):
+        self.git('add', '-A')
+        self.git('commit', '-q', '-m', message)
+    
+    def test_range_classifies_changes(self):
+        """A range logs creations and deletions with file contents and modifications as diffs."""
+        count = self.logger.log_from_git('HEAD~1..HEAD', 'sync', repo_dir=str(self.repo))
+        
+        self.assertEqual(count, 3)
+        changes = {change['file_path']: change for change in self.logger.changes}
+        self.assertEqual(changes['old file.py']['type'], 'deletion')
+        self.assertEqual(changes['old file.py']['content'], 'gone\n')
+        self.assertEqual(changes['새 파일.py']['type'], 'creation')
+        self.assertEqual(changes['새 파일.py']['content'], 'print("hi")')
+        self.assertEqual(changes['keep.py']['type'], 'modification')
+        self.assertEqual((changes['keep.py']['added'], changes['keep.py']['removed']), (1, 1))
+        self.assertTrue(changes['keep.py']['diff'].startswith('--- a/keep.py\n+++ b/keep.py\n@@'))
+        self.assertEqual({change['reason'] for change in self.logger.changes}, {'sync'})
+    
+    def test_single_commit_and_errors(self):
+        """A single revision is that commit (the root commit included); bad revisions raise."""
+        self.logger.log_from_git('HEAD~1', repo_dir=str(self.repo))
+        self.assertEqual(
+            sorted((change['type'], change['file_path']) for change in self.logger.changes),
+            [('creation', 'keep.py'), ('creation', 'old file.py')]
+        )
+        self.assertEqual(self.logger.changes[0]['reason'], 'git HEAD~1')
+        
+        with self.assertRaises(RuntimeError):
+            self.logger.log_from_git('missing..HEAD', repo_dir=str(self.repo))
+    
+    @unittest.skipIf(os.name == 'nt', "shell script stand-in for git")
+    def test_noisy_stderr_does_not_block(self):
+        """A git that writes more to stderr than a pipe holds before its patch still finishes."""
+        bin_dir = Path(self.tmp.name) / 'bin'
+        bin_dir.mkdir()
+        fake_git = bin_dir / 'git'
+        fake_git.write_text(
+            "#!/bin/sh\n"
+            "head -c 1048576 /dev/zero | tr '\\0' w >&2\n"
+            "printf 'diff --git a/n.py b/n.py\\nnew file mode 100644\\n--- /dev/null\\n+++ b/n.py\\n@@ -0,0 +1 @@\\n+x\\n'\n",
+            encoding='utf-8'
+        )
+        fake_git.chmod(0o755)
+        
+        result = []
+        with mock.patch.dict(os.environ, {'PATH': f"{bin_dir}{os.pathsep}{os.environ['PATH']}"}):
+            worker = threading.Thread(
+                target=lambda: result.append(self.logger.log_from_git('HEAD', repo_dir=str(self.repo))),
+                daemon=True
+            )
+            worker.start()
+            worker.join(timeout=30)
+        self.assertFalse(worker.is_alive())
+        self.assertEqual(result, [1])
+        self.assertEqual(self.logger.changes[0]['content'], 'x\n')
+
+
+class TestStreamingWrite(unittest.TestCase):
+    """Test streamed review writing."""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_failed_stream_keeps_previous_file(self):
+        """An error mid-stream removes the temp file and leaves the old document."""
+        path = self.dir / 'doc.md'
+        path.write_text('old', encoding='utf-8')
+        
+        def chunks():
+            yield 'new'
+            raise RuntimeError('boom')
+        
+        with self.assertRaises(RuntimeError):
+            atomic_write_chunks(path, chunks())
+        self.assertEqual(path.read_text(encoding='utf-8'), 'old')
+        self.assertEqual(list(self.dir.glob('*.tmp')), [])
+    
+    def test_large_content_written_through(self):
+        """Contents larger than one write chunk land in the review unchanged."""
+        logger = CodeChangeLogger("Big", reviews_dir=str(self.dir / 'reviews'), search_index=False)
+        content = "가나다 = 1\n" * 200_000
+        logger.log_file_creation("big.py", content, "large")
+        text = logger.save_review().read_text(encoding='utf-8')
+        
+        self.assertIn(f"**내용**:\n```\n{content}\n```\n", text)
+        self.assertTrue(text.endswith("**총 변경사항**: 1개\n"))
+
+
+class TestDisplayName(unittest.TestCase):
+    """Test display_name function."""
+    
+    def test_suffixed_names(self):
+        """Reviews saved in the same second are numbered."""
+        self.assertEqual(display_name('20250101_120000'), '2025-01-01 12:00:00')
+        self.assertEqual(display_name('20250101_120000_3'), '2025-01-01 12:00:00 (3)')
+        self.assertEqual(display_name('notes'), 'notes')
+
+
+if __name__ == '__main__':
+    unittest.main()
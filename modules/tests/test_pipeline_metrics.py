@@ -0,0 +1,160 @@
+"""Tests for per-stage pipeline metrics."""
+import sys
+import json
+import time
+import tempfile
+import unittest
+import subprocess
+from pathlib import Path
+from modules import pipeline_metrics
+from modules.pipeline_metrics import PipelineMetrics, write_prometheus_textfile
+
+
+def busy(seconds):
+    """Burn CPU in this process for about `seconds`"""
+    end = time.process_time() + seconds
+    while time.process_time() < end:
+        pass
+
+
+class TestStage(unittest.TestCase):
+    """Test PipelineMetrics.stage timing and status."""
+    
+    def setUp(self):
+        self.metrics = PipelineMetrics('060000', {'query': 'rpg'})
+    
+    def test_success(self):
+        """A stage that returns is recorded as ok with its counters and timings."""
+        with self.metrics.stage('ranker', in_process=True) as step:
+            time.sleep(0.05)
+            busy(0.05)
+            step['items_in'] = 10
+            step['items_out'] = 5
+        
+        record, = self.metrics.stages
+        self.assertEqual(record['stage'], 'ranker')
+        self.assertEqual(record['status'], 'ok')
+        self.assertEqual((record['items_in'], record['items_out']), (10, 5))
+        self.assertGreaterEqual(record['wall_ms'], 100)
+        self.assertGreaterEqual(record['cpu_ms'], 40)
+        self.assertLess(record['cpu_ms'], record['wall_ms'])
+        if pipeline_metrics.resource is not None:
+            self.assertGreater(record['peak_rss_bytes'], 0)
+    
+    def test_exception(self):
+        """A stage that raises is recorded as error and the exception propagates."""
+        with self.assertRaises(ValueError):
+            with self.metrics.stage('ingest_play') as step:
+                step['http_requests'] = 3
+                time.sleep(0.02)
+                raise ValueError('boom')
+        
+        record, = self.metrics.stages
+        self.assertEqual(record['status'], 'error')
+        self.assertEqual(record['http_requests'], 3)
+        self.assertGreaterEqual(record['wall_ms'], 20)
+    
+    def test_caller_status_kept(self):
+        """A status set by the caller is not overwritten with ok."""
+        with self.metrics.stage('publish_html') as step:
+            step['status'] = 'failed'
+        self.assertEqual(self.metrics.stages[0]['status'], 'failed')
+    
+    @unittest.skipIf(pipeline_metrics.resource is None, 'resource module not available')
+    def test_cpu_follows_where_the_stage_runs(self):
+        """Subprocess stages count the children's CPU; in-process stages count the runner's."""
+        with self.metrics.stage('ingest_play'):
+            busy(0.3)
+            subprocess.run([sys.executable, '-c', 'pass'], check=True)
+        with self.metrics.stage('ranker', in_process=True):
+            busy(0.05)
+        
+        subprocess_stage, in_process_stage = self.metrics.stages
+        # The runner's own 300 ms are not charged to a subprocess stage
+        self.assertLess(subprocess_stage['cpu_ms'], 200)
+        self.assertGreater(subprocess_stage['cpu_ms'], 0)
+        self.assertGreaterEqual(in_process_stage['cpu_ms'], 40)
+    
+    @unittest.skipIf(pipeline_metrics.resource is None, 'resource module not available')
+    def test_peak_rss_follows_where_the_stage_runs(self):
+        """Subprocess stages report the children's peak; in-process stages only the runner's."""
+        # The child peaks well above anything the runner has reached so far
+        child_bytes = pipeline_metrics._usage(True)['max_rss_bytes'] + 128 * 1024 * 1024
+        child = f'x = bytearray({child_bytes}); x[::4096] = b"1" * len(x[::4096])'
+        with self.metrics.stage('ingest_play'):
+            subprocess.run([sys.executable, '-c', child], check=True)
+        with self.metrics.stage('ranker', in_process=True):
+            pass
+        
+        subprocess_stage, in_process_stage = self.metrics.stages
+        self.assertGreaterEqual(subprocess_stage['peak_rss_bytes'], child_bytes)
+        self.assertLess(in_process_stage['peak_rss_bytes'], child_bytes)
+
+
+class TestSave(unittest.TestCase):
+    """Test metrics.json and metrics.prom output."""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.tmp.name) / 'run'
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_json_shape(self):
+        """metrics.json holds the run fields and one record per stage."""
+        metrics = PipelineMetrics('060000', {'query': 'rpg', 'country': 'KR'})
+        with metrics.stage('ingest_play') as step:
+            step['items_out'] = 7
+        with metrics.stage('ranker'):
+            pass
+        
+        path = metrics.save(self.output_dir)
+        self.assertEqual(path, self.output_dir / 'metrics.json')
+        self.assertFalse((self.output_dir / 'metrics.prom').exists())
+        
+        document = json.loads(path.read_text(encoding='utf-8'))
+        self.assertEqual(
+            set(document), {'run_id', 'started_at', 'total_wall_ms', 'labels', 'stages'}
+        )
+        self.assertEqual(document['run_id'], '060000')
+        self.assertEqual(document['labels'], {'query': 'rpg', 'country': 'KR'})
+        self.assertEqual([stage['stage'] for stage in document['stages']], ['ingest_play', 'ranker'])
+        self.assertEqual(
+            set(document['stages'][0]),
+            {'stage', 'status', 'items_in', 'items_out', 'http_requests', 'bytes_written',
+             'wall_ms', 'cpu_ms', 'peak_rss_bytes'}
+        )
+        self.assertEqual(document['stages'][0]['items_out'], 7)
+    
+    def test_prometheus_label_escaping(self):
+        """Backslashes, quotes and newlines in label values are escaped."""
+        metrics = PipelineMetrics('060000', {'query': 'say "hi"\\now\nnext'})
+        with metrics.stage('ranker'):
+            pass
+        metrics.save(self.output_dir, prometheus=True)
+        
+        text = (self.output_dir / 'metrics.prom').read_text(encoding='utf-8')
+        self.assertFalse(list(self.output_dir.glob('*.tmp')))
+        labels = 'run_id="060000",query="say \\"hi\\"\\\\now\\nnext"'
+        self.assertIn(f'pipeline_stage_wall_seconds{{{labels},stage="ranker"}} ', text)
+        self.assertIn(f'pipeline_run_wall_seconds{{{labels}}} ', text)
+        # One sample per line: the raw newline never reaches the file
+        for line in text.splitlines():
+            self.assertTrue(line.startswith(('# HELP ', '# TYPE ', 'pipeline_')), line)
+    
+    def test_prometheus_values_scaled(self):
+        """Millisecond fields are exported in seconds."""
+        document = {
+            'run_id': 'r', 'total_wall_ms': 2500, 'labels': {},
+            'stages': [{'stage': 's', 'wall_ms': 1500, 'cpu_ms': 250, 'items_out': 4}],
+        }
+        text = write_prometheus_textfile(document, Path(self.tmp.name) / 'm.prom').read_text(encoding='utf-8')
+        self.assertIn('pipeline_stage_wall_seconds{run_id="r",stage="s"} 1.5\n', text)
+        self.assertIn('pipeline_stage_cpu_seconds{run_id="r",stage="s"} 0.25\n', text)
+        self.assertIn('pipeline_stage_items_out{run_id="r",stage="s"} 4\n', text)
+        self.assertIn('pipeline_run_wall_seconds{run_id="r"} 2.5\n', text)
+
+
+if __name__ == '__main__':
+    unittest.main()
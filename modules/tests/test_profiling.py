@@ -0,0 +1,141 @@
+"""Tests for opt-in skill profiling."""
+import os
+import sys
+import pstats
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from modules import profiling
+from modules.profiling import run_profiled
+from pipelines import run_pipeline
+
+
+def fibonacci(n):
+    return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)
+
+
+def workload():
+    return sum(fibonacci(n) for n in range(15))
+
+
+class TestRunProfiled(unittest.TestCase):
+    """Test run_profiled with and without PROFILE."""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.profile_dir = Path(self.tmp.name) / 'profile'
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def profile_env(self, **values):
+        env = {'PROFILE_DIR': str(self.profile_dir), **values}
+        patcher = mock.patch.dict(os.environ, env)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_profile_writes_reports(self):
+        """PROFILE=1 writes <stage>.prof and a top-N summary under PROFILE_DIR."""
+        self.profile_env(PROFILE='1', PROFILE_TOP='3')
+        self.assertEqual(run_profiled('ranker', workload), workload())
+        
+        self.assertEqual(
+            sorted(path.name for path in self.profile_dir.iterdir()),
+            ['ranker.hotspots.txt', 'ranker.prof']
+        )
+        stats = pstats.Stats(str(self.profile_dir / 'ranker.prof'))
+        self.assertIn('fibonacci', {func[2] for func in stats.stats})
+        hotspots = (self.profile_dir / 'ranker.hotspots.txt').read_text(encoding='utf-8')
+        self.assertIn('fibonacci', hotspots)
+        # Both the cumulative and the tottime listing are cut to PROFILE_TOP
+        self.assertEqual(hotspots.count('due to restriction <3>'), 2)
+    
+    def test_memory_mode(self):
+        """PROFILE=mem writes only the tracemalloc summary."""
+        self.profile_env(PROFILE='mem')
+        run_profiled('ingest_play', lambda: [bytes(1024) for _ in range(100)])
+        
+        self.assertEqual([path.name for path in self.profile_dir.iterdir()], ['ingest_play.memory.txt'])
+        report = (self.profile_dir / 'ingest_play.memory.txt').read_text(encoding='utf-8')
+        self.assertTrue(report.startswith('Peak traced memory: '))
+    
+    def test_reports_written_when_func_raises(self):
+        """A failing or exiting stage still leaves its profile behind."""
+        self.profile_env(PROFILE='cpu')
+        
+        def fail():
+            workload()
+            sys.exit(2)
+        
+        with self.assertRaises(SystemExit):
+            run_profiled('publish_html', fail)
+        self.assertTrue((self.profile_dir / 'publish_html.prof').exists())
+    
+    def test_disabled_is_a_plain_call(self):
+        """Without PROFILE nothing is profiled, traced or written."""
+        self.profile_env()
+        os.environ.pop('PROFILE', None)
+        with mock.patch.object(profiling.cProfile, 'Profile') as profile, \
+                mock.patch.object(profiling.tracemalloc, 'start') as start, \
+                mock.patch.object(profiling, 'default_profile_dir') as default_dir:
+            self.assertEqual(run_profiled('ranker', workload), workload())
+        
+        profile.assert_not_called()
+        start.assert_not_called()
+        default_dir.assert_not_called()
+        self.assertFalse(self.profile_dir.exists())
+        
+        with mock.patch.dict(os.environ, {'PROFILE': '0'}):
+            run_profiled('ranker', workload)
+        self.assertFalse(self.profile_dir.exists())
+
+
+class TestRunSkillInProcess(unittest.TestCase):
+    """Test run_skill_in_process isolation."""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def run_skill(self, name, body):
+        """Run a stand-in skill whose main() records its argv and env, then runs `body`"""
+        path = Path(self.tmp.name) / f"{name}.py"
+        path.write_text(
+            "import os, sys\nseen = {}\n\n"
+            "def main():\n    seen['argv'] = list(sys.argv)\n"
+            f"    seen['env'] = os.environ.get('SKILL_TEST_VALUE')\n{body}\n",
+            encoding='utf-8'
+        )
+        self.addCleanup(run_pipeline._skill_modules.pop, name, None)
+        return run_pipeline.run_skill_in_process(name, path, {'SKILL_TEST_VALUE': 'stage'})
+    
+    def seen(self, name):
+        return run_pipeline._skill_modules[name].seen
+    
+    def test_restores_env_and_argv_on_raise(self):
+        """The skill sees its own env and argv; both are restored even if it raises."""
+        argv = list(sys.argv)
+        with mock.patch.dict(os.environ, {'SKILL_TEST_VALUE': 'runner'}):
+            with self.assertRaises(RuntimeError):
+                self.run_skill('raises_skill', "    raise RuntimeError('boom')")
+            self.assertEqual(os.environ['SKILL_TEST_VALUE'], 'runner')
+        self.assertEqual(sys.argv, argv)
+        self.assertEqual(self.seen('raises_skill'), {
+            'argv': [str(Path(self.tmp.name) / 'raises_skill.py')],
+            'env': 'stage',
+        })
+    
+    def test_unset_env_removed_and_exit_code(self):
+        """Variables the runner did not have are removed; sys.exit codes are returned."""
+        with mock.patch.dict(os.environ):
+            os.environ.pop('SKILL_TEST_VALUE', None)
+            self.assertEqual(self.run_skill('exits_skill', "    sys.exit(3)"), 3)
+            self.assertNotIn('SKILL_TEST_VALUE', os.environ)
+        self.assertEqual(self.seen('exits_skill')['env'], 'stage')
+
+
+if __name__ == '__main__':
+    unittest.main()
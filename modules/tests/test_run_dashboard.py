@@ -0,0 +1,109 @@
+"""Tests for the incremental run dashboard."""
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from datetime import datetime
+from unittest import mock
+from modules.run_dashboard import INDEX_HTML, JS_HEADER, RunDashboard, build_run_record
+
+
+def make_games(count):
+    return [
+        {'title': f'Game {i}', 'genre': 'RPG', 'final_score': 1 - i / 100}
+        for i in range(count)
+    ]
+
+
+class TestRunDashboard(unittest.TestCase):
+    """Test RunDashboard manifest and rebuild."""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.outputs = Path(self.tmp.name) / 'outputs'
+        self.dashboard = RunDashboard(self.outputs)
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def make_run(self, date, run_id, hour, title_count=3):
+        """outputs/<date>/<run_id> with ranked_games.json, metrics.json and a report"""
+        run_dir = self.outputs / date / run_id
+        (run_dir / 'artifacts').mkdir(parents=True)
+        (run_dir / 'reports').mkdir()
+        games = make_games(title_count)
+        (run_dir / 'artifacts' / 'ranked_games.json').write_text(json.dumps(games), encoding='utf-8')
+        started_at = datetime(2025, 11, 7, hour)
+        (run_dir / 'metrics.json').write_text(json.dumps({
+            'started_at': started_at.isoformat(),
+            'labels': {'query': 'rpg', 'country': 'KR'},
+        }), encoding='utf-8')
+        report = run_dir / 'reports' / 'game_ranking.html'
+        report.write_text('<html></html>', encoding='utf-8')
+        return build_run_record(run_dir, games, 'rpg', 'KR', started_at, str(report))
+    
+    def read_lines(self, path):
+        return path.read_text(encoding='utf-8').splitlines()
+    
+    def test_add_run_appends(self):
+        """Each run appends one manifest line and one runs.js line; earlier runs are not read again."""
+        first = self.make_run('20251107', '060000', 6)
+        self.dashboard.add_run(first)
+        manifest_before = self.dashboard.manifest_path.read_bytes()
+        
+        second = self.make_run('20251107', '070000', 7)
+        shutil.rmtree(self.outputs / '20251107' / '060000')
+        with mock.patch('modules.run_dashboard.json.load') as load:
+            index = self.dashboard.add_run(second)
+        load.assert_not_called()
+        
+        manifest = self.dashboard.manifest_path.read_bytes()
+        self.assertTrue(manifest.startswith(manifest_before))
+        self.assertEqual(len(self.read_lines(self.dashboard.manifest_path)), 2)
+        script = self.read_lines(self.dashboard.script_path)
+        self.assertEqual(script[0] + '\n', JS_HEADER)
+        self.assertEqual(len(script), 3)
+        self.assertTrue(script[2].startswith('DASHBOARD_RUNS.push({'))
+        self.assertEqual(index.read_text(encoding='utf-8'), INDEX_HTML)
+        self.assertEqual([run['run_id'] for run in self.dashboard.load_manifest()], ['070000', '060000'])
+    
+    def test_rebuild_matches_incremental(self):
+        """Rebuilding from the run directories writes the same files as registering runs one by one."""
+        records = [self.make_run('20251107', '060000', 6), self.make_run('20251108', '060000', 8)]
+        for record in records:
+            self.dashboard.add_run(record)
+        incremental = [
+            path.read_bytes()
+            for path in (self.dashboard.manifest_path, self.dashboard.script_path, self.dashboard.index_path)
+        ]
+        
+        self.assertEqual(self.dashboard.rebuild(), 2)
+        rebuilt = [
+            path.read_bytes()
+            for path in (self.dashboard.manifest_path, self.dashboard.script_path, self.dashboard.index_path)
+        ]
+        self.assertEqual(rebuilt, incremental)
+        self.assertEqual(self.dashboard.load_manifest()[0]['report'], '../20251108/060000/reports/game_ranking.html')
+    
+    def test_corrupt_lines_skipped(self):
+        """Torn or foreign manifest lines are skipped; a torn runs.js is rewritten so it stays valid."""
+        self.dashboard.add_run(self.make_run('20251107', '060000', 6))
+        with open(self.dashboard.manifest_path, 'a', encoding='utf-8') as f:
+            f.write('[1]\n{}\n{"date": "20251107", "run_')
+        with open(self.dashboard.script_path, 'a', encoding='utf-8') as f:
+            f.write('DASHBOARD_RUNS.push({"da')
+        
+        self.assertEqual(len(self.dashboard.load_manifest()), 1)
+        self.dashboard.add_run(self.make_run('20251107', '070000', 7))
+        self.assertEqual([run['run_id'] for run in self.dashboard.load_manifest()], ['070000', '060000'])
+        script = self.read_lines(self.dashboard.script_path)
+        self.assertEqual(script[0] + '\n', JS_HEADER)
+        for line in script[1:]:
+            self.assertTrue(line.startswith('DASHBOARD_RUNS.push(') and line.endswith(');'), line)
+            json.loads(line[len('DASHBOARD_RUNS.push('):-2])
+        self.assertEqual(len(script), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
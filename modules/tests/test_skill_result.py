@@ -0,0 +1,111 @@
+"""Tests for the skill result-file protocol."""
+import io
+import os
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from contextlib import redirect_stdout
+from modules.skill_result import RESULT_PATH_ENV, SkillResultError, emit_result, read_result
+from pipelines import run_pipeline
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+
+class TestEmitResult(unittest.TestCase):
+    """Test emit_result and read_result."""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.result_path = Path(self.tmp.name) / 'result.json'
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_atomic_write(self):
+        """The result is written to a temp file and renamed over SKILL_RESULT_PATH."""
+        real_replace = os.replace
+        
+        def check_replace(src, dst):
+            # The target appears only by rename, with the complete document
+            self.assertEqual((src, dst), (f"{self.result_path}.tmp", str(self.result_path)))
+            self.assertFalse(self.result_path.exists())
+            self.assertEqual(json.loads(Path(src).read_text(encoding='utf-8'))['title'], '게임')
+            real_replace(src, dst)
+        
+        stdout = io.StringIO()
+        with mock.patch.dict(os.environ, {RESULT_PATH_ENV: str(self.result_path)}), \
+                mock.patch('modules.skill_result.os.replace', side_effect=check_replace) as replace, \
+                redirect_stdout(stdout):
+            emit_result({'title': '게임', 'total_items': 3})
+        
+        replace.assert_called_once()
+        self.assertEqual(stdout.getvalue(), '')
+        self.assertEqual(read_result(self.result_path), {'title': '게임', 'total_items': 3})
+        self.assertEqual(os.listdir(self.tmp.name), ['result.json'])
+    
+    def test_standalone_prints_json(self):
+        """Without SKILL_RESULT_PATH the result is one JSON line on stdout."""
+        stdout = io.StringIO()
+        with mock.patch.dict(os.environ), redirect_stdout(stdout):
+            os.environ.pop(RESULT_PATH_ENV, None)
+            emit_result({'total_items': 3})
+        
+        self.assertEqual(stdout.getvalue(), '{"total_items": 3}\n')
+        self.assertEqual(os.listdir(self.tmp.name), [])
+    
+    def test_read_missing_or_invalid(self):
+        """Missing and half-written files read as None."""
+        self.assertIsNone(read_result(self.result_path))
+        self.result_path.write_text('{"total', encoding='utf-8')
+        self.assertIsNone(read_result(self.result_path))
+
+
+class TestRunSkill(unittest.TestCase):
+    """Test run_skill against stand-in skill scripts."""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def skill(self, name, body):
+        """Write a skill entry point and make run_skill resolve `name` to it"""
+        path = Path(self.tmp.name) / f"{name}.py"
+        path.write_text(
+            f"import sys\nsys.path.insert(0, {str(PROJECT_ROOT)!r})\n"
+            "from modules.skill_result import emit_result\n\n"
+            f"def main():\n{body}\n\n"
+            "if __name__ == '__main__':\n    sys.exit(main())\n",
+            encoding='utf-8'
+        )
+        patcher = mock.patch.object(run_pipeline, 'resolve_skill_path', return_value=path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_result_returned(self):
+        """The result file written by the skill is returned, in a subprocess and in process."""
+        self.skill('emits_result', "    emit_result({'total_items': 2})\n    return 0")
+        for in_process in (False, True):
+            self.assertEqual(run_pipeline.run_skill('emits_result', {}, in_process), {'total_items': 2})
+    
+    def test_missing_result_raises(self):
+        """A skill exiting 0 without writing its result raises SkillResultError."""
+        self.skill('forgets_result', "    print('{\"total_items\": 2}')\n    return 0")
+        for in_process in (False, True):
+            with redirect_stdout(io.StringIO()), self.assertRaises(SkillResultError) as error:
+                run_pipeline.run_skill('forgets_result', {}, in_process)
+            self.assertIn('forgets_result', str(error.exception))
+            self.assertIn(RESULT_PATH_ENV, str(error.exception))
+    
+    def test_failed_exit_code(self):
+        """A non-zero exit is a failure (None), not a missing result."""
+        self.skill('fails', "    return 3")
+        with redirect_stdout(io.StringIO()):
+            self.assertIsNone(run_pipeline.run_skill('fails', {}))
+
+
+if __name__ == '__main__':
+    unittest.main()
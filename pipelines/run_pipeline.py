@@ -6,13 +6,24 @@ Integrates ingest_play → ranker → publish_html
 import os
 import sys
 import json
+import tempfile
 import subprocess
+import importlib.util
 import argparse
 import logging
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, Optional
 
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules.pipeline_metrics import PipelineMetrics, file_size
+from modules.profiling import run_profiled, PROFILE_MODES
+from modules.skill_result import RESULT_PATH_ENV, SkillResultError, read_result
+from modules.run_dashboard import RunDashboard, build_run_record
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -55,59 +66,126 @@ def print_info(message: str):
     print(f"{Colors.WARNING}ℹ {message}{Colors.ENDC}")
 
 
-def run_skill(skill_name: str, env_vars: Dict[str, str]) -> Optional[Dict[str, Any]]:
+def resolve_skill_path(skill_name: str) -> Optional[Path]:
+    """Find a skill's entry point (handler.py, or scorer.py for ranker)"""
+    skill_path = Path(f"skills/{skill_name}/handler.py")
+    if not skill_path.exists():
+        # Try scorer.py for ranker
+        skill_path = Path(f"skills/{skill_name}/scorer.py")
+        if not skill_path.exists():
+            return None
+    return skill_path
+
+
+def find_run_ranking(run_ref: str) -> Optional[Path]:
+    """
+    ranked_games.json of a previous run, given '<run_id>' (latest date
+    wins) or '<date>/<run_id>'
+    """
+    if '/' in run_ref:
+        candidates = [Path('outputs') / run_ref / 'artifacts' / 'ranked_games.json']
+    else:
+        candidates = sorted(Path('outputs').glob(f'*/{run_ref}/artifacts/ranked_games.json'), reverse=True)
+    for path in candidates:
+        if path.exists():
+            return path
+    return None
+
+
+# Skill modules loaded by in-process mode, reused across runs
+_skill_modules: Dict[str, Any] = {}
+
+
+def _load_skill_module(skill_name: str, skill_path: Path):
+    if skill_name not in _skill_modules:
+        spec = importlib.util.spec_from_file_location(f"skill_{skill_name}", skill_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _skill_modules[skill_name] = module
+    return _skill_modules[skill_name]
+
+
+def run_skill_in_process(skill_name: str, skill_path: Path, env_vars: Dict[str, str]) -> int:
+    """
+    Run a skill's main() inside the runner process.
+
+    Avoids interpreter start-up and re-importing dependencies for every
+    stage. Environment variables and sys.argv (as a subprocess would see
+    it) are applied for the duration of the call and restored afterwards,
+    even if the skill raises.
+
+    Returns:
+        The skill's exit code
+    """
+    saved_env = {key: os.environ.get(key) for key in env_vars}
+    saved_argv = sys.argv
+    os.environ.update(env_vars)
+    sys.argv = [str(skill_path)]
+    try:
+        module = _load_skill_module(skill_name, skill_path)
+        try:
+            exit_code = run_profiled(skill_name, module.main)
+        except SystemExit as e:
+            exit_code = e.code
+    finally:
+        sys.argv = saved_argv
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+    return exit_code or 0
+
+
+def run_skill(skill_name: str, env_vars: Dict[str, str], in_process: bool = False) -> Optional[Dict[str, Any]]:
     """
     Run a skill and return its JSON output
     
     Args:
         skill_name: Name of the skill (e.g., 'ingest_play')
         env_vars: Environment variables to set
+        in_process: Call the skill's main() in this process instead of a subprocess
         
     Returns:
         Dictionary of JSON output or None if failed
+
+    Raises:
+        SkillResultError: The skill exited with 0 but wrote no result (a
+            skill that does not call emit_result)
     """
-    skill_path = Path(f"skills/{skill_name}/handler.py")
-    if not skill_path.exists():
-        # Try scorer.py for ranker
-        skill_path = Path(f"skills/{skill_name}/scorer.py")
-        if not skill_path.exists():
-            print_error(f"Skill not found: {skill_name}")
-            return None
-    
-    # Prepare environment
-    env = os.environ.copy()
-    env.update(env_vars)
+    skill_path = resolve_skill_path(skill_name)
+    if not skill_path:
+        print_error(f"Skill not found: {skill_name}")
+        return None
     
-    # Run skill
-    try:
-        result = subprocess.run(
-            [sys.executable, str(skill_path)],
-            env=env,
-            capture_output=True,
-            text=True
-        )
+    with tempfile.TemporaryDirectory(prefix=f"{skill_name}_") as tmp_dir:
+        # The skill writes its JSON result here; stdout/stderr stay free for logs
+        result_path = Path(tmp_dir) / 'result.json'
+        skill_env = {**env_vars, RESULT_PATH_ENV: str(result_path)}
         
-        if result.returncode != 0:
-            print_error(f"Skill {skill_name} failed")
-            print(result.stderr)
+        try:
+            if in_process:
+                returncode = run_skill_in_process(skill_name, skill_path, skill_env)
+            else:
+                # Logs are inherited by the child and stream live to the console
+                env = os.environ.copy()
+                env.update(skill_env)
+                returncode = subprocess.run([sys.executable, str(skill_path)], env=env).returncode
+        except Exception as e:
+            print_error(f"Failed to run {skill_name}: {e}")
             return None
         
-        # Extract JSON from output (last line)
-        output_lines = result.stdout.strip().split('\n')
-        for line in reversed(output_lines):
-            line = line.strip()
-            if line.startswith('{') and line.endswith('}'):
-                try:
-                    return json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-        
-        print_error(f"No valid JSON output from {skill_name}")
-        return None
+        if returncode != 0:
+            print_error(f"Skill {skill_name} failed (exit code {returncode})")
+            return None
         
-    except Exception as e:
-        print_error(f"Failed to run {skill_name}: {e}")
-        return None
+        output = read_result(result_path)
+        if output is None:
+            raise SkillResultError(
+                f"Skill {skill_name} exited with 0 but wrote no result to {RESULT_PATH_ENV} "
+                f"({result_path}); does it call emit_result()?"
+            )
+        return output
 
 
 def main():
@@ -165,6 +243,40 @@ Examples:
         action='store_true',
         help='Generate HTML report after ranking'
     )
+    parser.add_argument(
+        '--report-mode',
+        choices=['cards', 'virtual', 'pages'],
+        default='cards',
+        help='HTML layout: cards (all DOM cards), virtual (virtual scrolling), pages (page-N.html) (default: cards)'
+    )
+    parser.add_argument(
+        '--page-size',
+        type=int,
+        default=100,
+        help='Games per page/render batch for --report-mode virtual|pages (default: 100)'
+    )
+    parser.add_argument(
+        '--asset-mode',
+        choices=['inline', 'shared'],
+        default='inline',
+        help='inline CSS/JS, or link content-hashed files in outputs/assets (default: inline)'
+    )
+    parser.add_argument(
+        '--compress',
+        default='',
+        help='Also write precompressed report siblings: gzip, br or gzip,br (default: none)'
+    )
+    parser.add_argument(
+        '--icons',
+        choices=['none', 'lazy', 'inline'],
+        default='none',
+        help='Game icons: none, lazy (<img loading="lazy"> from outputs/cache/icons) or inline (data URIs) (default: none)'
+    )
+    parser.add_argument(
+        '--diff-against',
+        metavar='RUN_ID',
+        help='Also write reports/rank_diff.html against a previous run (<run_id> or <date>/<run_id>)'
+    )
     parser.add_argument(
         '--open-browser',
         action='store_true',
@@ -176,6 +288,28 @@ Examples:
         '--run-id',
         help='Custom run ID (default: HHMMSS)'
     )
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const='cpu',
+        choices=PROFILE_MODES,
+        help='Profile each stage: cpu (cProfile), mem (tracemalloc) or all (default: cpu)'
+    )
+    parser.add_argument(
+        '--in-process',
+        action='store_true',
+        help='Run skills inside the runner process instead of subprocesses'
+    )
+    parser.add_argument(
+        '--no-dashboard',
+        action='store_true',
+        help='Do not register the run in outputs/dashboard'
+    )
+    parser.add_argument(
+        '--prometheus',
+        action='store_true',
+        help='Also write metrics in Prometheus textfile format (metrics.prom)'
+    )
     parser.add_argument(
         '--log-level',
         default='INFO',
@@ -201,9 +335,20 @@ Examples:
     print(f"Run ID:   {run_id}")
     if args.html:
         print(f"HTML:     Enabled")
+    if args.profile:
+        print(f"Profile:  {args.profile}")
+    if args.in_process:
+        print(f"Mode:     in-process")
     print()
     
-    start_time = datetime.now()
+    metrics = PipelineMetrics(run_id, labels={'query': args.query, 'country': args.country})
+    run_dir = Path('outputs') / metrics.started_at.strftime('%Y%m%d') / run_id
+    
+    # Settings shared by every skill
+    common_env = {}
+    if args.profile:
+        common_env['PROFILE'] = args.profile
+        common_env['PROFILE_DIR'] = str((run_dir / 'profile').absolute())
     
     # ========================================
     # Step 1: Collect games (ingest_play)
@@ -216,26 +361,36 @@ Examples:
         'LANGUAGE': args.language,
         'LIMIT': str(args.limit),
         'RUN_ID': run_id,
-        'LOG_LEVEL': args.log_level
+        'LOG_LEVEL': args.log_level,
+        **common_env
     }
     
-    step1_start = datetime.now()
-    result1 = run_skill('ingest_play', step1_env)
+    with metrics.stage('ingest_play', args.in_process) as step1:
+        result1 = run_skill('ingest_play', step1_env, args.in_process)
+        if result1:
+            raw_items_path = result1.get('raw_items_path')
+            raw_count = result1.get('total_items', 0)
+            step1.update(
+                items_in=result1.get('input_items', 0),
+                items_out=raw_count,
+                http_requests=result1.get('http_requests', 0),
+                bytes_written=file_size(raw_items_path)
+            )
+        else:
+            step1['status'] = 'failed'
     
     if not result1:
         print_error("Step 1 failed")
+        metrics.save(run_dir, args.prometheus)
         return 1
     
-    raw_items_path = result1.get('raw_items_path')
-    raw_count = result1.get('total_items', 0)
-    
-    step1_duration = datetime.now() - step1_start
     print_success(f"Collected {raw_count} games")
     print(f"   Output: {raw_items_path}")
-    print(f"   Duration: {step1_duration.seconds}s")
+    print(f"   Duration: {step1['wall_ms'] / 1000:.3f}s")
     
     if raw_count == 0:
         print_error("No games collected. Try different query or country.")
+        metrics.save(run_dir, args.prometheus)
         return 1
     
     # ========================================
@@ -247,24 +402,32 @@ Examples:
         'RAW_ITEMS_PATH': raw_items_path,
         'TOP_K': str(args.top_k),
         'RUN_ID': run_id,
-        'LOG_LEVEL': args.log_level
+        'LOG_LEVEL': args.log_level,
+        **common_env
     }
     
-    step2_start = datetime.now()
-    result2 = run_skill('ranker', step2_env)
+    with metrics.stage('ranker', args.in_process) as step2:
+        result2 = run_skill('ranker', step2_env, args.in_process)
+        if result2:
+            ranked_items_path = result2.get('ranked_items_path')
+            ranked_count = result2.get('total_items', 0)
+            step2.update(
+                items_in=result2.get('input_items', raw_count),
+                items_out=ranked_count,
+                bytes_written=file_size(ranked_items_path)
+            )
+        else:
+            step2['status'] = 'failed'
     
     if not result2:
         print_error("Step 2 failed")
         print_info(f"Raw data preserved: {raw_items_path}")
+        metrics.save(run_dir, args.prometheus)
         return 1
     
-    ranked_items_path = result2.get('ranked_items_path')
-    ranked_count = result2.get('total_items', 0)
-    
-    step2_duration = datetime.now() - step2_start
     print_success(f"Ranked top {ranked_count} games")
     print(f"   Output: {ranked_items_path}")
-    print(f"   Duration: {step2_duration.seconds}s")
+    print(f"   Duration: {step2['wall_ms'] / 1000:.3f}s")
     
     # ========================================
     # Step 3: Generate HTML report (optional)
@@ -279,22 +442,37 @@ Examples:
             'QUERY': args.query,
             'COUNTRY': args.country,
             'RUN_ID': run_id,
-            'LOG_LEVEL': args.log_level
+            'REPORT_MODE': args.report_mode,
+            'PAGE_SIZE': str(args.page_size),
+            'ASSET_MODE': args.asset_mode,
+            'COMPRESS': args.compress,
+            'ICON_MODE': args.icons,
+            'LOG_LEVEL': args.log_level,
+            **common_env
         }
         
-        step3_start = datetime.now()
-        result3 = run_skill('publish_html', step3_env)
+        with metrics.stage('publish_html', args.in_process) as step3:
+            result3 = run_skill('publish_html', step3_env, args.in_process)
+            if result3:
+                html_report_path = result3.get('html_report_path')
+                step3.update(
+                    items_in=result3.get('total_games', ranked_count),
+                    items_out=1,
+                    http_requests=result3.get('http_requests', 0),
+                    bytes_written=result3.get('report_bytes', file_size(html_report_path))
+                )
+            else:
+                step3['status'] = 'failed'
         
         if not result3:
             print_error("Step 3 failed")
             print_info("Ranking data still available")
         else:
-            html_report_path = result3.get('html_report_path')
-            
-            step3_duration = datetime.now() - step3_start
             print_success("HTML report generated")
             print(f"   Output: {html_report_path}")
-            print(f"   Duration: {step3_duration.seconds}s")
+            for fmt, entry in result3.get('compression', {}).items():
+                print(f"   {fmt}: {entry['bytes']:,} bytes (ratio {entry['ratio']:.3f})")
+            print(f"   Duration: {step3['wall_ms'] / 1000:.3f}s")
             
             # Open in browser
             if args.open_browser:
@@ -305,19 +483,98 @@ Examples:
                 except Exception as e:
                     print_error(f"Failed to open browser: {e}")
     
+    # ========================================
+    # Step 4: Rank diff against a previous run (optional)
+    # ========================================
+    diff_report_path = None
+    
+    if args.diff_against:
+        print_header(f"Step 4: Comparing with run {args.diff_against} (publish_html)")
+        previous_path = find_run_ranking(args.diff_against)
+        
+        if not previous_path:
+            print_error(f"No ranked_games.json found for run {args.diff_against}")
+        else:
+            step4_env = {
+                'RANKED_ITEMS_PATH': ranked_items_path,
+                'PREVIOUS_RANKED_ITEMS_PATH': str(previous_path),
+                'PREVIOUS_RUN_ID': args.diff_against,
+                'QUERY': args.query,
+                'COUNTRY': args.country,
+                'RUN_ID': run_id,
+                'REPORT_MODE': 'diff',
+                'COMPRESS': args.compress,
+                'LOG_LEVEL': args.log_level,
+                **common_env
+            }
+            
+            with metrics.stage('rank_diff', args.in_process) as step4:
+                result4 = run_skill('publish_html', step4_env, args.in_process)
+                if result4:
+                    diff_report_path = result4.get('html_report_path')
+                    step4.update(
+                        items_in=result4.get('total_games', ranked_count),
+                        items_out=1,
+                        bytes_written=result4.get('report_bytes', file_size(diff_report_path))
+                    )
+                else:
+                    step4['status'] = 'failed'
+            
+            if not result4:
+                print_error("Step 4 failed")
+            else:
+                diff = result4.get('diff', {})
+                print_success(
+                    f"Rank diff: {diff.get('entered', 0)} entered, {diff.get('dropped', 0)} dropped, "
+                    f"{diff.get('moved', 0)} moved"
+                )
+                print(f"   Output: {diff_report_path}")
+                print(f"   Duration: {step4['wall_ms'] / 1000:.3f}s")
+    
+    # Ranked games are loaded once for the dashboard and the top 5 summary
+    try:
+        with open(ranked_items_path, 'r', encoding='utf-8') as f:
+            games = json.load(f)
+    except Exception as e:
+        logger.warning(f"Could not load ranked games: {e}")
+        games = None
+    
+    # Register the run in the multi-run dashboard (one appended line)
+    dashboard_path = None
+    if games is not None and not args.no_dashboard:
+        try:
+            record = build_run_record(
+                run_dir, games, args.query, args.country,
+                metrics.started_at, html_report_path
+            )
+            dashboard_path = RunDashboard(run_dir.parent.parent).add_run(record)
+        except Exception as e:
+            logger.warning(f"Could not update dashboard: {e}")
+    
     # ========================================
     # Summary
     # ========================================
-    total_duration = datetime.now() - start_time
+    metrics_path = metrics.save(run_dir, args.prometheus)
+    total_seconds = metrics.to_dict()['total_wall_ms'] / 1000
     
     print_header("📊 Pipeline Summary")
-    print(f"Total duration: {total_duration.seconds}s")
+    print(f"Total duration: {total_seconds:.3f}s")
+    print()
+    print("Stage metrics:")
+    for stage in metrics.stages:
+        print(
+            f"  {stage['stage']:<13} {stage['wall_ms']:>10.1f}ms wall  "
+            f"{stage['cpu_ms']:>10.1f}ms cpu  "
+            f"{stage['items_in']:>5} → {stage['items_out']:<5} items"
+        )
     print()
     print("Step results:")
     print(f"  ✓ Collected: {raw_count} games")
     print(f"  ✓ Ranked:    {ranked_count} games")
     if html_report_path:
         print(f"  ✓ HTML:      Generated")
+    if diff_report_path:
+        print(f"  ✓ Diff:      Generated")
     print()
     
     print(f"{Colors.BOLD}📁 Output files:{Colors.ENDC}")
@@ -325,13 +582,17 @@ Examples:
     print(f"  Rankings:  {ranked_items_path}")
     if html_report_path:
         print(f"  HTML:      {html_report_path}")
+    if diff_report_path:
+        print(f"  Rank diff: {diff_report_path}")
+    print(f"  Metrics:   {metrics_path}")
+    if dashboard_path:
+        print(f"  Dashboard: {dashboard_path}")
+    if args.profile:
+        print(f"  Profile:   {run_dir / 'profile'}")
     print()
     
-    # Load and display top 5 games
-    try:
-        with open(ranked_items_path, 'r', encoding='utf-8') as f:
-            games = json.load(f)
-        
+    # Display top 5 games
+    if games is not None:
         print(f"{Colors.BOLD}🏆 Top 5 Games:{Colors.ENDC}")
         for game in games[:5]:
             rank = game.get('rank', '?')
@@ -340,8 +601,6 @@ Examples:
             genre = game.get('genre', 'Unknown')
             print(f"  {rank}. [{score:.3f}] {title} ({genre})")
         print()
-    except Exception as e:
-        logger.warning(f"Could not display top games: {e}")
     
     # Next steps
     print(f"{Colors.BOLD}💡 Next steps:{Colors.ENDC}")
@@ -365,6 +624,9 @@ if __name__ == "__main__":
         print("\n")
         print_error("Pipeline interrupted by user")
         sys.exit(1)
+    except SkillResultError as e:
+        print_error(str(e))
+        sys.exit(1)
     except Exception as e:
         print_error(f"Unexpected error: {e}")
         import traceback
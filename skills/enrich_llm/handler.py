@@ -13,6 +13,13 @@ from datetime import datetime
 from typing import List, Dict, Any
 import anthropic
 
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules.profiling import run_profiled
+from modules.skill_result import emit_result
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -165,8 +172,8 @@ def main():
         "success_count": success_count,
         "run_id": run_id
     }
-    print(json.dumps(result))
+    emit_result(result)
 
 
 if __name__ == "__main__":
-    main()
+    run_profiled('enrich_llm', main)
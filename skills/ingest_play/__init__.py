@@ -0,0 +1 @@
+"""ingest_play skill - Google Play game metadata collector."""
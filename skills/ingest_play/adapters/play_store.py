@@ -19,6 +19,8 @@ class PlayStoreAdapter:
         """
         self.country = country
         self.language = language
+        # Number of HTTP calls made to the Play Store (for pipeline metrics)
+        self.request_count = 0
     
     def search_games(self, query: str, limit: int = 120) -> List[Dict[str, Any]]:
         """
@@ -35,6 +37,7 @@ class PlayStoreAdapter:
         
         try:
             # Search for apps
+            self.request_count += 1
             results = search(
                 query,
                 lang=self.language,
@@ -54,6 +57,7 @@ class PlayStoreAdapter:
                         continue
                     
                     logger.debug(f"Fetching details for {app_id} ({idx+1}/{len(results)})")
+                    self.request_count += 1
                     details = app(
                         app_id,
                         lang=self.language,
@@ -83,6 +87,7 @@ class PlayStoreAdapter:
             App metadata dictionary or None if failed
         """
         try:
+            self.request_count += 1
             return app(app_id, lang=self.language, country=self.country)
         except Exception as e:
             logger.error(f"Failed to fetch app details for {app_id}: {e}")
@@ -21,6 +21,8 @@ from skills.ingest_play.normalize import (
     deduplicate_games,
     filter_games_only
 )
+from modules.profiling import run_profiled
+from modules.skill_result import emit_result
 
 
 def setup_logging(log_level: str = "INFO") -> logging.Logger:
@@ -135,11 +137,13 @@ def main():
         logger.info("=" * 60)
         
         # Output for pipeline integration
-        print(json.dumps({
+        emit_result({
             'raw_items_path': str(output_file),
             'total_items': len(unique_games),
+            'input_items': len(raw_data),
+            'http_requests': adapter.request_count,
             'run_id': run_id
-        }))
+        })
         
         return 0
         
@@ -149,6 +153,6 @@ def main():
 
 
 if __name__ == "__main__":
-    exit_code = main()
+    exit_code = run_profiled('ingest_play', main)
     sys.exit(exit_code)
 
@@ -0,0 +1 @@
+"""publish_html skill - HTML report generator."""
@@ -0,0 +1,143 @@
+"""Content-hashed shared assets and precompressed (.gz/.br) report files."""
+import os
+import gzip
+import shutil
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Shared across all runs so browsers cache each asset version once
+DEFAULT_ASSETS_DIR = Path('outputs') / 'assets'
+
+ASSET_MODES = ('inline', 'shared')
+
+# Precompressed sibling suffix per format
+COMPRESSION_FORMATS = {'gzip': '.gz', 'br': '.br'}
+
+_CHUNK_SIZE = 64 * 1024
+
+
+def parse_compress_formats(value: Optional[str]) -> List[str]:
+    """
+    Parse COMPRESS ('gzip,br', 'all', '' ...) into a list of formats.
+
+    'br' is dropped with a warning when the brotli package is missing.
+    """
+    value = (value or '').strip().lower()
+    if value in ('', '0', 'false', 'off', 'no', 'none'):
+        return []
+    if value in ('1', 'true', 'on', 'yes', 'all'):
+        names = list(COMPRESSION_FORMATS)
+    else:
+        names = [name.strip() for name in value.split(',') if name.strip()]
+
+    formats = []
+    for name in names:
+        name = 'gzip' if name == 'gz' else name
+        if name not in COMPRESSION_FORMATS:
+            raise ValueError(f"Unknown compression format: {name}")
+        if name == 'br' and brotli is None:
+            logger.warning("brotli is not installed, skipping .br output")
+            continue
+        if name not in formats:
+            formats.append(name)
+    return formats
+
+
+def write_hashed_asset(
+    content: str,
+    name: str,
+    suffix: str,
+    assets_dir: Path = DEFAULT_ASSETS_DIR,
+    compress: Iterable[str] = ()
+) -> Path:
+    """
+    Write `content` to <assets_dir>/<name>.<hash><suffix> unless it exists.
+
+    The hash is taken from the content, so an unchanged stylesheet keeps
+    its URL (and browser cache entry) across runs.
+
+    Returns:
+        Path of the asset
+    """
+    data = content.encode('utf-8')
+    digest = hashlib.sha256(data).hexdigest()[:12]
+    assets_dir.mkdir(parents=True, exist_ok=True)
+    asset_path = assets_dir / f"{name}.{digest}{suffix}"
+
+    if not asset_path.exists():
+        # Write-then-rename: concurrent runs may publish the same asset
+        tmp_path = asset_path.with_name(f"{asset_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, asset_path)
+
+    for fmt in compress:
+        sibling = asset_path.with_name(asset_path.name + COMPRESSION_FORMATS[fmt])
+        if not sibling.exists():
+            compress_file(asset_path, fmt)
+
+    return asset_path
+
+
+def asset_href(asset_path: Path, report_dir: Path) -> str:
+    """URL of an asset relative to the directory of the report linking it"""
+    return Path(os.path.relpath(asset_path, report_dir)).as_posix()
+
+
+def compress_file(path: Path, fmt: str) -> Path:
+    """
+    Write a precompressed sibling (<path>.gz or <path>.br), streaming in
+    chunks so large reports are never held in memory.
+
+    Returns:
+        Path of the compressed file
+    """
+    path = Path(path)
+    target = path.with_name(path.name + COMPRESSION_FORMATS[fmt])
+    tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+
+    with open(path, 'rb') as src:
+        if fmt == 'gzip':
+            # mtime=0 keeps the output byte-identical for identical input
+            with open(tmp_path, 'wb') as raw, gzip.GzipFile(
+                filename='', mode='wb', compresslevel=9, fileobj=raw, mtime=0
+            ) as dst:
+                shutil.copyfileobj(src, dst, _CHUNK_SIZE)
+        else:
+            compressor = brotli.Compressor(quality=11)
+            with open(tmp_path, 'wb') as dst:
+                for chunk in iter(lambda: src.read(_CHUNK_SIZE), b''):
+                    dst.write(compressor.process(chunk))
+                dst.write(compressor.finish())
+
+    os.replace(tmp_path, target)
+    return target
+
+
+def precompress(path: str, formats: Iterable[str]) -> Dict[str, Any]:
+    """
+    Emit compressed siblings of a report file and describe the result.
+
+    Returns:
+        {'path', 'bytes', 'compressed': {fmt: {'path', 'bytes', 'ratio'}}}
+        where ratio is compressed size / original size
+    """
+    size = os.path.getsize(path)
+    compressed = {}
+    for fmt in formats:
+        target = compress_file(Path(path), fmt)
+        target_size = os.path.getsize(target)
+        compressed[fmt] = {
+            'path': str(target),
+            'bytes': target_size,
+            'ratio': round(target_size / size, 4) if size else 0.0,
+        }
+    return {'path': str(path), 'bytes': size, 'compressed': compressed}
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+publish_html batch entry point
+Render many ranked artifacts (e.g. one per query x country) in a process pool.
+
+The parent compiles the templates and writes the shared, content-hashed
+CSS/JS once; workers inherit the compiled templates (fork) or compile them
+once each (spawn), and every report links the same asset files. A single
+summary JSON lists every output path with per-report timing.
+
+Usage:
+    # Ranked artifacts of earlier runs (query/country from each run's metrics.json)
+    python skills/publish_html/batch.py outputs/20251107/*/artifacts/ranked_games.json
+
+    # Job list: [{"ranked_items_path", "query", "country", "run_id", "output_dir"?}, ...]
+    python skills/publish_html/batch.py --jobs nightly_jobs.json --workers 8
+"""
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Dict, Any, Optional
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules.skill_result import emit_result
+from skills.publish_html.templates import load_templates
+from skills.publish_html.search_index import build_search_index
+from skills.publish_html.assets import (
+    ASSET_MODES,
+    DEFAULT_ASSETS_DIR,
+    asset_href,
+    parse_compress_formats,
+    precompress
+)
+from skills.publish_html.handler import (
+    compute_report_stats,
+    get_report_path,
+    load_ranked_games,
+    publish_shared_assets,
+    report_output_dir,
+    write_html,
+    write_paged_html,
+    write_virtual_html
+)
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Modes that render one report per ranking ('diff' needs a pair of runs)
+BATCH_REPORT_MODES = ('cards', 'virtual', 'pages')
+
+
+def job_from_artifact(ranked_path: Path) -> Dict[str, Any]:
+    """
+    Batch job for outputs/<date>/<run_id>/artifacts/ranked_games.json.
+
+    Query and country come from the run's metrics.json labels; run_id is the
+    run directory name. The report goes to the run's own reports/ directory,
+    so runs of different days with the same run_id don't collide.
+    """
+    run_dir = ranked_path.parent.parent
+    labels = {}
+    metrics_path = run_dir / 'metrics.json'
+    if metrics_path.exists():
+        try:
+            with open(metrics_path, 'r', encoding='utf-8') as f:
+                labels = json.load(f).get('labels', {})
+        except (OSError, json.JSONDecodeError):
+            pass
+    return {
+        'ranked_items_path': str(ranked_path),
+        'query': labels.get('query', 'new games'),
+        'country': labels.get('country', 'KR'),
+        'run_id': run_dir.name,
+        'output_dir': str(run_dir / 'reports'),
+    }
+
+
+def load_jobs(jobs_path: Path) -> List[Dict[str, Any]]:
+    """
+    Read a job list; query/country/run_id default like the single-report handler.
+    
+    `output_dir` is optional (default: outputs/<today>/<run_id>/reports).
+    """
+    with open(jobs_path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+
+    jobs = []
+    for i, entry in enumerate(entries):
+        if 'ranked_items_path' not in entry:
+            raise ValueError(f"Job {i} has no ranked_items_path")
+        query = entry.get('query', 'new games')
+        country = entry.get('country', 'KR')
+        jobs.append({
+            'ranked_items_path': entry['ranked_items_path'],
+            'query': query,
+            'country': country,
+            'run_id': entry.get('run_id') or f"{query}_{country}".replace(' ', '_'),
+            'output_dir': entry.get('output_dir'),
+        })
+    return jobs
+
+
+# Set in each worker by _init_worker
+_worker_config: Dict[str, Any] = {}
+
+
+def _init_worker(config: Dict[str, Any]):
+    """Worker initializer: keep the batch settings and compiled templates per process"""
+    logging.getLogger().setLevel(logging.WARNING)
+    _worker_config.update(config)
+    # Already compiled in the parent under fork; compiled once here under spawn
+    _worker_config['templates'] = load_templates(config['template_dir'])
+
+
+def render_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Render one report (runs in a worker process)"""
+    config = _worker_config
+    templates = config['templates']
+    report_mode = config['report_mode']
+    start = time.perf_counter()
+
+    games = load_ranked_games(job['ranked_items_path'])
+    loaded = time.perf_counter()
+
+    report_dir = get_report_path(job['run_id'], job.get('output_dir')).parent
+    stylesheet_href = script_src = None
+    if config['asset_paths']:
+        stylesheet_href = asset_href(Path(config['asset_paths']['css']), report_dir)
+        if 'js' in config['asset_paths']:
+            script_src = asset_href(Path(config['asset_paths']['js']), report_dir)
+
+    search_index = None
+    if config['search'] and report_mode in ('cards', 'virtual'):
+        search_index = build_search_index(games)
+
+    page_paths = []
+    if report_mode == 'virtual':
+        output_path = write_virtual_html(
+            games, job['query'], job['country'], job['run_id'], config['page_size'],
+            compute_report_stats(games), stylesheet_href, script_src,
+            search_index=search_index, templates=templates, output_dir=report_dir
+        )
+    elif report_mode == 'pages':
+        page_paths = write_paged_html(
+            games, job['query'], job['country'], job['run_id'], config['page_size'],
+            stylesheet_href=stylesheet_href, templates=templates, output_dir=report_dir
+        )
+        output_path = page_paths[0]
+    else:
+        output_path = write_html(
+            games, job['query'], job['country'], job['run_id'], compute_report_stats(games),
+            stylesheet_href, search_index=search_index, templates=templates, output_dir=report_dir
+        )
+    rendered = time.perf_counter()
+
+    for path in page_paths or [output_path]:
+        precompress(path, config['compress'])
+    finished = time.perf_counter()
+
+    result = {
+        **job,
+        'html_report_path': output_path,
+        'total_games': len(games),
+        'report_bytes': sum(os.path.getsize(path) for path in page_paths or [output_path]),
+        'load_ms': round((loaded - start) * 1000, 2),
+        'render_ms': round((rendered - loaded) * 1000, 2),
+        'compress_ms': round((finished - rendered) * 1000, 2),
+        'total_ms': round((finished - start) * 1000, 2),
+        'pid': os.getpid(),
+    }
+    if page_paths:
+        result['page_paths'] = page_paths
+    return result
+
+
+def run_batch(
+    jobs: List[Dict[str, Any]],
+    report_mode: str = 'cards',
+    page_size: int = 100,
+    asset_mode: str = 'shared',
+    assets_dir: Path = DEFAULT_ASSETS_DIR,
+    compress: tuple = (),
+    search: bool = True,
+    template_dir: Optional[str] = None,
+    workers: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Render every job in a process pool.
+
+    A failing job is recorded with its error and does not stop the batch.
+    A job whose report directory is already taken by an earlier job fails
+    before the pool starts instead of overwriting that report.
+
+    Returns:
+        Summary: settings, wall time, reports (input order) and failures
+    """
+    started_at = datetime.now()
+    start = time.perf_counter()
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs) or 1))
+
+    # Compile before the pool starts so forked workers inherit the result
+    templates = load_templates(template_dir)
+
+    asset_paths = {}
+    if asset_mode == 'shared':
+        # Written once; hrefs are computed per report directory in the workers
+        assets = publish_shared_assets(report_mode, Path('.'), assets_dir, compress, templates)
+        asset_paths['css'] = assets['paths'][0]
+        if len(assets['paths']) > 1:
+            asset_paths['js'] = assets['paths'][1]
+
+    config = {
+        'report_mode': report_mode,
+        'page_size': page_size,
+        'compress': tuple(compress),
+        'search': search,
+        'template_dir': template_dir,
+        'asset_paths': asset_paths,
+    }
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+    failures = []
+    owners: Dict[Path, int] = {}
+    runnable = []
+    for i, job in enumerate(jobs):
+        output_dir = report_output_dir(job['run_id'], job.get('output_dir')).resolve()
+        if output_dir in owners:
+            logger.error(f"[{i + 1}/{len(jobs)}] {output_dir} is already written by job {owners[output_dir] + 1}")
+            failures.append({**job, 'error': f"Duplicate output directory {output_dir} (job {owners[output_dir] + 1})"})
+            continue
+        owners[output_dir] = i
+        runnable.append(i)
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(config,)) as executor:
+        futures = {executor.submit(render_job, jobs[i]): i for i in runnable}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+                logger.info(f"[{i + 1}/{len(jobs)}] {results[i]['html_report_path']} ({results[i]['total_ms']:.0f}ms)")
+            except Exception as e:
+                logger.error(f"[{i + 1}/{len(jobs)}] {jobs[i]['ranked_items_path']}: {e}")
+                failures.append({**jobs[i], 'error': str(e)})
+
+    wall_s = time.perf_counter() - start
+    reports = [result for result in results if result is not None]
+    return {
+        'started_at': started_at.isoformat(timespec='seconds'),
+        'report_mode': report_mode,
+        'asset_mode': asset_mode,
+        'asset_paths': list(asset_paths.values()),
+        'template_dir': template_dir,
+        'workers': workers,
+        'wall_ms': round(wall_s * 1000, 2),
+        'reports_per_sec': round(len(reports) / wall_s, 2) if wall_s > 0 else None,
+        'total_reports': len(reports),
+        'reports': reports,
+        'failures': failures,
+    }
+
+
+def default_summary_path() -> Path:
+    """outputs/<date>/batch_<time>.json"""
+    now = datetime.now()
+    return Path('outputs') / now.strftime('%Y%m%d') / f"batch_{now.strftime('%H%M%S')}.json"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Render many ranked artifacts into HTML reports in parallel')
+    parser.add_argument(
+        'ranked_paths',
+        nargs='*',
+        type=Path,
+        help='ranked_games.json files of earlier runs (query/country from metrics.json)'
+    )
+    parser.add_argument('--jobs', type=Path, help='JSON job list (ranked_items_path, query, country, run_id)')
+    parser.add_argument('--report-mode', choices=BATCH_REPORT_MODES, default='cards', help='Report mode (default: cards)')
+    parser.add_argument('--page-size', type=int, default=100, help='Games per page / virtual render unit (default: 100)')
+    parser.add_argument(
+        '--asset-mode',
+        choices=ASSET_MODES,
+        default='shared',
+        help='shared: every report links one content-hashed CSS/JS (default), inline: embed per report'
+    )
+    parser.add_argument('--assets-dir', type=Path, default=DEFAULT_ASSETS_DIR, help='Shared asset directory')
+    parser.add_argument('--compress', help='Precompress reports and assets: gzip, br, gzip,br or all')
+    parser.add_argument('--no-search', action='store_true', help='Leave out the search/filter bar')
+    parser.add_argument('--template-dir', help='Theme directory overriding files in templates/')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    parser.add_argument('--summary', type=Path, help='Summary JSON path (default: outputs/<date>/batch_<time>.json)')
+    args = parser.parse_args()
+
+    try:
+        compress = parse_compress_formats(args.compress)
+        jobs = load_jobs(args.jobs) if args.jobs else []
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    jobs += [job_from_artifact(path) for path in args.ranked_paths]
+    if not jobs:
+        parser.error('No ranked artifacts given')
+
+    logger.info(f"Rendering {len(jobs)} reports ({args.report_mode}, assets: {args.asset_mode})")
+    summary = run_batch(
+        jobs,
+        report_mode=args.report_mode,
+        page_size=args.page_size,
+        asset_mode=args.asset_mode,
+        assets_dir=args.assets_dir,
+        compress=compress,
+        search=not args.no_search,
+        template_dir=args.template_dir,
+        workers=args.workers
+    )
+
+    summary_path = args.summary or default_summary_path()
+    summary_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+
+    logger.info(
+        f"✓ {summary['total_reports']} reports in {summary['wall_ms']:.0f}ms "
+        f"({summary['reports_per_sec']} reports/s, {summary['workers']} workers), "
+        f"{len(summary['failures'])} failed"
+    )
+    emit_result({
+        'summary_path': str(summary_path.absolute()),
+        'total_reports': summary['total_reports'],
+        'failures': len(summary['failures']),
+        'wall_ms': summary['wall_ms'],
+    })
+    return 1 if summary['failures'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+"""Server-side SVG charts for the HTML report (no JavaScript, no CDN)."""
+from html import escape
+from typing import List, Dict, Any, Sequence
+
+# Bar colors (same palette the Chart.js version used)
+CHART_COLORS = ['#667eea', '#764ba2', '#4CAF50', '#FF9800', '#2196F3']
+
+# Score components shown as histograms, with their card colors
+SCORE_COMPONENTS = [
+    ('quality', '품질', '#4CAF50'),
+    ('freshness', '신규성', '#2196F3'),
+    ('popularity', '인기도', '#FF9800'),
+]
+
+HISTOGRAM_BINS = 10
+
+
+def _nice_step(max_value: float, ticks: int = 5) -> int:
+    """Integer tick step so that about `ticks` gridlines cover max_value"""
+    step = 1
+    while max_value / step > ticks:
+        for factor in (2, 5, 10):
+            if max_value / (step * factor) <= ticks:
+                return step * factor
+        step *= 10
+    return step
+
+
+def _truncate(label: str, length: int) -> str:
+    return label if len(label) <= length else label[:length - 1] + '…'
+
+
+def render_bar_chart_svg(
+    labels: Sequence[str],
+    values: Sequence[float],
+    title: str,
+    colors: Sequence[str] = CHART_COLORS,
+    width: int = 600,
+    height: int = 300
+) -> str:
+    """Vertical bar chart with a y-axis grid and value labels"""
+    pad_left, pad_right, pad_top, pad_bottom = 40, 10, 20, 40
+    plot_w = width - pad_left - pad_right
+    plot_h = height - pad_top - pad_bottom
+    max_value = max(values) if values else 0
+    step = _nice_step(max_value) if max_value else 1
+    y_max = max(step, -(-max_value // step) * step)
+
+    parts = [
+        f'<svg class="chart" viewBox="0 0 {width} {height}" role="img" '
+        f'aria-label="{escape(title)}" xmlns="http://www.w3.org/2000/svg">',
+        f'<title>{escape(title)}</title>',
+    ]
+
+    # Grid lines and y-axis ticks
+    tick = 0
+    while tick <= y_max:
+        y = pad_top + plot_h - plot_h * tick / y_max
+        parts.append(
+            f'<line x1="{pad_left}" y1="{y:.1f}" x2="{width - pad_right}" y2="{y:.1f}" stroke="#e0e0e0"/>'
+            f'<text x="{pad_left - 6}" y="{y + 4:.1f}" text-anchor="end" font-size="11" fill="#666">{tick:g}</text>'
+        )
+        tick += step
+
+    slot = plot_w / max(1, len(values))
+    bar_w = slot * 0.6
+    for i, (label, value) in enumerate(zip(labels, values)):
+        bar_h = plot_h * value / y_max
+        x = pad_left + slot * i + (slot - bar_w) / 2
+        y = pad_top + plot_h - bar_h
+        color = colors[i % len(colors)]
+        parts.append(
+            f'<rect x="{x:.1f}" y="{y:.1f}" width="{bar_w:.1f}" height="{bar_h:.1f}" rx="6" fill="{color}" opacity="0.85">'
+            f'<title>{escape(str(label))}: {value:g}</title></rect>'
+            f'<text x="{x + bar_w / 2:.1f}" y="{y - 4:.1f}" text-anchor="middle" font-size="12" fill="#333">{value:g}</text>'
+            f'<text x="{x + bar_w / 2:.1f}" y="{height - pad_bottom + 18}" text-anchor="middle" font-size="12" fill="#666">'
+            f'{escape(_truncate(str(label), 14))}</text>'
+        )
+
+    parts.append('</svg>')
+    return ''.join(parts)
+
+
+def render_histogram_svg(
+    counts: Sequence[int],
+    title: str,
+    color: str,
+    width: int = 300,
+    height: int = 180
+) -> str:
+    """Histogram of a 0-1 score split into len(counts) equal bins"""
+    pad_left, pad_right, pad_top, pad_bottom = 30, 10, 24, 24
+    plot_w = width - pad_left - pad_right
+    plot_h = height - pad_top - pad_bottom
+    max_count = max(counts) if counts else 0
+    bin_w = plot_w / max(1, len(counts))
+
+    parts = [
+        f'<svg class="chart" viewBox="0 0 {width} {height}" role="img" '
+        f'aria-label="{escape(title)}" xmlns="http://www.w3.org/2000/svg">',
+        f'<text x="{width / 2}" y="15" text-anchor="middle" font-size="13" fill="#333">{escape(title)}</text>',
+        f'<line x1="{pad_left}" y1="{pad_top + plot_h}" x2="{width - pad_right}" y2="{pad_top + plot_h}" stroke="#ccc"/>',
+        f'<text x="{pad_left - 4}" y="{pad_top + 8}" text-anchor="end" font-size="10" fill="#666">{max_count}</text>',
+    ]
+    for i, count in enumerate(counts):
+        bar_h = plot_h * count / max_count if max_count else 0
+        x = pad_left + bin_w * i
+        low, high = i / len(counts), (i + 1) / len(counts)
+        parts.append(
+            f'<rect x="{x + 1:.1f}" y="{pad_top + plot_h - bar_h:.1f}" width="{bin_w - 2:.1f}" '
+            f'height="{bar_h:.1f}" fill="{color}"><title>{low:.1f}–{high:.1f}: {count}</title></rect>'
+        )
+    for tick in (0, 0.5, 1):
+        parts.append(
+            f'<text x="{pad_left + plot_w * tick:.1f}" y="{height - 8}" text-anchor="middle" '
+            f'font-size="10" fill="#666">{tick:g}</text>'
+        )
+    parts.append('</svg>')
+    return ''.join(parts)
+
+
+def histogram_bin(value: float, bins: int = HISTOGRAM_BINS) -> int:
+    """Bin index of a 0-1 score (1.0 falls into the last bin)"""
+    return min(bins - 1, max(0, int(value * bins)))
+
+
+def empty_histograms() -> Dict[str, List[int]]:
+    """Bin counters for every score component plus the final score"""
+    keys = [key for key, _, _ in SCORE_COMPONENTS] + ['final_score']
+    return {key: [0] * HISTOGRAM_BINS for key in keys}
+
+
+def add_to_histograms(histograms: Dict[str, List[int]], game: Dict[str, Any]):
+    """Count one game's scores into the histogram bins"""
+    scores = game.get('scores', {})
+    for key, _, _ in SCORE_COMPONENTS:
+        histograms[key][histogram_bin(scores.get(key, 0))] += 1
+    histograms['final_score'][histogram_bin(game.get('final_score', 0))] += 1
+
+
+def render_score_histograms(histograms: Dict[str, List[int]]) -> str:
+    """Histograms for the final score and each score component"""
+    charts = [render_histogram_svg(histograms['final_score'], '최종 점수', '#667eea')]
+    for key, label, color in SCORE_COMPONENTS:
+        charts.append(render_histogram_svg(histograms[key], label, color))
+    return ''.join(f'<div class="chart-cell">{chart}</div>' for chart in charts)
@@ -6,10 +6,53 @@ Generate HTML report from ranked games data
 import os
 import sys
 import json
+import math
+import time
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules.profiling import run_profiled
+from modules.skill_result import emit_result
+from skills.publish_html.charts import (
+    render_bar_chart_svg,
+    render_score_histograms,
+    empty_histograms,
+    add_to_histograms
+)
+from skills.publish_html.rank_diff import (
+    DIFF_CSS,
+    diff_rankings,
+    diff_summary,
+    render_diff_tables
+)
+from skills.publish_html.search_index import (
+    build_search_index,
+    json_for_script,
+    render_search_controls,
+    render_search_index_script
+)
+from skills.publish_html.icons import (
+    ICON_MODES,
+    DEFAULT_CACHE_DIR,
+    DEFAULT_TTL_SECONDS,
+    IconCache,
+    data_uri
+)
+from skills.publish_html.templates import ReportTemplates, load_templates
+from skills.publish_html.assets import (
+    ASSET_MODES,
+    DEFAULT_ASSETS_DIR,
+    asset_href,
+    parse_compress_formats,
+    precompress,
+    write_hashed_asset
+)
 
 # Configure logging
 logging.basicConfig(
@@ -18,6 +61,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared report stylesheet of the default theme (inlined by default, or written as report.css)
+REPORT_CSS = load_templates().css
+
 
 def load_ranked_games(ranked_items_path: str) -> List[Dict[str, Any]]:
     """Load ranked game data from JSON file"""
@@ -25,448 +71,692 @@ def load_ranked_games(ranked_items_path: str) -> List[Dict[str, Any]]:
         return json.load(f)
 
 
-def generate_html(games: List[Dict[str, Any]], query: str, country: str) -> str:
-    """Generate HTML page from ranked games data"""
-    
-    # Calculate statistics
-    total_games = len(games)
-    avg_score = sum(g.get('final_score', 0) for g in games) / total_games if total_games > 0 else 0
-    
-    # Genre distribution
+def compute_report_stats(games: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Calculate header statistics, genre distribution and score histograms in a single pass"""
+    total_games = 0
+    score_sum = 0.0
     genre_counts = {}
+    histograms = empty_histograms()
     for game in games:
+        total_games += 1
+        score_sum += game.get('final_score', 0)
         genre = game.get('genre', 'Unknown')
         genre_counts[genre] = genre_counts.get(genre, 0) + 1
+        add_to_histograms(histograms, game)
+    
+    return {
+        'total_games': total_games,
+        'avg_score': score_sum / total_games if total_games > 0 else 0,
+        'genre_counts': genre_counts,
+        'top_genres': sorted(genre_counts.items(), key=lambda x: x[1], reverse=True)[:5],
+        'histograms': histograms,
+    }
+
+
+def render_game_card(
+    game: Dict[str, Any],
+    icon_src: Optional[str] = None,
+    templates: Optional[ReportTemplates] = None
+) -> str:
+    """Render a single game card (with a lazy-loaded icon when `icon_src` is given)"""
+    templates = templates or load_templates()
+    rank = game.get('rank', 0)
+    installs = game.get('installs', 0)
+    scores = game.get('scores', {})
+    
+    icon_html = ''
+    if icon_src:
+        icon_html = (
+            f'<img class="game-icon" src="{icon_src}" loading="lazy" decoding="async" '
+            f'width="64" height="64" alt="">\n                '
+        )
+    
+    quality = scores.get('quality', 0)
+    freshness = scores.get('freshness', 0)
+    popularity = scores.get('popularity', 0)
+    
+    # The card inlines three score_bar partials (`{{> score_bar quality }}` -> quality_value, ...)
+    return templates.card.render(
+        # Badge color based on rank
+        badge_color="#FFD700" if rank <= 3 else "#C0C0C0" if rank <= 10 else "#CD7F32",
+        rank=rank,
+        icon_html=icon_html,
+        title=game.get('title', 'Unknown'),
+        developer=game.get('developer', 'Unknown'),
+        genre=game.get('genre', 'Unknown'),
+        rating=game.get('rating') or 0,
+        installs=f"{installs:,}" if installs else "N/A",
+        release_date=game.get('release_date', 'Unknown'),
+        final_score=game.get('final_score', 0),
+        quality_width=quality * 100,
+        quality_color='#4CAF50',
+        quality_label='품질',
+        quality_value=quality,
+        freshness_width=freshness * 100,
+        freshness_color='#2196F3',
+        freshness_label='신규성',
+        freshness_value=freshness,
+        popularity_width=popularity * 100,
+        popularity_color='#FF9800',
+        popularity_label='인기도',
+        popularity_value=popularity,
+    )
+
+
+def render_html_head(
+    query: str,
+    country: str,
+    stats: Dict[str, Any],
+    stylesheet_href: Optional[str] = None,
+    templates: Optional[ReportTemplates] = None,
+    extra_css: str = ''
+) -> str:
+    """
+    Render everything before the game cards (styles, header, stats).
+    
+    With `stylesheet_href` the CSS is linked instead of inlined; the linked
+    stylesheet must already contain `extra_css` (see publish_shared_assets).
+    """
+    templates = templates or load_templates()
+    if stylesheet_href:
+        styles = f'    <link rel="stylesheet" href="{stylesheet_href}">\n'
+    else:
+        styles = f'    <style>\n{templates.css}{extra_css}    </style>\n'
     
-    top_genres = sorted(genre_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+    return templates.head.render(
+        query=query,
+        country=country,
+        styles=styles,
+        date=datetime.now().strftime('%Y-%m-%d'),
+        total_games=stats['total_games'],
+        avg_score=stats['avg_score'],
+        genre_count=len(stats['genre_counts']),
+    )
+
+
+def render_html_footer(stats: Dict[str, Any], templates: Optional[ReportTemplates] = None) -> str:
+    """Render everything after the game cards (inline SVG charts, footer)"""
+    templates = templates or load_templates()
+    top_genres = stats['top_genres']
+    
+    genre_chart = render_bar_chart_svg(
+        [g[0] for g in top_genres],
+        [g[1] for g in top_genres],
+        title='장르 분포 (상위 5개)'
+    )
+    return templates.footer.render(
+        genre_chart=genre_chart,
+        score_histograms=render_score_histograms(stats['histograms']),
+    )
+
+
+def iter_html(
+    games: Iterable[Dict[str, Any]],
+    query: str,
+    country: str,
+    stats: Optional[Dict[str, Any]] = None,
+    stylesheet_href: Optional[str] = None,
+    icons: Optional[Dict[str, str]] = None,
+    search_index: Optional[Dict[str, Any]] = None,
+    templates: Optional[ReportTemplates] = None
+) -> Iterator[str]:
+    """
+    Yield the report as chunks: head, one chunk per game card, footer.
     
-    # Generate game cards HTML
-    game_cards_html = ""
+    Without precomputed `stats`, `games` is iterated twice and must be a sequence.
+    `icons` maps icon_url to the image src used in the cards; `search_index`
+    (see build_search_index) adds the search/filter bar. `templates` selects
+    a theme (default: load_templates()).
+    """
+    if stats is None:
+        stats = compute_report_stats(games)
+    icons = icons or {}
+    templates = templates or load_templates()
+    
+    yield render_html_head(query, country, stats, stylesheet_href, templates)
+    if search_index:
+        yield render_search_controls(search_index)
     for game in games:
-        rank = game.get('rank', 0)
-        title = game.get('title', 'Unknown')
-        developer = game.get('developer', 'Unknown')
-        genre = game.get('genre', 'Unknown')
-        rating = game.get('rating', 0)
-        installs = game.get('installs', 0)
-        release_date = game.get('release_date', 'Unknown')
-        final_score = game.get('final_score', 0)
-        
-        scores = game.get('scores', {})
-        freshness = scores.get('freshness', 0)
-        quality = scores.get('quality', 0)
-        popularity = scores.get('popularity', 0)
+        yield render_game_card(game, icons.get(game.get('icon_url')), templates)
+    if search_index:
+        yield render_search_index_script(search_index)
+    yield render_html_footer(stats, templates)
+
+
+def generate_html(games: List[Dict[str, Any]], query: str, country: str) -> str:
+    """Generate HTML page from ranked games data"""
+    return "".join(iter_html(games, query, country))
+
+
+def report_output_dir(run_id: str, output_dir: Optional[Path] = None) -> Path:
+    """Report directory of a run: `output_dir` if given, else outputs/<today>/<run_id>/reports"""
+    if output_dir:
+        return Path(output_dir)
+    return Path('outputs') / datetime.now().strftime('%Y%m%d') / run_id / 'reports'
+
+
+def get_report_path(run_id: str, output_dir: Optional[Path] = None) -> Path:
+    """Path of the HTML report for a run (creates the directory)"""
+    output_dir = report_output_dir(run_id, output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return output_dir / 'game_ranking.html'
+
+
+def save_html(html: str, run_id: str, compress: Iterable[str] = ()) -> str:
+    """
+    Save HTML to file.
+    
+    `compress` ('gzip', 'br') also writes precompressed .gz/.br siblings
+    for static servers.
+    """
+    output_path = get_report_path(run_id)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(html)
+    
+    if compress:
+        precompress(str(output_path), compress)
+    
+    return str(output_path.absolute())
+
+
+def write_html(
+    games: Iterable[Dict[str, Any]],
+    query: str,
+    country: str,
+    run_id: str,
+    stats: Optional[Dict[str, Any]] = None,
+    stylesheet_href: Optional[str] = None,
+    icons: Optional[Dict[str, str]] = None,
+    search_index: Optional[Dict[str, Any]] = None,
+    templates: Optional[ReportTemplates] = None,
+    output_dir: Optional[Path] = None
+) -> str:
+    """
+    Stream the report straight to disk, one card at a time.
+    
+    Memory stays flat regardless of the number of games; pass `stats`
+    to render from a single-pass iterator. `output_dir` overrides the
+    default outputs/<today>/<run_id>/reports directory.
+    """
+    output_path = get_report_path(run_id, output_dir)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for chunk in iter_html(games, query, country, stats, stylesheet_href, icons, search_index, templates):
+            f.write(chunk)
+    
+    return str(output_path.absolute())
+
+
+def write_report_batch(
+    reports: Iterable[Dict[str, Any]],
+    templates: Optional[ReportTemplates] = None
+) -> List[str]:
+    """
+    Write one card report per entry of `reports` ({'games', 'query',
+    'country', 'run_id'}), e.g. one per query/country.
+    
+    Every report renders from the same compiled templates, so the batch
+    pays for template loading once.
+    
+    Returns:
+        Report paths in input order
+    """
+    templates = templates or load_templates()
+    return [
+        write_html(
+            report['games'], report['query'], report['country'], report['run_id'],
+            templates=templates
+        )
+        for report in reports
+    ]
+
+
+# Report modes: 'cards' renders every card as DOM, 'virtual' embeds the data
+# once and renders only visible rows, 'pages' splits cards into page-N.html,
+# 'diff' compares against a previous run's ranking
+REPORT_MODES = ('cards', 'virtual', 'pages', 'diff')
+
+# Fixed slot height (card + gap) used by the virtual scroller
+VIRTUAL_ROW_HEIGHT = 190
+
+# Column order of the compact JSON rows embedded in virtual reports
+VIRTUAL_FIELDS = [
+    'rank', 'title', 'developer', 'genre', 'rating', 'installs',
+    'release_date', 'final_score', 'quality', 'freshness', 'popularity', 'icon'
+]
+
+VIRTUAL_CSS = f'''
+        .virtual-viewport {{
+            height: 75vh;
+            overflow-y: auto;
+            position: relative;
+        }}
         
-        # Format installs
-        installs_str = f"{installs:,}" if installs else "N/A"
+        .virtual-spacer {{
+            position: relative;
+        }}
         
-        # Badge color based on rank
-        badge_color = "#FFD700" if rank <= 3 else "#C0C0C0" if rank <= 10 else "#CD7F32"
+        .virtual-viewport .game-card {{
+            position: absolute;
+            left: 0;
+            right: 0;
+            height: {VIRTUAL_ROW_HEIGHT - 20}px;
+            margin: 0;
+            overflow: hidden;
+            transition: none;
+        }}
         
-        game_cards_html += f'''
-        <div class="game-card">
-            <div class="rank-badge" style="background: {badge_color}">#{rank}</div>
-            <div class="game-info">
-                <h3 class="game-title">{title}</h3>
-                <p class="game-developer">{developer}</p>
-                <div class="game-meta">
-                    <span class="badge badge-genre">{genre}</span>
-                    <span class="badge badge-rating">⭐ {rating:.1f}</span>
-                    <span class="badge badge-installs">📥 {installs_str}</span>
-                </div>
-                <p class="game-release">출시일: {release_date}</p>
-            </div>
-            <div class="game-scores">
-                <div class="score-main">
-                    <div class="score-value">{final_score:.3f}</div>
-                    <div class="score-label">최종 점수</div>
-                </div>
-                <div class="score-breakdown">
-                    <div class="score-item">
-                        <div class="score-bar">
-                            <div class="score-fill" style="width: {quality*100}%; background: #4CAF50"></div>
-                        </div>
-                        <span>품질 {quality:.2f}</span>
+        .virtual-viewport .game-card:hover {{
+            transform: none;
+        }}
+'''
+
+PAGER_CSS = '''
+.pager {
+    display: flex;
+    gap: 8px;
+    justify-content: center;
+    flex-wrap: wrap;
+    margin: 20px 0;
+}
+
+.pager a, .pager span {
+    padding: 6px 12px;
+    border-radius: 8px;
+    background: #f0f0f0;
+    color: #667eea;
+    text-decoration: none;
+}
+
+.pager .current {
+    background: #667eea;
+    color: white;
+}
+'''
+
+VIRTUAL_JS = '''        (function () {
+            const data = JSON.parse(document.getElementById('games-data').textContent);
+            const rows = data.rows;
+            let view = rows;
+            const ROW = data.row_height;
+            const BATCH = data.page_size;
+            const viewport = document.getElementById('virtual-viewport');
+            const spacer = document.getElementById('virtual-spacer');
+            spacer.style.height = (view.length * ROW) + 'px';
+            
+            const escapeHtml = (value) => String(value ?? '').replace(/[&<>"']/g, (c) => (
+                {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[c]
+            ));
+            const badgeColor = (rank) => rank <= 3 ? '#FFD700' : rank <= 10 ? '#C0C0C0' : '#CD7F32';
+            const scoreBar = (value, color, label) => `
+                <div class="score-item">
+                    <div class="score-bar">
+                        <div class="score-fill" style="width: ${value * 100}%; background: ${color}"></div>
                     </div>
-                    <div class="score-item">
-                        <div class="score-bar">
-                            <div class="score-fill" style="width: {freshness*100}%; background: #2196F3"></div>
+                    <span>${label} ${value.toFixed(2)}</span>
+                </div>`;
+            
+            function renderCard(row, index) {
+                const [rank, title, developer, genre, rating, installs, release, score, quality, freshness, popularity, icon] = row;
+                const iconHtml = icon
+                    ? `<img class="game-icon" src="${escapeHtml(icon)}" loading="lazy" decoding="async" width="64" height="64" alt="">`
+                    : '';
+                return `
+                <div class="game-card" style="top: ${index * ROW}px">
+                    <div class="rank-badge" style="background: ${badgeColor(rank)}">#${rank}</div>
+                    <div class="game-info">
+                        ${iconHtml}<h3 class="game-title">${escapeHtml(title)}</h3>
+                        <p class="game-developer">${escapeHtml(developer)}</p>
+                        <div class="game-meta">
+                            <span class="badge badge-genre">${escapeHtml(genre)}</span>
+                            <span class="badge badge-rating">⭐ ${(rating || 0).toFixed(1)}</span>
+                            <span class="badge badge-installs">📥 ${installs ? installs.toLocaleString() : 'N/A'}</span>
                         </div>
-                        <span>신규성 {freshness:.2f}</span>
+                        <p class="game-release">출시일: ${escapeHtml(release)}</p>
                     </div>
-                    <div class="score-item">
-                        <div class="score-bar">
-                            <div class="score-fill" style="width: {popularity*100}%; background: #FF9800"></div>
+                    <div class="game-scores">
+                        <div class="score-main">
+                            <div class="score-value">${score.toFixed(3)}</div>
+                            <div class="score-label">최종 점수</div>
+                        </div>
+                        <div class="score-breakdown">
+                            ${scoreBar(quality, '#4CAF50', '품질')}
+                            ${scoreBar(freshness, '#2196F3', '신규성')}
+                            ${scoreBar(popularity, '#FF9800', '인기도')}
                         </div>
-                        <span>인기도 {popularity:.2f}</span>
                     </div>
-                </div>
+                </div>`;
+            }
+            
+            // Render whole batches covering the visible rows; rebuild only when the batch range changes
+            let renderedRange = '';
+            function render() {
+                const first = Math.floor(viewport.scrollTop / ROW);
+                const last = Math.min(view.length - 1, Math.ceil((viewport.scrollTop + viewport.clientHeight) / ROW));
+                const start = Math.floor(first / BATCH) * BATCH;
+                const end = Math.min(view.length, (Math.floor(last / BATCH) + 1) * BATCH);
+                const range = `${start}:${end}`;
+                if (range === renderedRange) return;
+                renderedRange = range;
+                
+                const html = [];
+                for (let i = start; i < end; i++) html.push(renderCard(view[i], i));
+                spacer.innerHTML = html.join('');
+            }
+            
+            let scheduled = false;
+            viewport.addEventListener('scroll', () => {
+                if (scheduled) return;
+                scheduled = true;
+                requestAnimationFrame(() => { scheduled = false; render(); });
+            });
+            window.addEventListener('resize', render);
+            
+            // Search/filter results (row indices, or null for all rows)
+            document.addEventListener('report-filter', (event) => {
+                view = event.detail ? event.detail.map((i) => rows[i]) : rows;
+                spacer.style.height = (view.length * ROW) + 'px';
+                viewport.scrollTop = 0;
+                renderedRange = '';
+                render();
+            });
+            render();
+        })();
+'''
+
+VIRTUAL_SCRIPT = '\n    <script>\n' + VIRTUAL_JS + '    </script>\n'
+
+
+def game_to_row(game: Dict[str, Any], icon_src: Optional[str] = None) -> List[Any]:
+    """Compact row (VIRTUAL_FIELDS order) for the embedded JSON blob"""
+    scores = game.get('scores', {})
+    return [
+        game.get('rank', 0),
+        game.get('title', 'Unknown'),
+        game.get('developer', 'Unknown'),
+        game.get('genre', 'Unknown'),
+        game.get('rating') or 0,
+        game.get('installs') or 0,
+        game.get('release_date') or 'Unknown',
+        game.get('final_score', 0),
+        scores.get('quality', 0),
+        scores.get('freshness', 0),
+        scores.get('popularity', 0),
+        icon_src,
+    ]
+
+
+def iter_virtual_html(
+    games: Iterable[Dict[str, Any]],
+    query: str,
+    country: str,
+    page_size: int,
+    stats: Optional[Dict[str, Any]] = None,
+    stylesheet_href: Optional[str] = None,
+    script_src: Optional[str] = None,
+    icons: Optional[Dict[str, str]] = None,
+    search_index: Optional[Dict[str, Any]] = None,
+    templates: Optional[ReportTemplates] = None
+) -> Iterator[str]:
+    """
+    Yield a virtual-scrolling report: the game data is embedded once as a
+    compact JSON blob and only rows near the viewport become DOM nodes.
+    
+    With `stylesheet_href` / `script_src` the CSS (including VIRTUAL_CSS)
+    and the scroller script are linked instead of inlined.
+    """
+    if stats is None:
+        stats = compute_report_stats(games)
+    icons = icons or {}
+    templates = templates or load_templates()
+    
+    yield render_html_head(query, country, stats, stylesheet_href, templates, VIRTUAL_CSS)
+    if search_index:
+        yield render_search_controls(search_index)
+    yield '''
+            <div id="virtual-viewport" class="virtual-viewport">
+                <div id="virtual-spacer" class="virtual-spacer"></div>
             </div>
-        </div>
-        '''
+            <script type="application/json" id="games-data">'''
+    yield json_for_script({
+        'fields': VIRTUAL_FIELDS,
+        'row_height': VIRTUAL_ROW_HEIGHT,
+        'page_size': page_size,
+    })[:-1] + ',"rows":['
+    for i, game in enumerate(games):
+        yield (',' if i else '') + json_for_script(game_to_row(game, icons.get(game.get('icon_url'))))
+    yield ']}</script>\n'
+    if script_src:
+        yield f'\n    <script src="{script_src}"></script>\n'
+    else:
+        yield VIRTUAL_SCRIPT
+    if search_index:
+        yield render_search_index_script(search_index)
+    yield render_html_footer(stats, templates)
+
+
+def write_virtual_html(
+    games: Iterable[Dict[str, Any]],
+    query: str,
+    country: str,
+    run_id: str,
+    page_size: int,
+    stats: Optional[Dict[str, Any]] = None,
+    stylesheet_href: Optional[str] = None,
+    script_src: Optional[str] = None,
+    icons: Optional[Dict[str, str]] = None,
+    search_index: Optional[Dict[str, Any]] = None,
+    templates: Optional[ReportTemplates] = None,
+    output_dir: Optional[Path] = None
+) -> str:
+    """Stream a virtual-scrolling report to disk"""
+    output_path = get_report_path(run_id, output_dir)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for chunk in iter_virtual_html(
+            games, query, country, page_size, stats, stylesheet_href, script_src, icons, search_index,
+            templates
+        ):
+            f.write(chunk)
     
-    # Generate genre chart data
-    genre_chart_labels = json.dumps([g[0] for g in top_genres])
-    genre_chart_data = json.dumps([g[1] for g in top_genres])
+    return str(output_path.absolute())
+
+
+def render_pager(page: int, total_pages: int) -> str:
+    """Page navigation: first/prev, a window around the current page, next/last"""
+    window = range(max(1, page - 3), min(total_pages, page + 3) + 1)
+    links = []
+    if page > 1:
+        links.append('<a href="page-1.html">«</a>')
+        links.append(f'<a href="page-{page - 1}.html">‹</a>')
+    for number in window:
+        if number == page:
+            links.append(f'<span class="current">{number}</span>')
+        else:
+            links.append(f'<a href="page-{number}.html">{number}</a>')
+    if page < total_pages:
+        links.append(f'<a href="page-{page + 1}.html">›</a>')
+        links.append(f'<a href="page-{total_pages}.html">»</a>')
+    return f'''
+            <nav class="pager">{"".join(links)}</nav>'''
+
+
+def write_paged_html(
+    games: List[Dict[str, Any]],
+    query: str,
+    country: str,
+    run_id: str,
+    page_size: int,
+    stylesheet_href: Optional[str] = None,
+    icons: Optional[Dict[str, str]] = None,
+    templates: Optional[ReportTemplates] = None,
+    output_dir: Optional[Path] = None
+) -> List[str]:
+    """
+    Split the report into static page-1.html ... page-N.html files sharing
+    a single stylesheet (a local report.css unless `stylesheet_href` is given).
+    
+    Returns:
+        Paths of the written pages (first page first)
+    """
+    templates = templates or load_templates()
+    output_dir = get_report_path(run_id, output_dir).parent
+    if not stylesheet_href:
+        (output_dir / 'report.css').write_text(templates.css + PAGER_CSS, encoding='utf-8')
+        stylesheet_href = 'report.css'
+    
+    stats = compute_report_stats(games)
+    icons = icons or {}
+    total_pages = max(1, math.ceil(len(games) / page_size))
+    
+    paths = []
+    for page in range(1, total_pages + 1):
+        page_path = output_dir / f"page-{page}.html"
+        pager = render_pager(page, total_pages)
+        with open(page_path, 'w', encoding='utf-8') as f:
+            f.write(render_html_head(query, country, stats, stylesheet_href, templates))
+            f.write(pager)
+            for game in games[(page - 1) * page_size:page * page_size]:
+                f.write(render_game_card(game, icons.get(game.get('icon_url')), templates))
+            f.write(pager)
+            f.write(render_html_footer(stats, templates))
+        paths.append(str(page_path.absolute()))
     
-    # Generate HTML
-    html = f'''<!DOCTYPE html>
+    return paths
+
+
+def render_diff_html(
+    diff: Dict[str, Any],
+    query: str,
+    country: str,
+    previous_label: str,
+    limit: int,
+    templates: Optional[ReportTemplates] = None
+) -> str:
+    """Rank diff report page (entered / dropped / moved tables)"""
+    css = (templates or load_templates()).css
+    return f'''<!DOCTYPE html>
 <html lang="ko">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>게임 랭킹 리포트 - {query} ({country})</title>
+    <title>랭킹 변동 리포트 - {query} ({country})</title>
     <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: #333;
-            min-height: 100vh;
-            padding: 20px;
-        }}
-        
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-        }}
-        
-        .header {{
-            background: white;
-            padding: 40px;
-            border-radius: 20px;
-            box-shadow: 0 10px 40px rgba(0,0,0,0.1);
-            margin-bottom: 30px;
-            text-align: center;
-        }}
-        
-        .header h1 {{
-            font-size: 2.5em;
-            color: #667eea;
-            margin-bottom: 10px;
-        }}
-        
-        .header .subtitle {{
-            color: #666;
-            font-size: 1.2em;
-        }}
-        
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-        }}
-        
-        .stat-card {{
-            background: white;
-            padding: 30px;
-            border-radius: 15px;
-            box-shadow: 0 5px 20px rgba(0,0,0,0.1);
-            text-align: center;
-        }}
-        
-        .stat-value {{
-            font-size: 3em;
-            font-weight: bold;
-            color: #667eea;
-            margin-bottom: 10px;
-        }}
-        
-        .stat-label {{
-            color: #666;
-            font-size: 1em;
-        }}
-        
-        .content {{
-            background: white;
-            padding: 40px;
-            border-radius: 20px;
-            box-shadow: 0 10px 40px rgba(0,0,0,0.1);
-        }}
-        
-        .section-title {{
-            font-size: 2em;
-            color: #333;
-            margin-bottom: 30px;
-            padding-bottom: 15px;
-            border-bottom: 3px solid #667eea;
-        }}
-        
-        .game-card {{
-            background: #f8f9fa;
-            border-radius: 15px;
-            padding: 25px;
-            margin-bottom: 20px;
-            display: grid;
-            grid-template-columns: auto 1fr auto;
-            gap: 25px;
-            align-items: center;
-            transition: transform 0.2s, box-shadow 0.2s;
-            position: relative;
-        }}
-        
-        .game-card:hover {{
-            transform: translateY(-5px);
-            box-shadow: 0 10px 30px rgba(0,0,0,0.15);
-        }}
-        
-        .rank-badge {{
-            width: 60px;
-            height: 60px;
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 1.5em;
-            font-weight: bold;
-            color: white;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.2);
-        }}
-        
-        .game-info {{
-            flex: 1;
-        }}
-        
-        .game-title {{
-            font-size: 1.5em;
-            color: #333;
-            margin-bottom: 5px;
-        }}
-        
-        .game-developer {{
-            color: #666;
-            margin-bottom: 10px;
-        }}
-        
-        .game-meta {{
-            display: flex;
-            gap: 10px;
-            flex-wrap: wrap;
-            margin-bottom: 10px;
-        }}
-        
-        .badge {{
-            padding: 5px 12px;
-            border-radius: 20px;
-            font-size: 0.85em;
-            font-weight: 500;
-        }}
-        
-        .badge-genre {{
-            background: #e3f2fd;
-            color: #1976d2;
-        }}
-        
-        .badge-rating {{
-            background: #fff3e0;
-            color: #f57c00;
-        }}
-        
-        .badge-installs {{
-            background: #f3e5f5;
-            color: #7b1fa2;
-        }}
-        
-        .game-release {{
-            color: #999;
-            font-size: 0.9em;
-        }}
-        
-        .game-scores {{
-            min-width: 250px;
-        }}
-        
-        .score-main {{
-            text-align: center;
-            margin-bottom: 15px;
-        }}
-        
-        .score-value {{
-            font-size: 2.5em;
-            font-weight: bold;
-            color: #667eea;
-        }}
-        
-        .score-label {{
-            color: #666;
-            font-size: 0.9em;
-        }}
-        
-        .score-breakdown {{
-            display: flex;
-            flex-direction: column;
-            gap: 8px;
-        }}
-        
-        .score-item {{
-            display: flex;
-            align-items: center;
-            gap: 10px;
-        }}
-        
-        .score-bar {{
-            flex: 1;
-            height: 20px;
-            background: #e0e0e0;
-            border-radius: 10px;
-            overflow: hidden;
-        }}
-        
-        .score-fill {{
-            height: 100%;
-            transition: width 0.3s ease;
-        }}
-        
-        .score-item span {{
-            min-width: 100px;
-            font-size: 0.85em;
-            color: #666;
-        }}
-        
-        .chart-container {{
-            margin-top: 40px;
-            padding: 30px;
-            background: #f8f9fa;
-            border-radius: 15px;
-        }}
-        
-        .footer {{
-            text-align: center;
-            margin-top: 40px;
-            padding: 30px;
-            background: white;
-            border-radius: 15px;
-            color: #666;
-        }}
-        
-        @media (max-width: 768px) {{
-            .game-card {{
-                grid-template-columns: 1fr;
-                text-align: center;
-            }}
-            
-            .game-scores {{
-                width: 100%;
-            }}
-            
-            .header h1 {{
-                font-size: 1.8em;
-            }}
-        }}
-    </style>
+{css}{DIFF_CSS}    </style>
 </head>
 <body>
     <div class="container">
         <div class="header">
-            <h1>🎮 게임 랭킹 리포트</h1>
-            <p class="subtitle">{query} · {country} · {datetime.now().strftime('%Y-%m-%d')}</p>
+            <h1>🔀 랭킹 변동 리포트</h1>
+            <p class="subtitle">{query} · {country} · {previous_label} → {datetime.now().strftime('%Y-%m-%d')}</p>
         </div>
         
-        <div class="stats-grid">
-            <div class="stat-card">
-                <div class="stat-value">{total_games}</div>
-                <div class="stat-label">총 게임 수</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-value">{avg_score:.3f}</div>
-                <div class="stat-label">평균 점수</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-value">{len(genre_counts)}</div>
-                <div class="stat-label">장르 수</div>
-            </div>
-        </div>
-        
-        <div class="content">
-            <h2 class="section-title">🏆 상위 랭킹 게임</h2>
-            {game_cards_html}
-            
-            <div class="chart-container">
-                <h3 style="margin-bottom: 20px; color: #333;">📊 장르 분포 (상위 5개)</h3>
-                <canvas id="genreChart" width="400" height="200"></canvas>
-            </div>
+        <div class="content">{render_diff_tables(diff, limit)}
         </div>
         
         <div class="footer">
             <p>Generated by play-new-games pipeline</p>
-            <p style="margin-top: 10px; font-size: 0.9em;">
-                품질 45% · 신규성 35% · 인기도 20%
-            </p>
         </div>
     </div>
-    
-    <script src="https://cdn.jsdelivr.net/npm/chart.js@3.9.1/dist/chart.min.js"></script>
-    <script>
-        const ctx = document.getElementById('genreChart').getContext('2d');
-        new Chart(ctx, {{
-            type: 'bar',
-            data: {{
-                labels: {genre_chart_labels},
-                datasets: [{{
-                    label: '게임 수',
-                    data: {genre_chart_data},
-                    backgroundColor: [
-                        'rgba(102, 126, 234, 0.8)',
-                        'rgba(118, 75, 162, 0.8)',
-                        'rgba(76, 175, 80, 0.8)',
-                        'rgba(255, 152, 0, 0.8)',
-                        'rgba(33, 150, 243, 0.8)'
-                    ],
-                    borderColor: [
-                        'rgba(102, 126, 234, 1)',
-                        'rgba(118, 75, 162, 1)',
-                        'rgba(76, 175, 80, 1)',
-                        'rgba(255, 152, 0, 1)',
-                        'rgba(33, 150, 243, 1)'
-                    ],
-                    borderWidth: 2,
-                    borderRadius: 10
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: true,
-                plugins: {{
-                    legend: {{
-                        display: false
-                    }}
-                }},
-                scales: {{
-                    y: {{
-                        beginAtZero: true,
-                        ticks: {{
-                            stepSize: 1
-                        }}
-                    }}
-                }}
-            }}
-        }});
-    </script>
 </body>
 </html>'''
-    
-    return html
 
 
-def save_html(html: str, run_id: str) -> str:
-    """Save HTML to file"""
-    # Create output directory
-    date_str = datetime.now().strftime('%Y%m%d')
-    output_dir = Path('outputs') / date_str / run_id / 'reports'
-    output_dir.mkdir(parents=True, exist_ok=True)
+def write_diff_html(
+    games: List[Dict[str, Any]],
+    previous_games: List[Dict[str, Any]],
+    query: str,
+    country: str,
+    run_id: str,
+    previous_label: str,
+    limit: int = 100,
+    templates: Optional[ReportTemplates] = None
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Write reports/rank_diff.html comparing this run with a previous one.
     
-    # Save HTML file
-    output_path = output_dir / 'game_ranking.html'
+    Returns:
+        (report path, diff)
+    """
+    diff = diff_rankings(games, previous_games)
+    output_path = get_report_path(run_id).with_name('rank_diff.html')
     with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+        f.write(render_diff_html(diff, query, country, previous_label, limit, templates))
     
-    return str(output_path.absolute())
+    return str(output_path.absolute()), diff
+
+
+def resolve_icons(
+    games: List[Dict[str, Any]],
+    icon_mode: str,
+    report_dir: Path,
+    cache: IconCache
+) -> Dict[str, str]:
+    """
+    Cache every game's icon and map icon_url to the src used in the report:
+    a path relative to `report_dir` ('lazy') or a data URI ('inline').
+    """
+    if icon_mode == 'none':
+        return {}
+    
+    paths = cache.fetch_all(game.get('icon_url') for game in games)
+    if icon_mode == 'inline':
+        return {url: data_uri(path) for url, path in paths.items()}
+    return {url: asset_href(path, report_dir) for url, path in paths.items()}
+
+
+def publish_shared_assets(
+    report_mode: str,
+    report_dir: Path,
+    assets_dir: Path = DEFAULT_ASSETS_DIR,
+    compress: Iterable[str] = (),
+    templates: Optional[ReportTemplates] = None
+) -> Dict[str, str]:
+    """
+    Write the report's CSS (and the virtual scroller's JS) as content-hashed
+    assets shared by every run.
+    
+    Returns:
+        {'css': href, 'js': href (virtual mode only), 'paths': [...]}
+        with hrefs relative to `report_dir`
+    """
+    css = (templates or load_templates()).css
+    if report_mode == 'virtual':
+        css += VIRTUAL_CSS
+    elif report_mode == 'pages':
+        css += PAGER_CSS
+    
+    css_path = write_hashed_asset(css, 'report', '.css', assets_dir, compress)
+    assets = {'css': asset_href(css_path, report_dir), 'paths': [str(css_path)]}
+    
+    if report_mode == 'virtual':
+        js_path = write_hashed_asset(VIRTUAL_JS, 'virtual', '.js', assets_dir, compress)
+        assets['js'] = asset_href(js_path, report_dir)
+        assets['paths'].append(str(js_path))
+    
+    return assets
+
+
+def summarize_report_size(paths: List[str], compress: Iterable[str]) -> Dict[str, Any]:
+    """
+    Precompress every report file and total up the byte sizes.
+    
+    Returns:
+        {'bytes': n, 'compressed': {fmt: {'bytes': n, 'ratio': r}}}
+    """
+    total = 0
+    compressed: Dict[str, int] = {fmt: 0 for fmt in compress}
+    for path in paths:
+        info = precompress(path, compress)
+        total += info['bytes']
+        for fmt, entry in info['compressed'].items():
+            compressed[fmt] += entry['bytes']
+    
+    return {
+        'bytes': total,
+        'compressed': {
+            fmt: {'bytes': size, 'ratio': round(size / total, 4) if total else 0.0}
+            for fmt, size in compressed.items()
+        }
+    }
 
 
 def main():
@@ -483,11 +773,45 @@ def main():
     query = os.getenv('QUERY', 'new games')
     country = os.getenv('COUNTRY', 'KR')
     run_id = os.getenv('RUN_ID', datetime.now().strftime("%H%M%S"))
+    report_mode = os.getenv('REPORT_MODE', 'cards')
+    page_size = int(os.getenv('PAGE_SIZE', '100'))
+    asset_mode = os.getenv('ASSET_MODE', 'inline')
+    previous_items_path = os.getenv('PREVIOUS_RANKED_ITEMS_PATH')
+    previous_label = os.getenv('PREVIOUS_RUN_ID', 'previous')
+    diff_limit = int(os.getenv('DIFF_LIMIT', '100'))
+    icon_mode = os.getenv('ICON_MODE', 'none')
+    icon_cache_dir = Path(os.getenv('ICON_CACHE_DIR', str(DEFAULT_CACHE_DIR)))
+    icon_ttl = int(os.getenv('ICON_TTL', str(DEFAULT_TTL_SECONDS)))
+    search_enabled = os.getenv('SEARCH', '1').strip().lower() not in ('0', 'false', 'off', 'no')
+    assets_dir = Path(os.getenv('ASSETS_DIR', str(DEFAULT_ASSETS_DIR)))
+    template_dir = os.getenv('TEMPLATE_DIR')
+    
+    if report_mode not in REPORT_MODES:
+        logger.error(f"REPORT_MODE must be one of {', '.join(REPORT_MODES)}")
+        sys.exit(1)
+    if report_mode == 'diff' and not previous_items_path:
+        logger.error("REPORT_MODE=diff requires PREVIOUS_RANKED_ITEMS_PATH")
+        sys.exit(1)
+    if icon_mode not in ICON_MODES:
+        logger.error(f"ICON_MODE must be one of {', '.join(ICON_MODES)}")
+        sys.exit(1)
+    if asset_mode not in ASSET_MODES:
+        logger.error(f"ASSET_MODE must be one of {', '.join(ASSET_MODES)}")
+        sys.exit(1)
+    try:
+        compress = parse_compress_formats(os.getenv('COMPRESS'))
+    except ValueError as e:
+        logger.error(str(e))
+        sys.exit(1)
     
     logger.info(f"Ranked items path: {ranked_items_path}")
     logger.info(f"Query: {query}")
     logger.info(f"Country: {country}")
     logger.info(f"Run ID: {run_id}")
+    logger.info(f"Report mode: {report_mode} (page size {page_size})")
+    logger.info(f"Assets: {asset_mode}, compression: {', '.join(compress) or 'none'}")
+    logger.info(f"Icons: {icon_mode}")
+    logger.info(f"Templates: {template_dir or 'default'}")
     logger.info("=" * 60)
     
     # Load ranked games
@@ -495,14 +819,72 @@ def main():
     games = load_ranked_games(ranked_items_path)
     logger.info(f"Loaded {len(games)} games")
     
-    # Generate HTML
-    logger.info("Step 2: Generating HTML...")
-    html = generate_html(games, query, country)
+    try:
+        templates = load_templates(template_dir)
+    except OSError as e:
+        logger.error(f"Cannot load templates: {e}")
+        sys.exit(1)
+    
+    # Generate and save HTML (streamed card by card)
+    logger.info("Step 2: Writing HTML report...")
+    assets = {}
+    diff = None
+    if asset_mode == 'shared' and report_mode != 'diff':
+        assets = publish_shared_assets(
+            report_mode, get_report_path(run_id).parent, assets_dir, compress, templates
+        )
+        logger.info(f"Shared assets: {', '.join(assets['paths'])}")
+    
+    icons = {}
+    icon_cache = IconCache(icon_cache_dir, icon_ttl)
+    if report_mode != 'diff':
+        icons = resolve_icons(games, icon_mode, get_report_path(run_id).parent, icon_cache)
+    
+    # Prebuilt search index (cards/virtual modes)
+    search_index = None
+    if search_enabled and report_mode in ('cards', 'virtual'):
+        start = time.perf_counter()
+        search_index = build_search_index(games)
+        build_ms = (time.perf_counter() - start) * 1000
+        index_bytes = len(json_for_script(search_index).encode('utf-8'))
+        logger.info(
+            f"Search index: {len(search_index['tokens'])} tokens, "
+            f"{index_bytes:,} bytes, built in {build_ms:.1f}ms"
+        )
+    
+    page_paths = []
+    if report_mode == 'diff':
+        previous_games = load_ranked_games(previous_items_path)
+        logger.info(f"Comparing with {len(previous_games)} games from {previous_label}")
+        output_path, diff = write_diff_html(
+            games, previous_games, query, country, run_id, previous_label, diff_limit, templates
+        )
+        logger.info(f"Rank diff: {diff_summary(diff)}")
+    elif report_mode == 'virtual':
+        output_path = write_virtual_html(
+            games, query, country, run_id, page_size,
+            stylesheet_href=assets.get('css'), script_src=assets.get('js'), icons=icons,
+            search_index=search_index, templates=templates
+        )
+    elif report_mode == 'pages':
+        page_paths = write_paged_html(
+            games, query, country, run_id, page_size, stylesheet_href=assets.get('css'), icons=icons,
+            templates=templates
+        )
+        output_path = page_paths[0]
+        logger.info(f"Wrote {len(page_paths)} pages")
+    else:
+        output_path = write_html(
+            games, query, country, run_id, stylesheet_href=assets.get('css'), icons=icons,
+            search_index=search_index, templates=templates
+        )
     logger.info("HTML generated successfully")
     
-    # Save HTML
-    logger.info("Step 3: Saving HTML file...")
-    output_path = save_html(html, run_id)
+    # Byte sizes (and .gz/.br siblings for static servers)
+    report_size = summarize_report_size(page_paths or [output_path], compress)
+    logger.info(f"Report size: {report_size['bytes']:,} bytes")
+    for fmt, entry in report_size['compressed'].items():
+        logger.info(f"  {fmt}: {entry['bytes']:,} bytes (ratio {entry['ratio']:.3f})")
     
     logger.info("=" * 60)
     logger.info("✓ Success!")
@@ -512,14 +894,26 @@ def main():
     # Output JSON for pipeline
     result = {
         "html_report_path": output_path,
+        "report_mode": report_mode,
+        "asset_mode": asset_mode,
+        "report_bytes": report_size['bytes'],
+        "compression": report_size['compressed'],
         "total_games": len(games),
+        "icons": len(icons),
+        "http_requests": icon_cache.request_count,
         "run_id": run_id
     }
-    print(json.dumps(result))
+    if page_paths:
+        result["page_paths"] = page_paths
+    if assets:
+        result["asset_paths"] = assets['paths']
+    if diff is not None:
+        result["diff"] = diff_summary(diff)
+    emit_result(result)
     
     return 0
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(run_profiled('publish_html', main))
 
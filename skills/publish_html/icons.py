@@ -0,0 +1,181 @@
+"""Content-addressed icon thumbnail cache for the HTML report."""
+import os
+import io
+import json
+import time
+import base64
+import hashlib
+import logging
+import urllib.request
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable, Optional
+
+try:
+    from PIL import Image
+except ImportError:  # optional dependency
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+# Shared across runs: an icon is downloaded once per TTL, not once per report
+DEFAULT_CACHE_DIR = Path('outputs') / 'cache' / 'icons'
+
+# 'none': no images, 'lazy': <img loading="lazy"> pointing at the cache,
+# 'inline': data URIs (self-contained, best for small reports)
+ICON_MODES = ('none', 'lazy', 'inline')
+
+ICON_SIZE = 64
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_WORKERS = 8
+REQUEST_TIMEOUT = 10
+
+_MIME_TYPES = {'.png': 'image/png', '.webp': 'image/webp', '.jpg': 'image/jpeg', '.gif': 'image/gif'}
+
+
+def sized_url(url: str, size: int) -> str:
+    """
+    Ask Google's image CDN for a small rendition (`=s<px>`, 2x for HiDPI)
+    so only a few KB are transferred per icon.
+    """
+    if 'googleusercontent.com' not in url:
+        return url
+    return url.split('=')[0] + f'=s{size * 2}'
+
+
+def _sniff_suffix(data: bytes) -> str:
+    if data.startswith(b'\x89PNG'):
+        return '.png'
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return '.webp'
+    if data.startswith(b'\xff\xd8'):
+        return '.jpg'
+    if data.startswith(b'GIF8'):
+        return '.gif'
+    return '.img'
+
+
+def make_thumbnail(data: bytes, size: int) -> bytes:
+    """Resize to at most size x size PNG (returns data unchanged without Pillow)"""
+    if Image is None:
+        return data
+    with Image.open(io.BytesIO(data)) as image:
+        image.thumbnail((size, size))
+        out = io.BytesIO()
+        image.save(out, format='PNG', optimize=True)
+        return out.getvalue()
+
+
+class IconCache:
+    """
+    Downloads icons once into <cache_dir>/<sha256><ext> and remembers
+    url -> file in index.json. Entries older than `ttl_seconds` are refetched.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path = DEFAULT_CACHE_DIR,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        size: int = ICON_SIZE,
+        workers: int = DEFAULT_WORKERS
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+        self.size = size
+        self.workers = workers
+        self.index_path = self.cache_dir / 'index.json'
+        self.index = self._load_index()
+        self.request_count = 0
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _save_index(self):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_name(f"index.json.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, ensure_ascii=False)
+        os.replace(tmp_path, self.index_path)
+
+    def cached_path(self, url: str) -> Optional[Path]:
+        """Cached thumbnail of `url` if present and fresh"""
+        entry = self.index.get(url)
+        if not entry or time.time() - entry['fetched_at'] > self.ttl_seconds:
+            return None
+        path = self.cache_dir / entry['file']
+        return path if path.exists() else None
+
+    def _download(self, url: str) -> bytes:
+        request = urllib.request.Request(
+            sized_url(url, self.size), headers={'User-Agent': 'Mozilla/5.0'}
+        )
+        with urllib.request.urlopen(request, timeout=REQUEST_TIMEOUT) as response:
+            return response.read()
+
+    def _store(self, data: bytes) -> str:
+        """Write a thumbnail under its content hash; identical icons share a file"""
+        thumbnail = make_thumbnail(data, self.size)
+        name = hashlib.sha256(thumbnail).hexdigest()[:16] + _sniff_suffix(thumbnail)
+        path = self.cache_dir / name
+        if not path.exists():
+            tmp_path = path.with_name(f"{name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(thumbnail)
+            os.replace(tmp_path, path)
+        return name
+
+    def fetch_all(self, urls: Iterable[str]) -> Dict[str, Path]:
+        """
+        Make sure every URL is cached, downloading missing or stale icons
+        concurrently. Failed downloads are logged and left out.
+
+        Returns:
+            url -> cached file
+        """
+        unique = [url for url in dict.fromkeys(urls) if url]
+        paths = {}
+        missing = []
+        for url in unique:
+            path = self.cached_path(url)
+            if path:
+                paths[url] = path
+            else:
+                missing.append(url)
+
+        if not missing:
+            return paths
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        def fetch(url):
+            try:
+                return url, self._download(url)
+            except Exception as e:
+                logger.warning(f"Icon download failed for {url}: {e}")
+                return url, None
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for url, data in executor.map(fetch, missing):
+                self.request_count += 1
+                if data is None:
+                    continue
+                try:
+                    name = self._store(data)
+                except Exception as e:
+                    logger.warning(f"Icon thumbnail failed for {url}: {e}")
+                    continue
+                self.index[url] = {'file': name, 'fetched_at': time.time()}
+                paths[url] = self.cache_dir / name
+
+        self._save_index()
+        logger.info(f"Icons: {len(unique) - len(missing)} cached, {len(missing)} fetched")
+        return paths
+
+
+def data_uri(path: Path) -> str:
+    """Inline a cached icon as a data: URI"""
+    mime = _MIME_TYPES.get(path.suffix, 'application/octet-stream')
+    return f"data:{mime};base64,{base64.b64encode(path.read_bytes()).decode('ascii')}"
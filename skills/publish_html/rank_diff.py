@@ -0,0 +1,193 @@
+"""Rank diff between two runs: entered, dropped and moved games."""
+from html import escape
+from typing import List, Dict, Any, Tuple
+
+from skills.publish_html.charts import SCORE_COMPONENTS
+
+SCORE_KEYS = [key for key, _, _ in SCORE_COMPONENTS]
+
+DIFF_CSS = '''
+        .diff-summary {
+            display: flex;
+            gap: 12px;
+            flex-wrap: wrap;
+            margin-bottom: 30px;
+        }
+
+        .diff-summary .badge {
+            font-size: 1em;
+            padding: 8px 16px;
+        }
+
+        .diff-table {
+            width: 100%;
+            border-collapse: collapse;
+            margin-bottom: 40px;
+            font-size: 0.95em;
+        }
+
+        .diff-table th, .diff-table td {
+            padding: 8px 10px;
+            border-bottom: 1px solid #eee;
+            text-align: left;
+        }
+
+        .diff-table th {
+            background: #f8f9fa;
+            color: #555;
+        }
+
+        .delta-up {
+            color: #2e7d32;
+            font-weight: bold;
+        }
+
+        .delta-down {
+            color: #c62828;
+            font-weight: bold;
+        }
+'''
+
+
+def game_key(game: Dict[str, Any]) -> str:
+    """Join key: package_name, falling back to the title"""
+    return game.get('package_name') or game.get('title', '')
+
+
+def diff_rankings(
+    current: List[Dict[str, Any]],
+    previous: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Join two rankings by package_name through a hash index.
+
+    One dict lookup per game plus sorting the moved games, so 100k-row
+    rankings take about half a second. Score deltas are only computed for
+    the rows that get rendered (see move_details).
+
+    Returns:
+        {
+            'entered': games only in `current` (current order),
+            'dropped': games only in `previous` (previous order),
+            'moved': {'rank_delta', 'current', 'previous'} per game whose
+                     rank changed, largest move first,
+            'unchanged': number of games at the same rank,
+        }
+        rank_delta is positive when a game moved up.
+    """
+    remaining = {game_key(game): game for game in previous}
+    pop = remaining.pop
+
+    entered, moves = [], []
+    unchanged = 0
+    for index, game in enumerate(current):
+        before = pop(game_key(game), None)
+        if before is None:
+            entered.append(game)
+            continue
+        rank = game.get('rank', 0)
+        rank_delta = before.get('rank', 0) - rank
+        if rank_delta:
+            moves.append((-abs(rank_delta), rank, index, rank_delta, game, before))
+        else:
+            unchanged += 1
+
+    # Tuples sort natively (index breaks ties before the dicts are compared)
+    moves.sort()
+    moved = [
+        {'rank_delta': rank_delta, 'current': game, 'previous': before}
+        for _, _, _, rank_delta, game, before in moves
+    ]
+
+    return {
+        'entered': entered,
+        'dropped': list(remaining.values()),
+        'moved': moved,
+        'unchanged': unchanged,
+    }
+
+
+def move_details(move: Dict[str, Any]) -> Dict[str, Any]:
+    """Ranks, final score delta and per-component deltas of one moved game"""
+    game, before = move['current'], move['previous']
+    scores = game.get('scores', {})
+    previous_scores = before.get('scores', {})
+    return {
+        'package_name': game_key(game),
+        'title': game.get('title', 'Unknown'),
+        'rank': game.get('rank', 0),
+        'previous_rank': before.get('rank', 0),
+        'rank_delta': move['rank_delta'],
+        'score_delta': game.get('final_score', 0) - before.get('final_score', 0),
+        'component_deltas': {
+            name: scores.get(name, 0) - previous_scores.get(name, 0) for name in SCORE_KEYS
+        },
+    }
+
+
+def diff_summary(diff: Dict[str, Any]) -> Dict[str, int]:
+    """Counts per change type"""
+    return {
+        'entered': len(diff['entered']),
+        'dropped': len(diff['dropped']),
+        'moved': len(diff['moved']),
+        'unchanged': diff['unchanged'],
+    }
+
+
+def _delta(value: float, fmt: str) -> str:
+    css = 'delta-up' if value > 0 else 'delta-down' if value < 0 else ''
+    return f'<span class="{css}">{value:+{fmt}}</span>'
+
+
+def render_diff_tables(diff: Dict[str, Any], limit: int) -> str:
+    """Entered / dropped / moved tables, each capped at `limit` rows"""
+    summary = diff_summary(diff)
+    parts = [f'''
+            <div class="diff-summary">
+                <span class="badge badge-genre">🆕 신규 진입 {summary['entered']}</span>
+                <span class="badge badge-installs">📉 이탈 {summary['dropped']}</span>
+                <span class="badge badge-rating">↕ 순위 변동 {summary['moved']}</span>
+                <span class="badge">＝ 유지 {summary['unchanged']}</span>
+            </div>''']
+
+    sections: List[Tuple[str, List[str], List[str]]] = [
+        (
+            '🆕 신규 진입',
+            ['순위', '게임', '최종 점수'],
+            [
+                f'<td>#{g.get("rank", 0)}</td><td>{escape(str(g.get("title", "Unknown")))}</td>'
+                f'<td>{g.get("final_score", 0):.3f}</td>'
+                for g in diff['entered'][:limit]
+            ],
+        ),
+        (
+            '📉 이탈',
+            ['이전 순위', '게임', '이전 점수'],
+            [
+                f'<td>#{g.get("rank", 0)}</td><td>{escape(str(g.get("title", "Unknown")))}</td>'
+                f'<td>{g.get("final_score", 0):.3f}</td>'
+                for g in diff['dropped'][:limit]
+            ],
+        ),
+        (
+            '↕ 순위 변동',
+            ['순위', '이전', '변동', '게임', '점수 Δ'] + [f'{label} Δ' for _, label, _ in SCORE_COMPONENTS],
+            [
+                f'<td>#{m["rank"]}</td><td>#{m["previous_rank"]}</td><td>{_delta(m["rank_delta"], "d")}</td>'
+                f'<td>{escape(str(m["title"]))}</td><td>{_delta(m["score_delta"], ".3f")}</td>'
+                + ''.join(f'<td>{_delta(m["component_deltas"][key], ".3f")}</td>' for key in SCORE_KEYS)
+                for m in map(move_details, diff['moved'][:limit])
+            ],
+        ),
+    ]
+
+    for (title, headers, rows), total in zip(sections, (summary['entered'], summary['dropped'], summary['moved'])):
+        shown = f' (상위 {len(rows)}개 / 전체 {total}개)' if total > len(rows) else ''
+        header_cells = ''.join(f'<th>{h}</th>' for h in headers)
+        body = ''.join(f'<tr>{row}</tr>' for row in rows) or f'<tr><td colspan="{len(headers)}">없음</td></tr>'
+        parts.append(f'''
+            <h2 class="section-title">{title}{shown}</h2>
+            <table class="diff-table"><thead><tr>{header_cells}</tr></thead><tbody>{body}</tbody></table>''')
+
+    return ''.join(parts)
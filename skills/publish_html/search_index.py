@@ -0,0 +1,178 @@
+"""Prebuilt client-side search index embedded in the HTML report."""
+import re
+import json
+from html import escape
+from typing import List, Dict, Any, Iterable
+
+# Letters and digits of any script (Korean titles included); must match
+# the tokenizer in SEARCH_SCRIPT
+_TOKEN_RE = re.compile(r'[^\W_]+')
+
+# Fields indexed for full-text search (lists such as enrichment tags are flattened)
+SEARCH_FIELDS = ('title', 'developer', 'genre', 'tags', 'keywords')
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens"""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _field_text(value: Any) -> str:
+    if isinstance(value, (list, tuple)):
+        return ' '.join(str(item) for item in value)
+    return str(value) if value else ''
+
+
+def build_search_index(games: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build an inverted index over the report's games (doc id = card order).
+
+    Tokens are sorted so the page finds every token starting with a typed
+    prefix with one binary search; each token's postings list holds the
+    ids of the games that contain it.
+
+    Returns:
+        {
+            'tokens': sorted unique tokens,
+            'postings': ascending doc ids per token,
+            'genres': sorted genre names,
+            'genre': genre index per doc,
+            'score': final score per doc (3 decimals),
+        }
+    """
+    postings: Dict[str, List[int]] = {}
+    genre_ids: Dict[str, int] = {}
+    doc_genres, scores = [], []
+
+    for doc_id, game in enumerate(games):
+        text = ' '.join(_field_text(game.get(field)) for field in SEARCH_FIELDS)
+        for token in set(tokenize(text)):
+            postings.setdefault(token, []).append(doc_id)
+
+        genre = game.get('genre') or 'Unknown'
+        doc_genres.append(genre_ids.setdefault(genre, len(genre_ids)))
+        scores.append(round(game.get('final_score', 0), 3))
+
+    # Renumber genres alphabetically for the <select>
+    genres = sorted(genre_ids)
+    remap = {genre_ids[name]: i for i, name in enumerate(genres)}
+    tokens = sorted(postings)
+
+    return {
+        'tokens': tokens,
+        'postings': [postings[token] for token in tokens],
+        'genres': genres,
+        'genre': [remap[g] for g in doc_genres],
+        'score': scores,
+    }
+
+
+def json_for_script(value: Any) -> str:
+    """Compact JSON that is safe to embed inside a <script> element"""
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).replace('</', '<\\/')
+
+
+def render_search_controls(index: Dict[str, Any]) -> str:
+    """Search box, genre select and score range inputs"""
+    options = ''.join(
+        f'<option value="{i}">{escape(name)}</option>'
+        for i, name in enumerate(index['genres'])
+    )
+    return f'''
+            <div class="search-bar">
+                <input id="search-query" type="search" placeholder="제목 · 개발사 · 장르 · 태그 검색" autocomplete="off">
+                <select id="search-genre"><option value="">전체 장르</option>{options}</select>
+                <input id="search-min" type="number" min="0" max="1" step="0.05" placeholder="최소 점수">
+                <input id="search-max" type="number" min="0" max="1" step="0.05" placeholder="최대 점수">
+                <span id="search-count" class="search-count"></span>
+            </div>'''
+
+
+SEARCH_SCRIPT = '''
+    <script>
+        (function () {
+            const index = JSON.parse(document.getElementById('search-index').textContent);
+            const tokens = index.tokens;
+            const total = index.score.length;
+            const query = document.getElementById('search-query');
+            const genre = document.getElementById('search-genre');
+            const minScore = document.getElementById('search-min');
+            const maxScore = document.getElementById('search-max');
+            const count = document.getElementById('search-count');
+
+            // Card mode toggles the existing cards (collected once, in doc order);
+            // virtual mode receives the matching row ids
+            const virtual = document.getElementById('virtual-viewport') !== null;
+            const cards = virtual ? [] : Array.from(document.querySelectorAll('.game-card'));
+            const visible = new Uint8Array(total).fill(1);
+
+            const tokenize = (text) => text.toLowerCase().split(/[^\\p{L}\\p{N}]+/u).filter(Boolean);
+
+            // Doc ids containing a token that starts with `prefix` (binary search on sorted tokens)
+            const prefixCache = new Map();
+            function matchPrefix(prefix) {
+                if (prefixCache.has(prefix)) return prefixCache.get(prefix);
+                let lo = 0, hi = tokens.length;
+                while (lo < hi) {
+                    const mid = (lo + hi) >> 1;
+                    if (tokens[mid] < prefix) lo = mid + 1; else hi = mid;
+                }
+                const ids = new Set();
+                for (let i = lo; i < tokens.length && tokens[i].startsWith(prefix); i++) {
+                    for (const id of index.postings[i]) ids.add(id);
+                }
+                prefixCache.set(prefix, ids);
+                return ids;
+            }
+
+            function apply() {
+                const terms = tokenize(query.value);
+                const sets = terms.map(matchPrefix).sort((a, b) => a.size - b.size);
+                const g = genre.value === '' ? -1 : Number(genre.value);
+                const lo = minScore.value === '' ? -Infinity : Number(minScore.value);
+                const hi = maxScore.value === '' ? Infinity : Number(maxScore.value);
+                const filtered = terms.length || g >= 0 || minScore.value !== '' || maxScore.value !== '';
+
+                // Walk the smallest postings set (or every doc when there is no text query)
+                const candidates = sets.length ? Array.from(sets[0]).sort((a, b) => a - b) : null;
+                const ids = [];
+                const consider = (id) => {
+                    if (g >= 0 && index.genre[id] !== g) return;
+                    const score = index.score[id];
+                    if (score < lo || score > hi) return;
+                    for (let s = 1; s < sets.length; s++) if (!sets[s].has(id)) return;
+                    ids.push(id);
+                };
+                if (candidates) candidates.forEach(consider); else for (let id = 0; id < total; id++) consider(id);
+                count.textContent = filtered ? `${ids.length} / ${total}` : '';
+
+                if (virtual) {
+                    document.dispatchEvent(new CustomEvent('report-filter', {detail: filtered ? ids : null}));
+                    return;
+                }
+                // Only touch cards whose visibility changed
+                const next = new Uint8Array(total);
+                for (const id of ids) next[id] = 1;
+                for (let id = 0; id < cards.length; id++) {
+                    if (next[id] !== visible[id]) {
+                        cards[id].style.display = next[id] ? '' : 'none';
+                        visible[id] = next[id];
+                    }
+                }
+            }
+
+            let timer = null;
+            const schedule = () => { clearTimeout(timer); timer = setTimeout(apply, 60); };
+            query.addEventListener('input', schedule);
+            [genre, minScore, maxScore].forEach((el) => el.addEventListener('change', apply));
+        })();
+    </script>
+'''
+
+
+def render_search_index_script(index: Dict[str, Any]) -> str:
+    """Embedded index plus the search script (placed after the cards)"""
+    return (
+        f'\n            <script type="application/json" id="search-index">{json_for_script(index)}</script>\n'
+        + SEARCH_SCRIPT
+    )
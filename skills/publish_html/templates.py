@@ -0,0 +1,125 @@
+"""
+Precompiled report templates.
+
+Templates are plain files in templates/ with `{{ name }}` placeholders and
+optional format specs (`{{ score:.3f }}`). `{{> partial prefix }}` inlines
+partial.html with its placeholders renamed to `prefix_<name>`, so a card
+and its three score bars still compile to one expression.
+
+Each file is compiled once into a Python function returning a single
+f-string, so rendering a card costs the same as the hand-written f-string
+it replaces; a process rendering many reports compiles every template
+only once (see load_templates).
+
+A theme is a directory holding any subset of the files; missing files fall
+back to the defaults.
+"""
+import re
+from pathlib import Path
+from functools import lru_cache
+from typing import Dict, Any, Callable, List, Optional
+
+DEFAULT_TEMPLATE_DIR = Path(__file__).parent / 'templates'
+
+# Template files: head.html (up to the first card), card.html (one game),
+# score_bar.html (partial included three times per card), footer.html, report.css
+TEMPLATE_FILES = ('head.html', 'card.html', 'score_bar.html', 'footer.html')
+STYLESHEET_FILE = 'report.css'
+
+_PARTIAL_RE = re.compile(r'\{\{>\s*(\w+)(?:\s+(\w+))?\s*\}\}')
+
+# Format specs are limited to characters that are safe inside the generated f-string
+_PLACEHOLDER_RE = re.compile(r'\{\{\s*(\w+)(?::([\w.,<>^=+\- %#]*?))?\s*\}\}')
+
+
+class CompiledTemplate:
+    """
+    A template compiled to `render(**fields) -> str`.
+
+    Placeholders become keyword-only parameters of the generated function,
+    so a missing field raises TypeError naming it; fields the template does
+    not use are ignored.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        name: str = '<template>',
+        load_partial: Optional[Callable[[str], str]] = None
+    ):
+        self.name = name
+        self.names: List[str] = []
+        self._load_partial = load_partial
+        self.render = self._compile(self._expand(source))
+
+    def _expand(self, source: str, depth: int = 0) -> str:
+        """Inline `{{> partial prefix }}` includes"""
+        if depth > 8:
+            raise ValueError(f"Template {self.name}: partials nested too deeply")
+
+        def include(match):
+            if self._load_partial is None:
+                raise ValueError(f"Template {self.name}: no partial loader for {match.group(1)!r}")
+            partial = self._expand(self._load_partial(match.group(1)), depth + 1)
+            prefix = match.group(2)
+            if not prefix:
+                return partial
+            return _PLACEHOLDER_RE.sub(
+                lambda m: '{{ ' + f"{prefix}_{m.group(1)}" + (f":{m.group(2)}" if m.group(2) else '') + ' }}',
+                partial
+            )
+
+        return _PARTIAL_RE.sub(include, source)
+
+    def _compile(self, source: str) -> Callable[..., str]:
+        parts = []
+        position = 0
+        for match in _PLACEHOLDER_RE.finditer(source):
+            if match.start() > position:
+                parts.append(repr(source[position:match.start()]))
+            key, spec = match.group(1), match.group(2)
+            self.names.append(key)
+            parts.append(f"f'{{{key}:{spec or ''}}}'")
+            position = match.end()
+        if position < len(source):
+            parts.append(repr(source[position:]))
+
+        # Adjacent literals and f-strings fold into one expression at compile time
+        params = ''.join(f", {key}" for key in dict.fromkeys(self.names))
+        # Extra fields are accepted so a theme may leave some out
+        code = f"def render(*{params}, **_):\n    return ({' '.join(parts) or repr('')})\n"
+        namespace: Dict[str, Any] = {}
+        exec(compile(code, f"<template {self.name}>", 'exec'), namespace)
+        return namespace['render']
+
+
+class ReportTemplates:
+    """The compiled template files of one theme"""
+
+    def __init__(self, template_dir: Optional[Path] = None):
+        self.template_dir = Path(template_dir) if template_dir else DEFAULT_TEMPLATE_DIR
+        self.head = self._compile('head.html')
+        self.card = self._compile('card.html')
+        self.footer = self._compile('footer.html')
+        self.css = self._read(STYLESHEET_FILE)
+
+    def _read(self, filename: str) -> str:
+        path = self.template_dir / filename
+        if not path.exists():
+            path = DEFAULT_TEMPLATE_DIR / filename
+        return path.read_text(encoding='utf-8')
+
+    def _compile(self, filename: str) -> CompiledTemplate:
+        return CompiledTemplate(
+            self._read(filename), filename, lambda partial: self._read(f"{partial}.html")
+        )
+
+
+@lru_cache(maxsize=None)
+def _load_templates(template_dir: Optional[str]) -> ReportTemplates:
+    return ReportTemplates(Path(template_dir) if template_dir else None)
+
+
+def load_templates(template_dir: Optional[str] = None) -> ReportTemplates:
+    """Compiled templates for a theme directory (default theme when None), cached per process"""
+    return _load_templates(str(template_dir) if template_dir else None)
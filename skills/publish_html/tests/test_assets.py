@@ -0,0 +1,98 @@
+"""Tests for shared assets and precompressed reports."""
+import os
+import gzip
+import tempfile
+import unittest
+from pathlib import Path
+from skills.publish_html.assets import (
+    parse_compress_formats,
+    precompress,
+    write_hashed_asset
+)
+from skills.publish_html.handler import (
+    publish_shared_assets,
+    save_html,
+    summarize_report_size,
+    write_virtual_html
+)
+
+
+class TestHashedAssets(unittest.TestCase):
+    """Test content-hashed asset files."""
+    
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+    
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+    
+    def test_same_content_same_file(self):
+        """Identical content is written once under a stable name."""
+        first = write_hashed_asset('body {}', 'report', '.css', Path('assets'))
+        second = write_hashed_asset('body {}', 'report', '.css', Path('assets'))
+        other = write_hashed_asset('p {}', 'report', '.css', Path('assets'))
+        
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+        self.assertRegex(first.name, r'^report\.[0-9a-f]{12}\.css$')
+    
+    def test_virtual_report_links_shared_assets(self):
+        """Shared mode links the CSS and scroller script with relative URLs."""
+        games = [{'rank': 1, 'title': 'A', 'final_score': 0.5, 'scores': {}}]
+        report_dir = Path('outputs/20251107/test/reports')
+        assets = publish_shared_assets('virtual', report_dir, Path('outputs/assets'))
+        path = write_virtual_html(
+            games, 'q', 'KR', 'test', 10,
+            stylesheet_href=assets['css'], script_src=assets['js']
+        )
+        html = Path(path).read_text(encoding='utf-8')
+        
+        self.assertTrue(assets['css'].startswith('../../../assets/report.'))
+        self.assertIn(f'href="{assets["css"]}"', html)
+        self.assertIn(f'<script src="{assets["js"]}">', html)
+        self.assertNotIn('<style>', html)
+        self.assertTrue((Path(path).parent / assets['js']).exists())
+
+
+class TestPrecompress(unittest.TestCase):
+    """Test .gz/.br sibling files."""
+    
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+    
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+    
+    def test_gzip_sibling(self):
+        """save_html writes a .gz that decompresses to the report."""
+        html = '<p>game</p>' * 1000
+        path = save_html(html, 'test', compress=['gzip'])
+        with gzip.open(path + '.gz', 'rt', encoding='utf-8') as f:
+            self.assertEqual(f.read(), html)
+    
+    def test_size_and_ratio(self):
+        """Sizes and ratios are reported per format."""
+        path = save_html('<p>game</p>' * 1000, 'test')
+        info = precompress(path, ['gzip'])
+        self.assertEqual(info['bytes'], os.path.getsize(path))
+        self.assertLess(info['compressed']['gzip']['ratio'], 0.1)
+        
+        summary = summarize_report_size([path, path], ['gzip'])
+        self.assertEqual(summary['bytes'], 2 * info['bytes'])
+    
+    def test_parse_formats(self):
+        """COMPRESS values are normalized; unknown formats are rejected."""
+        self.assertEqual(parse_compress_formats(''), [])
+        self.assertEqual(parse_compress_formats('gz,gzip'), ['gzip'])
+        with self.assertRaises(ValueError):
+            parse_compress_formats('zip')
+
+
+if __name__ == '__main__':
+    unittest.main()
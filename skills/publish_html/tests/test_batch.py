@@ -0,0 +1,103 @@
+"""Tests for parallel batch rendering."""
+import os
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from skills.publish_html.batch import job_from_artifact, load_jobs, run_batch
+from skills.publish_html.tests.test_handler import make_games
+
+
+class TestBatchJobs(unittest.TestCase):
+    """Test job discovery."""
+    
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+    
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+    
+    def test_job_from_artifact(self):
+        """Query and country come from the run's metrics.json labels."""
+        run_dir = Path('outputs') / '20251107' / '142530'
+        (run_dir / 'artifacts').mkdir(parents=True)
+        (run_dir / 'metrics.json').write_text(
+            json.dumps({'labels': {'query': 'rpg', 'country': 'JP'}}), encoding='utf-8'
+        )
+        job = job_from_artifact(run_dir / 'artifacts' / 'ranked_games.json')
+        
+        self.assertEqual((job['query'], job['country'], job['run_id']), ('rpg', 'JP', '142530'))
+    
+    def test_load_jobs_defaults(self):
+        """run_id defaults to <query>_<country>."""
+        Path('jobs.json').write_text(json.dumps([{'ranked_items_path': 'a.json', 'query': 'new games'}]))
+        
+        self.assertEqual(load_jobs(Path('jobs.json'))[0]['run_id'], 'new_games_KR')
+
+
+class TestRunBatch(unittest.TestCase):
+    """Test run_batch function."""
+    
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        Path('ranked.json').write_text(json.dumps(make_games(5)), encoding='utf-8')
+    
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+    
+    def test_reports_share_assets(self):
+        """Every report links the same hashed stylesheet; failures don't stop the batch."""
+        jobs = [
+            {'ranked_items_path': 'ranked.json', 'query': 'q', 'country': country, 'run_id': f'q_{country}'}
+            for country in ('KR', 'US', 'JP')
+        ]
+        jobs.append({'ranked_items_path': 'missing.json', 'query': 'q', 'country': 'DE', 'run_id': 'q_DE'})
+        summary = run_batch(jobs, workers=2)
+        
+        self.assertEqual([r['run_id'] for r in summary['reports']], ['q_KR', 'q_US', 'q_JP'])
+        self.assertEqual([f['run_id'] for f in summary['failures']], ['q_DE'])
+        self.assertEqual(len(summary['asset_paths']), 1)
+        css_name = Path(summary['asset_paths'][0]).name
+        for report in summary['reports']:
+            html = Path(report['html_report_path']).read_text(encoding='utf-8')
+            self.assertIn(f'assets/{css_name}"', html)
+            self.assertNotIn('<style>', html)
+            self.assertEqual(report['total_games'], 5)
+            self.assertGreaterEqual(report['total_ms'], report['render_ms'])
+    
+    def test_same_run_id_different_days(self):
+        """Artifacts of different days sharing a run_id each write into their own run directory."""
+        jobs = []
+        for day in ('20251107', '20251108'):
+            artifacts = Path('outputs') / day / '060751' / 'artifacts'
+            artifacts.mkdir(parents=True)
+            (artifacts / 'ranked_games.json').write_text(json.dumps(make_games(3)), encoding='utf-8')
+            jobs.append(job_from_artifact(artifacts / 'ranked_games.json'))
+        summary = run_batch(jobs, workers=2)
+        
+        paths = [Path(report['html_report_path']) for report in summary['reports']]
+        self.assertEqual(len(set(paths)), 2)
+        self.assertEqual([path.parts[-4] for path in paths], ['20251107', '20251108'])
+        self.assertEqual(summary['failures'], [])
+    
+    def test_duplicate_output_rejected(self):
+        """Jobs resolving to the same report directory fail instead of overwriting each other."""
+        Path('jobs.json').write_text(json.dumps([
+            {'ranked_items_path': 'ranked.json', 'query': 'q'},
+            {'ranked_items_path': 'ranked.json', 'query': 'q'},
+        ]))
+        summary = run_batch(load_jobs(Path('jobs.json')), workers=2)
+        
+        self.assertEqual(summary['total_reports'], 1)
+        self.assertEqual(len(summary['failures']), 1)
+        self.assertIn('Duplicate output directory', summary['failures'][0]['error'])
+
+
+if __name__ == '__main__':
+    unittest.main()
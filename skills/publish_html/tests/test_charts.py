@@ -0,0 +1,51 @@
+"""Tests for charts module."""
+import unittest
+from skills.publish_html.charts import (
+    render_bar_chart_svg,
+    render_histogram_svg,
+    histogram_bin,
+    empty_histograms,
+    add_to_histograms
+)
+
+
+class TestHistogramBins(unittest.TestCase):
+    """Test histogram binning."""
+    
+    def test_bin_edges(self):
+        """Test scores on bin edges."""
+        self.assertEqual(histogram_bin(0.0), 0)
+        self.assertEqual(histogram_bin(0.55), 5)
+        self.assertEqual(histogram_bin(1.0), 9)
+    
+    def test_add_game(self):
+        """Test counting a game into every histogram."""
+        histograms = empty_histograms()
+        add_to_histograms(histograms, {
+            'final_score': 0.72,
+            'scores': {'quality': 0.9, 'freshness': 0.1, 'popularity': 0.0}
+        })
+        self.assertEqual(histograms['final_score'][7], 1)
+        self.assertEqual(histograms['quality'][9], 1)
+        self.assertEqual(histograms['freshness'][1], 1)
+        self.assertEqual(histograms['popularity'][0], 1)
+
+
+class TestSvgCharts(unittest.TestCase):
+    """Test SVG rendering."""
+    
+    def test_bar_chart(self):
+        """Test one bar per label and escaped labels."""
+        svg = render_bar_chart_svg(['Puzzle', '<Action>'], [3, 7], title='genres')
+        self.assertTrue(svg.startswith('<svg'))
+        self.assertEqual(svg.count('<rect'), 2)
+        self.assertIn('&lt;Action&gt;', svg)
+    
+    def test_empty_charts(self):
+        """Test rendering without data."""
+        self.assertIn('</svg>', render_bar_chart_svg([], [], title='empty'))
+        self.assertIn('</svg>', render_histogram_svg([0] * 10, 'empty', '#000'))
+
+
+if __name__ == '__main__':
+    unittest.main()
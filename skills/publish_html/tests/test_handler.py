@@ -0,0 +1,130 @@
+"""Tests for publish_html handler."""
+import os
+import re
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from skills.publish_html.handler import (
+    compute_report_stats,
+    generate_html,
+    render_game_card,
+    write_html,
+    write_virtual_html,
+    write_paged_html
+)
+
+
+def make_games(count):
+    return [
+        {
+            'rank': i,
+            'title': f'Game {i}',
+            'developer': 'Studio',
+            'genre': 'Puzzle' if i % 2 else 'Action',
+            'rating': 4.5 if i % 3 else None,
+            'installs': 1000 * i,
+            'release_date': '2025-11-01',
+            'final_score': 0.5,
+            'scores': {'freshness': 0.5, 'quality': 0.5, 'popularity': 0.5}
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+class TestComputeReportStats(unittest.TestCase):
+    """Test compute_report_stats function."""
+    
+    def test_stats_basic(self):
+        """Test totals and genre distribution."""
+        stats = compute_report_stats(make_games(5))
+        self.assertEqual(stats['total_games'], 5)
+        self.assertAlmostEqual(stats['avg_score'], 0.5)
+        self.assertEqual(stats['genre_counts'], {'Puzzle': 3, 'Action': 2})
+        self.assertEqual(stats['top_genres'][0], ('Puzzle', 3))
+    
+    def test_stats_empty(self):
+        """Test empty input."""
+        self.assertEqual(compute_report_stats([])['avg_score'], 0)
+
+
+class TestWriteHtml(unittest.TestCase):
+    """Test streaming report writer."""
+    
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+    
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+    
+    def test_streamed_matches_generated(self):
+        """Streamed file is identical to the in-memory document."""
+        games = make_games(20)
+        path = write_html(games, 'puzzle', 'KR', 'test')
+        with open(path, encoding='utf-8') as f:
+            self.assertEqual(f.read(), generate_html(games, 'puzzle', 'KR'))
+    
+    def test_single_pass_iterator(self):
+        """A generator can be streamed when stats are precomputed."""
+        games = make_games(10)
+        stats = compute_report_stats(games)
+        path = write_html(iter(games), 'puzzle', 'KR', 'test', stats=stats)
+        with open(path, encoding='utf-8') as f:
+            self.assertEqual(f.read().count('class="game-card"'), 10)
+    
+    def test_self_contained(self):
+        """Report makes no external requests and draws charts inline."""
+        html = generate_html(make_games(5), 'puzzle', 'KR')
+        self.assertNotIn('<script src=', html)
+        self.assertNotIn('<link', html)
+        self.assertIn('<svg', html)
+    
+    def test_card_without_rating(self):
+        """Unrated games render instead of failing."""
+        self.assertIn('⭐ 0.0', render_game_card(make_games(3)[2]))
+
+
+
+class TestReportModes(unittest.TestCase):
+    """Test virtual and paged report modes."""
+    
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+    
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+    
+    def test_virtual_embeds_rows_once(self):
+        """Virtual report carries data as JSON instead of DOM cards."""
+        games = make_games(25)
+        games[0]['title'] = '</script><b>'
+        path = write_virtual_html(games, 'puzzle', 'KR', 'test', page_size=10)
+        html = Path(path).read_text(encoding='utf-8')
+        
+        self.assertNotIn('<div class="game-card">', html)
+        blob = re.search(r'id="games-data">(.*?)</script>', html, re.S).group(1)
+        data = json.loads(blob)
+        self.assertEqual(len(data['rows']), 25)
+        self.assertEqual(data['page_size'], 10)
+        self.assertEqual(data['rows'][0][1], '</script><b>')
+    
+    def test_pages_split(self):
+        """Paged report writes one file per page plus a shared stylesheet."""
+        paths = write_paged_html(make_games(25), 'puzzle', 'KR', 'test', page_size=10)
+        self.assertEqual([Path(p).name for p in paths], ['page-1.html', 'page-2.html', 'page-3.html'])
+        self.assertTrue((Path(paths[0]).parent / 'report.css').exists())
+        
+        last = Path(paths[-1]).read_text(encoding='utf-8')
+        self.assertEqual(last.count('class="game-card"'), 5)
+        self.assertIn('href="report.css"', last)
+        self.assertNotIn('<style>', last)
+
+
+if __name__ == '__main__':
+    unittest.main()
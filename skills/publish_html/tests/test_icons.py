@@ -0,0 +1,95 @@
+"""Tests for the icon thumbnail cache."""
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from skills.publish_html.icons import IconCache, data_uri, sized_url
+from skills.publish_html.handler import render_game_card, resolve_icons
+
+PNG = b'\x89PNG\r\n\x1a\n' + b'\x00' * 32
+
+
+class TestIconCache(unittest.TestCase):
+    """Test IconCache class."""
+    
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+    
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+    
+    def make_cache(self, **kwargs):
+        cache = IconCache(Path('cache'), **kwargs)
+        patcher = mock.patch.object(cache, '_download', return_value=PNG)
+        self.download = patcher.start()
+        self.addCleanup(patcher.stop)
+        return cache
+    
+    def test_downloads_once(self):
+        """Icons are fetched once, and identical images share one file."""
+        cache = self.make_cache()
+        paths = cache.fetch_all(['http://a/1', 'http://a/2', 'http://a/1', ''])
+        self.assertEqual(self.download.call_count, 2)
+        self.assertEqual(paths['http://a/1'], paths['http://a/2'])
+        
+        # A new cache instance reads the persisted index
+        again = self.make_cache()
+        again.fetch_all(['http://a/1'])
+        self.assertEqual(self.download.call_count, 0)
+    
+    def test_ttl_expiry(self):
+        """Stale entries are downloaded again."""
+        cache = self.make_cache(ttl_seconds=-1)
+        cache.fetch_all(['http://a/1'])
+        cache.fetch_all(['http://a/1'])
+        self.assertEqual(self.download.call_count, 2)
+    
+    def test_failed_download_skipped(self):
+        """A failing icon is left out instead of failing the report."""
+        cache = self.make_cache()
+        self.download.side_effect = OSError('offline')
+        self.assertEqual(cache.fetch_all(['http://a/1']), {})
+    
+    def test_sized_url(self):
+        """Play CDN URLs request a small rendition."""
+        self.assertEqual(sized_url('https://play-lh.googleusercontent.com/abc=w240', 64),
+                         'https://play-lh.googleusercontent.com/abc=s128')
+        self.assertEqual(sized_url('http://example.com/icon.png', 64), 'http://example.com/icon.png')
+
+
+class TestIconRendering(unittest.TestCase):
+    """Test icons in report cards."""
+    
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+    
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+    
+    def test_modes(self):
+        """lazy links the cached file, inline embeds it, none skips the cache."""
+        games = [{'rank': 1, 'title': 'A', 'icon_url': 'http://a/1'}]
+        cache = IconCache(Path('outputs/cache/icons'))
+        with mock.patch.object(cache, '_download', return_value=PNG):
+            lazy = resolve_icons(games, 'lazy', Path('outputs/20251107/test/reports'), cache)
+            inline = resolve_icons(games, 'inline', Path('.'), cache)
+        
+        self.assertTrue(lazy['http://a/1'].startswith('../../../cache/icons/'))
+        self.assertEqual(inline['http://a/1'], data_uri(cache.cached_path('http://a/1')))
+        self.assertTrue(inline['http://a/1'].startswith('data:image/png;base64,'))
+        self.assertEqual(resolve_icons(games, 'none', Path('.'), cache), {})
+        
+        card = render_game_card(games[0], lazy['http://a/1'])
+        self.assertIn('loading="lazy"', card)
+        self.assertNotIn('<img', render_game_card(games[0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""Tests for rank diff between two runs."""
+import os
+import random
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from skills.publish_html.rank_diff import diff_rankings, diff_summary, move_details
+from skills.publish_html.handler import write_diff_html
+
+
+def make_ranking(names):
+    return [
+        {
+            'rank': i,
+            'package_name': f'com.example.{name}',
+            'title': name,
+            'final_score': 1 - i / 100,
+            'scores': {'quality': 0.5, 'freshness': 0.5, 'popularity': i / 100}
+        }
+        for i, name in enumerate(names, 1)
+    ]
+
+
+class TestDiffRankings(unittest.TestCase):
+    """Test diff_rankings function."""
+    
+    def test_entered_dropped_moved(self):
+        """Games are classified by package_name."""
+        previous = make_ranking(['a', 'b', 'c', 'd'])
+        current = make_ranking(['c', 'a', 'b', 'e'])
+        diff = diff_rankings(current, previous)
+        
+        self.assertEqual([g['title'] for g in diff['entered']], ['e'])
+        self.assertEqual([g['title'] for g in diff['dropped']], ['d'])
+        self.assertEqual(diff_summary(diff), {'entered': 1, 'dropped': 1, 'moved': 3, 'unchanged': 0})
+        
+        # Largest move first; positive delta means moved up
+        top = move_details(diff['moved'][0])
+        self.assertEqual((top['title'], top['previous_rank'], top['rank'], top['rank_delta']), ('c', 3, 1, 2))
+        self.assertAlmostEqual(top['score_delta'], 0.02)
+        self.assertAlmostEqual(top['component_deltas']['popularity'], -0.02)
+    
+    def test_large_rankings(self):
+        """100k-row rankings are joined in linear time (a nested-loop join would take hours)."""
+        names = [str(i) for i in range(100000)]
+        previous = make_ranking(names)
+        random.Random(7).shuffle(names)
+        current = make_ranking(names[:95000] + [f'new{i}' for i in range(5000)])
+        
+        start = time.perf_counter()
+        diff = diff_rankings(current, previous)
+        elapsed = time.perf_counter() - start
+        
+        self.assertEqual(diff_summary(diff)['entered'], 5000)
+        self.assertEqual(diff_summary(diff)['dropped'], 5000)
+        # ~0.6 s unloaded; the bound leaves room for busy CI machines
+        self.assertLess(elapsed, 5.0)
+
+
+class TestWriteDiffHtml(unittest.TestCase):
+    """Test rank diff report."""
+    
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+    
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+    
+    def test_report_tables(self):
+        """Report lists each change type and escapes titles."""
+        previous = make_ranking(['a', 'b', '<x>'])
+        current = make_ranking(['b', 'a', 'c'])
+        path, diff = write_diff_html(current, previous, 'puzzle', 'KR', 'test', 'yesterday', limit=1)
+        html = Path(path).read_text(encoding='utf-8')
+        
+        self.assertEqual(Path(path).name, 'rank_diff.html')
+        self.assertIn('&lt;x&gt;', html)
+        self.assertIn('상위 1개 / 전체 2개', html)
+        self.assertIn('yesterday', html)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""Tests for the embedded search index."""
+import os
+import re
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from skills.publish_html.search_index import build_search_index, json_for_script, tokenize
+from skills.publish_html.handler import write_html
+
+
+class TestBuildSearchIndex(unittest.TestCase):
+    """Test build_search_index function."""
+    
+    def test_tokens_and_postings(self):
+        """Tokens are sorted and point at the games containing them."""
+        games = [
+            {'title': 'Puzzle Quest', 'developer': 'Studio A', 'genre': 'Puzzle', 'final_score': 0.8},
+            {'title': '퍼즐 왕국', 'developer': 'Studio B', 'genre': 'Puzzle', 'final_score': 0.5,
+             'tags': ['match3', 'casual']},
+            {'title': 'Space Run', 'developer': 'Studio A', 'genre': 'Action', 'final_score': 0.3},
+        ]
+        index = build_search_index(games)
+        postings = dict(zip(index['tokens'], index['postings']))
+        
+        self.assertEqual(index['tokens'], sorted(index['tokens']))
+        self.assertEqual(postings['puzzle'], [0, 1])
+        self.assertEqual(postings['studio'], [0, 1, 2])
+        self.assertEqual(postings['퍼즐'], [1])
+        self.assertEqual(postings['match3'], [1])
+        self.assertEqual(index['genres'], ['Action', 'Puzzle'])
+        self.assertEqual(index['genre'], [1, 1, 0])
+        self.assertEqual(index['score'], [0.8, 0.5, 0.3])
+    
+    def test_tokenize(self):
+        """Punctuation and underscores split tokens; case is folded."""
+        self.assertEqual(tokenize('Clash_of-Clans: 2 (KR)'), ['clash', 'of', 'clans', '2', 'kr'])
+
+
+class TestEmbeddedIndex(unittest.TestCase):
+    """Test search index embedded in the report."""
+    
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+    
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+    
+    def test_report_embeds_index(self):
+        """The index is embedded as script-safe JSON next to the search bar."""
+        games = [{'rank': 1, 'title': '</script>', 'genre': 'Puzzle', 'final_score': 0.5, 'scores': {}}]
+        path = write_html(games, 'q', 'KR', 'test', search_index=build_search_index(games))
+        html = Path(path).read_text(encoding='utf-8')
+        
+        self.assertIn('id="search-query"', html)
+        blob = re.search(r'id="search-index">(.*?)</script>', html, re.S).group(1)
+        self.assertEqual(json.loads(blob)['tokens'], ['puzzle', 'script'])
+    
+    def test_json_for_script(self):
+        """Compact, unescaped non-ASCII, and no `</` that could close the element."""
+        value = {'title': '퍼즐 </script><!--', 'n': [1, 2]}
+        text = json_for_script(value)
+        self.assertEqual(text, '{"title":"퍼즐 <\\/script><!--","n":[1,2]}')
+        self.assertNotIn('</', text)
+        self.assertEqual(json.loads(text), value)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""Tests for precompiled report templates."""
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from skills.publish_html.templates import CompiledTemplate, ReportTemplates, load_templates
+from skills.publish_html.handler import (
+    VIRTUAL_CSS,
+    compute_report_stats,
+    iter_virtual_html,
+    render_game_card,
+    render_html_head,
+    write_report_batch
+)
+from skills.publish_html.tests.test_handler import make_games
+
+
+class TestCompiledTemplate(unittest.TestCase):
+    """Test CompiledTemplate class."""
+    
+    def test_placeholders_and_format_specs(self):
+        """Fields are formatted like f-string replacements; literal braces survive."""
+        template = CompiledTemplate("a {b} {{ name }} {{ score:.2f }} '\"\\")
+        
+        self.assertEqual(template.names, ['name', 'score'])
+        self.assertEqual(template.render(name='x', score=0.5), "a {b} x 0.50 '\"\\")
+    
+    def test_missing_field(self):
+        """A field the template needs but the caller omits is an error."""
+        with self.assertRaises(TypeError):
+            CompiledTemplate('{{ name }}').render()
+    
+    def test_prefixed_partial(self):
+        """`{{> partial prefix }}` inlines the partial with prefixed field names."""
+        partials = {'bar': '[{{ value:.1f }}]'}
+        template = CompiledTemplate('{{> bar a }}{{> bar b }}', 'row', partials.__getitem__)
+        
+        self.assertEqual(template.names, ['a_value', 'b_value'])
+        self.assertEqual(template.render(a_value=1, b_value=2), '[1.0][2.0]')
+
+
+class TestReportTemplates(unittest.TestCase):
+    """Test theme loading and batch rendering."""
+    
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+    
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+    
+    def test_theme_overrides_single_file(self):
+        """A theme directory overrides only the files it contains."""
+        theme = Path('theme')
+        theme.mkdir()
+        (theme / 'report.css').write_text('body { color: red; }\n', encoding='utf-8')
+        (theme / 'score_bar.html').write_text('<i>{{ label }}={{ value:.1f }}</i>', encoding='utf-8')
+        templates = ReportTemplates(theme)
+        
+        game = make_games(1)[0]
+        card = render_game_card(game, templates=templates)
+        self.assertIn('<i>품질=0.5</i>', card)
+        self.assertIn('Game 1', card)
+        head = render_html_head('q', 'KR', compute_report_stats([game]), templates=templates)
+        self.assertIn('body { color: red; }', head)
+    
+    def test_virtual_css_with_custom_head(self):
+        """Virtual mode adds its CSS to the report stylesheet whatever the theme's head looks like."""
+        theme = Path('theme')
+        theme.mkdir()
+        (theme / 'report.css').write_text('body { color: red; }\n', encoding='utf-8')
+        (theme / 'head.html').write_text(
+            '<head>\n<style>\n    .banner { color: blue; }\n    </style>\n{{ styles }}</head>\n<h1>{{ query }}</h1>\n',
+            encoding='utf-8'
+        )
+        templates = ReportTemplates(theme)
+        games = make_games(3)
+        
+        head = next(iter_virtual_html(games, 'q', 'KR', 10, templates=templates))
+        self.assertIn(f'<style>\nbody {{ color: red; }}\n{VIRTUAL_CSS}    </style>\n</head>', head)
+        self.assertEqual(head.count(VIRTUAL_CSS), 1)
+        
+        linked = next(iter_virtual_html(games, 'q', 'KR', 10, stylesheet_href='report.css', templates=templates))
+        self.assertIn('<link rel="stylesheet" href="report.css">', linked)
+        self.assertNotIn(VIRTUAL_CSS, linked)
+    
+    def test_load_templates_is_cached(self):
+        """Templates compile once per process."""
+        self.assertIs(load_templates(), load_templates())
+    
+    def test_write_report_batch(self):
+        """Each query/country gets its own report from the shared templates."""
+        games = make_games(3)
+        paths = write_report_batch([
+            {'games': games, 'query': query, 'country': country, 'run_id': f'{query}_{country}'}
+            for query in ('rpg', 'puzzle') for country in ('KR', 'US')
+        ])
+        
+        self.assertEqual(len(paths), 4)
+        html = Path(paths[3]).read_text(encoding='utf-8')
+        self.assertIn('게임 랭킹 리포트 - puzzle (US)', html)
+        self.assertEqual(html.count('class="game-card"'), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,6 +13,13 @@ from pathlib import Path
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
 
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules.profiling import run_profiled
+from modules.skill_result import emit_result
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -221,10 +228,11 @@ def main():
     result = {
         "ranked_items_path": output_path,
         "total_items": len(top_games),
+        "input_items": len(games),
         "run_id": run_id
     }
-    print(json.dumps(result))
+    emit_result(result)
 
 
 if __name__ == "__main__":
-    main()
+    run_profiled('ranker', main)